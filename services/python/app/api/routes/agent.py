@@ -1,8 +1,7 @@
-from typing import Any, Dict, List, Optional
-
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+
+from app.api.routes.chatbot import ChatQuery
 
 # Import placeholder for services that would need to be adapted
 from app.modules.agents.research.chat_state import build_initial_state
@@ -11,24 +10,15 @@ from app.modules.agents.research.graph import create_qna_graph
 router = APIRouter()
 
 
-
-class ChatQuery(BaseModel):
-    query: str
-    limit: Optional[int] = 50
-    previousConversations: List[Dict] = []
-    useDecomposition: bool = True
-    filters: Optional[Dict[str, Any]] = None
-    retrieval_mode: Optional[str] = "HYBRID"
-
 async def get_services(request: Request):
     """Get all required services from the container"""
     container = request.app.container
 
     # Get services
-    retrieval_service = await container.retrieval_service()
-    arango_service = await container.arango_service()
+    retrieval_service = request.app.state.retrieval_service
+    arango_service = request.app.state.arango_service
     reranker_service = container.reranker_service()
-    config_service = container.config_service()
+    config_service = request.app.state.config_service
     logger = container.logger()
 
     # Get and verify LLM
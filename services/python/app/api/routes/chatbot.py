@@ -1,9 +1,10 @@
 import asyncio
+import json
 from typing import Any, Dict, List, Optional
 
 from dependency_injector.wiring import inject
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from jinja2 import Template
 from pydantic import BaseModel
 
@@ -17,12 +18,23 @@ from app.modules.reranker.reranker import RerankerService
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.modules.retrieval.retrieval_service import RetrievalService
 from app.setups.query_setup import AppContainer
-from app.utils.citations import process_citations
+from app.utils.citations import process_citations, process_citations_bytes
 from app.utils.query_decompose import QueryDecompositionService
 from app.utils.query_transform import setup_query_transformation
 
 router = APIRouter()
 
+# qna_prompt is a static string, so compile it once rather than per request
+qna_template = Template(qna_prompt)
+
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a enterprise questions answering expert",
+}
+
+# Maps stored conversation roles to LLM message roles
+CONVERSATION_ROLES = {"user_query": "user", "bot_response": "assistant"}
+
 
 # Pydantic models
 class ChatQuery(BaseModel):
@@ -35,23 +47,16 @@ class ChatQuery(BaseModel):
 
 
 async def get_retrieval_service(request: Request) -> RetrievalService:
-    # Retrieve the container from the app (set in your lifespan)
-    container: AppContainer = request.app.container
-    # Await the async resource provider to get the actual service instance
-    retrieval_service = await container.retrieval_service()
-    return retrieval_service
+    # Resolved once in the app lifespan; see app.query_main
+    return request.app.state.retrieval_service
 
 
 async def get_arango_service(request: Request) -> ArangoService:
-    container: AppContainer = request.app.container
-    arango_service = await container.arango_service()
-    return arango_service
+    return request.app.state.arango_service
 
 
 async def get_config_service(request: Request) -> ConfigurationService:
-    container: AppContainer = request.app.container
-    config_service = container.config_service()
-    return config_service
+    return request.app.state.config_service
 
 
 async def get_reranker_service(request: Request) -> RerankerService:
@@ -60,30 +65,49 @@ async def get_reranker_service(request: Request) -> RerankerService:
     return reranker_service
 
 
-@router.post("/chat")
-@inject
-async def askAI(
+async def prepare_chat_messages(
     request: Request,
     query_info: ChatQuery,
-    retrieval_service: RetrievalService = Depends(get_retrieval_service),
-    arango_service: ArangoService = Depends(get_arango_service),
-    reranker_service: RerankerService = Depends(get_reranker_service),
+    retrieval_service: RetrievalService,
+    arango_service: ArangoService,
+    reranker_service: RerankerService,
+    logger,
 ):
-    """Perform semantic search across documents"""
-    try:
-        container = request.app.container
-
-        logger = container.logger()
-        llm = retrieval_service.llm
+    """
+    Run decomposition, retrieval and reranking for a chat query and build the
+    LLM message list.
+
+    Returns:
+        (llm, messages, final_results), or a JSONResponse when retrieval failed
+    """
+    llm = retrieval_service.llm
+    if llm is None:
+        llm = await retrieval_service.get_llm_instance()
         if llm is None:
-            llm = await retrieval_service.get_llm_instance()
-            if llm is None:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to initialize LLM service. LLM configuration is missing.",
-                )
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to initialize LLM service. LLM configuration is missing.",
+            )
 
-        logger.debug(f"useDecomposition {query_info.useDecomposition}")
+    org_id = request.state.user.get('orgId')
+    user_id = request.state.user.get('userId')
+    send_user_info = request.query_params.get('sendUserInfo', True)
+
+    # Fetch user/org details while the LLM decomposes and rewrites the query.
+    # Exceptions are collected rather than raised, so a failed lookup never
+    # leaves the other's error unretrieved, even when the request ends early
+    user_info_task = (
+        asyncio.gather(
+            arango_service.get_user_by_user_id(user_id),
+            arango_service.get_document(org_id, CollectionNames.ORGS.value),
+            return_exceptions=True,
+        )
+        if send_user_info
+        else None
+    )
+
+    try:
+        logger.debug("useDecomposition %s", query_info.useDecomposition)
         if query_info.useDecomposition:
             decomposition_service = QueryDecompositionService(llm, logger=logger)
             decomposition_result = await decomposition_service.decompose_query(
@@ -91,7 +115,7 @@ async def askAI(
             )
             decomposed_queries = decomposition_result["queries"]
 
-            logger.debug(f"decomposed_queries {decomposed_queries}")
+            logger.debug("decomposed_queries %s", decomposed_queries)
             if not decomposed_queries:
                 all_queries = [{"query": query_info.query}]
             else:
@@ -100,30 +124,30 @@ async def askAI(
         else:
             all_queries = [{"query": query_info.query}]
 
-        async def process_decomposed_query(query: str, org_id: str, user_id: str):
-            rewrite_chain, expansion_chain = setup_query_transformation(llm)
+        rewrite_chain, expansion_chain = setup_query_transformation(llm)
+        seen_queries = set()
 
+        async def process_decomposed_query(query: str, org_id: str, user_id: str):
             # Run query transformations in parallel
             rewritten_query, expanded_queries = await asyncio.gather(
                 rewrite_chain.ainvoke(query), expansion_chain.ainvoke(query)
             )
 
-            logger.debug(f"Rewritten query: {rewritten_query}")
-            logger.debug(f"Expanded queries: {expanded_queries}")
-
-            expanded_queries_list = [
-                q.strip() for q in expanded_queries.split("\n") if q.strip()
-            ]
+            logger.debug("Rewritten query: %s", rewritten_query)
+            logger.debug("Expanded queries: %s", expanded_queries)
 
-            queries = [rewritten_query.strip()] if rewritten_query.strip() else []
-            queries.extend([q for q in expanded_queries_list if q not in queries])
-            seen = set()
+            # Dedup against queries already claimed by other subqueries
             unique_queries = []
-            for q in queries:
-                if q.lower() not in seen:
-                    seen.add(q.lower())
+            for q in (rewritten_query, *expanded_queries.split("\n")):
+                q = q.strip()
+                key = q.lower()
+                if q and key not in seen_queries:
+                    seen_queries.add(key)
                     unique_queries.append(q)
 
+            if not unique_queries:
+                return {"searchResults": [], "status_code": 200}
+
             results = await retrieval_service.search_with_filters(
                 queries=unique_queries,
                 org_id=org_id,
@@ -133,18 +157,11 @@ async def askAI(
                 arango_service=arango_service,
             )
             logger.info("Results from the AI service received")
-            # Format conversation history
-            logger.debug(f"formatted_results: {results}")
-            # Get raw search results
-            # search_results = results.get("searchResults", [])
+            logger.debug("formatted_results: %s", results)
 
             return results
 
         # Execute all query processing in parallel
-        org_id = request.state.user.get('orgId')
-        user_id = request.state.user.get('userId')
-        send_user_info = request.query_params.get('sendUserInfo', True)
-
         tasks = [
             process_decomposed_query(query_dict.get("query"), org_id, user_id)
             for query_dict in all_queries
@@ -159,6 +176,8 @@ async def askAI(
             status_code = result_set.get("status_code", 500)
 
             if status_code in [202, 500, 503]:
+                if user_info_task:
+                    user_info_task.cancel()
                 return JSONResponse(
                     status_code=status_code,
                     content={
@@ -171,11 +190,6 @@ async def askAI(
 
             search_result_set = result_set.get("searchResults", [])
             for result in search_result_set:
-                logger.debug("==================")
-                logger.debug("==================")
-                logger.debug(f"result: {result}")
-                logger.debug("==================")
-                logger.debug("==================")
                 result_id = result["metadata"].get("_id")
                 if result_id not in seen_ids:
                     seen_ids.add(result_id)
@@ -191,69 +205,91 @@ async def askAI(
             )
         else:
             final_results = flattened_results
-
-        logger.debug(f"final_results: {final_results}")
-        # Prepare the template with the final results
-        if send_user_info:
-            user_info = await arango_service.get_user_by_user_id(user_id)
-            org_info = await arango_service.get_document(
-                org_id, CollectionNames.ORGS.value
+    except BaseException:
+        if user_info_task:
+            user_info_task.cancel()
+        raise
+
+    logger.debug("final_results: %s", final_results)
+    # Prepare the template with the final results
+    if user_info_task:
+        user_info, org_info = await user_info_task
+        for lookup in (user_info, org_info):
+            if isinstance(lookup, BaseException):
+                raise lookup
+        if (
+            org_info.get("accountType") == AccountType.ENTERPRISE.value
+            or org_info.get("accountType") == AccountType.BUSINESS.value
+        ):
+            user_data = (
+                "I am the user of the organization. "
+                f"My name is {user_info.get('fullName', 'a user')} "
+                f"({user_info.get('designation', '')}) "
+                f"from {org_info.get('name', 'the organization')}. "
+                "Please provide accurate and relevant information based on the available context."
             )
-            if (
-                org_info.get("accountType") == AccountType.ENTERPRISE.value
-                or org_info.get("accountType") == AccountType.BUSINESS.value
-            ):
-                user_data = (
-                    "I am the user of the organization. "
-                    f"My name is {user_info.get('fullName', 'a user')} "
-                    f"({user_info.get('designation', '')}) "
-                    f"from {org_info.get('name', 'the organization')}. "
-                    "Please provide accurate and relevant information based on the available context."
-                )
-            else:
-                user_data = (
-                    "I am the user. "
-                    f"My name is {user_info.get('fullName', 'a user')} "
-                    f"({user_info.get('designation', '')}) "
-                    "Please provide accurate and relevant information based on the available context."
-                )
         else:
-            user_data = ""
-
-        template = Template(qna_prompt)
-        rendered_form = template.render(
-            user_data=user_data,
-            query=query_info.query,
-            rephrased_queries=[],  # This keeps all query results for reference
-            chunks=final_results,
-        )
+            user_data = (
+                "I am the user. "
+                f"My name is {user_info.get('fullName', 'a user')} "
+                f"({user_info.get('designation', '')}) "
+                "Please provide accurate and relevant information based on the available context."
+            )
+    else:
+        user_data = ""
+
+    rendered_form = qna_template.render(
+        user_data=user_data,
+        query=query_info.query,
+        rephrased_queries=[],  # This keeps all query results for reference
+        chunks=final_results,
+    )
+
+    messages = [
+        SYSTEM_MESSAGE,
+        # Add conversation history
+        *(
+            {"role": CONVERSATION_ROLES[conversation["role"]], "content": conversation.get("content")}
+            for conversation in query_info.previousConversations
+            if conversation.get("role") in CONVERSATION_ROLES
+        ),
+        # Add current query with context
+        {"role": "user", "content": rendered_form},
+    ]
+    logger.debug("Messages to LLM %s", messages)
+    return llm, messages, final_results
 
-        messages = [
-            {
-                "role": "system",
-                "content": "You are a enterprise questions answering expert",
-            }
-        ]
 
-        # Add conversation history
-        for conversation in query_info.previousConversations:
-            if conversation.get("role") == "user_query":
-                messages.append(
-                    {"role": "user", "content": conversation.get("content")}
-                )
-            elif conversation.get("role") == "bot_response":
-                messages.append(
-                    {"role": "assistant", "content": conversation.get("content")}
-                )
+@router.post("/chat")
+@inject
+async def askAI(
+    request: Request,
+    query_info: ChatQuery,
+    retrieval_service: RetrievalService = Depends(get_retrieval_service),
+    arango_service: ArangoService = Depends(get_arango_service),
+    reranker_service: RerankerService = Depends(get_reranker_service),
+):
+    """Perform semantic search across documents"""
+    try:
+        container = request.app.container
+
+        logger = container.logger()
+        prepared = await prepare_chat_messages(
+            request, query_info, retrieval_service, arango_service, reranker_service, logger
+        )
+        if isinstance(prepared, JSONResponse):
+            return prepared
+        llm, messages, final_results = prepared
 
-        # Add current query with context
-        messages.append({"role": "user", "content": rendered_form})
-        logger.debug(f"Messages to LLM {messages}")
         # Make async LLM call
         response = await llm.ainvoke(messages)
-        logger.debug(f"llm response: {response}")
-        # Process citations and return response
-        return process_citations(response, final_results)
+        logger.debug("llm response: %s", response)
+        # Process citations off the event loop; the JSON repair is CPU-bound.
+        # The result is serialized there too, skipping FastAPI's encoder
+        content = await asyncio.to_thread(
+            process_citations_bytes, response, final_results
+        )
+        return Response(content=content, media_type="application/json")
 
     except HTTPException as he:
         # Re-raise HTTP exceptions with their original status codes
@@ -261,3 +297,60 @@ async def askAI(
     except Exception as e:
         logger.error(f"Error in askAI: {str(e)}", exc_info=True)
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/chat/stream")
+@inject
+async def askAIStream(
+    request: Request,
+    query_info: ChatQuery,
+    retrieval_service: RetrievalService = Depends(get_retrieval_service),
+    arango_service: ArangoService = Depends(get_arango_service),
+    reranker_service: RerankerService = Depends(get_reranker_service),
+):
+    """
+    Same as /chat, but streams the LLM output as server-sent events.
+
+    Each generated chunk is sent as a "token" event; once generation finishes
+    a single "complete" event carries the citation-processed response.
+    """
+    try:
+        container = request.app.container
+
+        logger = container.logger()
+        prepared = await prepare_chat_messages(
+            request, query_info, retrieval_service, arango_service, reranker_service, logger
+        )
+        if isinstance(prepared, JSONResponse):
+            return prepared
+        llm, messages, final_results = prepared
+
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error(f"Error in askAIStream: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def generate():
+        chunks = []
+        try:
+            async for chunk in llm.astream(messages):
+                content = getattr(chunk, "content", chunk)
+                if not content:
+                    continue
+                chunks.append(content)
+                yield _sse_event("token", {"content": content})
+
+            response = "".join(chunks)
+            logger.debug("llm response: %s", response)
+            result = await asyncio.to_thread(process_citations, response, final_results)
+            yield _sse_event("complete", result)
+        except Exception as e:
+            logger.error(f"Error streaming askAI response: {str(e)}", exc_info=True)
+            yield _sse_event("error", {"error": str(e)})
+
+    return StreamingResponse(generate(), media_type="text/event-stream")
+
+
+def _sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -5,6 +5,9 @@ from fastapi import APIRouter, Body, HTTPException, Request
 from fastapi.responses import JSONResponse
 from qdrant_client.http import models
 
+from app.config.utils.named_constants.arangodb_constants import (
+    QDRANT_KEYWORD_INDEX_FIELDS,
+)
 from app.utils.llm import get_llm
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
@@ -136,6 +139,12 @@ async def recreate_collection(retrieval_service, embedding_size, logger) -> None
                 )
             },
         )
+        for field_name in QDRANT_KEYWORD_INDEX_FIELDS:
+            retrieval_service.qdrant_client.create_payload_index(
+                collection_name=retrieval_service.collection_name,
+                field_name=field_name,
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
         logger.info(f"Successfully created new collection {retrieval_service.collection_name} with vector size {embedding_size}")
     except Exception as e:
         logger.error(f"Failed to recreate collection: {str(e)}", exc_info=True)
@@ -4,15 +4,12 @@ from dependency_injector.wiring import inject
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.modules.retrieval.retrieval_arango import ArangoService
-from app.setups.query_setup import AppContainer
 
 router = APIRouter()
 
 
 async def get_arango_service(request: Request) -> ArangoService:
-    container: AppContainer = request.app.container
-    arango_service = await container.arango_service()
-    return arango_service
+    return request.app.state.arango_service
 
 
 @router.get("/records/{record_id}")
@@ -9,7 +9,6 @@ from pydantic import BaseModel
 from app.config.configuration_service import ConfigurationService
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.modules.retrieval.retrieval_service import RetrievalService
-from app.setups.query_setup import AppContainer
 from app.utils.query_transform import setup_query_transformation
 
 router = APIRouter()
@@ -35,21 +34,16 @@ class SearchRequest(BaseModel):
 
 
 async def get_retrieval_service(request: Request) -> RetrievalService:
-    container: AppContainer = request.app.container
-    retrieval_service = await container.retrieval_service()
-    return retrieval_service
+    # Resolved once in the app lifespan; see app.query_main
+    return request.app.state.retrieval_service
 
 
 async def get_arango_service(request: Request) -> ArangoService:
-    container: AppContainer = request.app.container
-    arango_service = await container.arango_service()
-    return arango_service
+    return request.app.state.arango_service
 
 
 async def get_config_service(request: Request) -> ConfigurationService:
-    container: AppContainer = request.app.container
-    config_service = container.config_service()
-    return config_service
+    return request.app.state.config_service
 
 
 @router.post("/search")
@@ -81,15 +75,17 @@ async def search(
             rewrite_chain.ainvoke(body.query), expansion_chain.ainvoke(body.query)
         )
 
-        logger.debug(f"Rewritten query: {rewritten_query}")
-        logger.debug(f"Expanded queries: {expanded_queries}")
+        logger.debug("Rewritten query: %s", rewritten_query)
+        logger.debug("Expanded queries: %s", expanded_queries)
 
-        expanded_queries_list = [
-            q.strip() for q in expanded_queries.split("\n") if q.strip()
-        ]
-
-        queries = [rewritten_query.strip()] if rewritten_query.strip() else []
-        queries.extend([q for q in expanded_queries_list if q not in queries])
+        queries = []
+        seen = set()
+        for q in (rewritten_query, *expanded_queries.split("\n")):
+            q = q.strip()
+            key = q.lower()
+            if q and key not in seen:
+                seen.add(key)
+                queries.append(q)
 
         results = await retrieval_service.search_with_filters(
             queries=queries,
@@ -100,8 +96,8 @@ async def search(
             arango_service=arango_service,
         )
         custom_status_code = results.get("status_code", 500)
-        logger.info(f"Custom status code: {custom_status_code}")
-        logger.info(f"Results: {results}")
+        logger.info("Custom status code: %s", custom_status_code)
+        logger.debug("Results: %s", results)
 
         return JSONResponse(status_code=custom_status_code, content=results)
 
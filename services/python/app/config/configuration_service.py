@@ -1,11 +1,12 @@
 # src/config/configuration_service.py
+import asyncio
 import hashlib
 import json
 import os
 import threading
 import time
 from enum import Enum
-from typing import Any
+from typing import Any, Dict
 
 import dotenv
 from cachetools import LRUCache
@@ -20,6 +21,9 @@ from app.config.providers.etcd3_store import Etcd3DistributedKeyValueStore
 
 dotenv.load_dotenv()
 
+# Marks a key that could not be loaded, as opposed to a stored null
+_MISSING = object()
+
 
 class config_node_constants(Enum):
     """Constants for ETCD configuration paths"""
@@ -136,6 +140,8 @@ class ConfigurationService:
         # Initialize LRU cache
         self.cache = LRUCache(maxsize=1000)
         self.logger.debug("📦 Initialized LRU cache with max size 1000")
+        # In-flight etcd reads per key, shared by concurrent cache misses
+        self._pending_loads: Dict[str, asyncio.Task] = {}
 
         self.logger.debug("🔧 Creating ETCD store...")
         self.store = self._create_store()
@@ -333,13 +339,32 @@ class ConfigurationService:
 
     async def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value with LRU cache"""
-        try:
-            # Check cache first
-            if key in self.cache:
-                self.logger.debug("📦 Cache hit for key: %s", key)
-                return self.cache[key]
+        # Check cache first
+        if key in self.cache:
+            self.logger.debug("📦 Cache hit for key: %s", key)
+            return self.cache[key]
+
+        # If not in cache, get from etcd; concurrent misses for the same key on
+        # this loop wait for one read instead of each going to etcd
+        task = self._pending_loads.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._load_config(key))
+            self._pending_loads[key] = task
+            task.add_done_callback(
+                lambda done: self._forget_pending_load(key, done)
+            )
+        # Shielded so a cancelled caller does not cancel the read for the others
+        result = await asyncio.shield(task)
+        return default if result is _MISSING else result
 
-            # If not in cache, get from etcd
+    def _forget_pending_load(self, key: str, task: asyncio.Future) -> None:
+        """Drop a finished read, unless a newer one has replaced it"""
+        if self._pending_loads.get(key) is task:
+            del self._pending_loads[key]
+
+    async def _load_config(self, key: str) -> Any:
+        """Read, decrypt and cache one key from etcd, or return _MISSING"""
+        try:
             encrypted_value = await self.store.get_key(key)
 
             if encrypted_value is not None:
@@ -369,12 +394,12 @@ class ConfigurationService:
                     self.logger.error(
                         f"❌ Failed to process value for key {key}: {str(e)}"
                     )
-                    return default
+                    return _MISSING
             else:
                 self.logger.debug(f"⚠️ No value found in ETCD for key: {key}")
-                return default
+                return _MISSING
 
         except Exception as e:
             self.logger.error("❌ Failed to get config %s: %s", key, str(e))
             self.logger.exception("Detailed error:")
-            return default
+            return _MISSING
@@ -1,8 +1,26 @@
-import logging
+import base64
 import os
+import threading
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+# Prefix of the compact wire format "v2:iv.ciphertext.authTag", where each part
+# is unpadded url-safe base64. Unprefixed values use the hex "iv:ciphertext:authTag"
+# format shared with the Node.js service.
+COMPACT_FORMAT_PREFIX = "v2:"
+
+# AES-GCM nonce and tag sizes used by both this service and the Node.js one
+IV_LENGTH = 12
+AUTH_TAG_LENGTH = 16
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
 
 # Custom error classes matching the Node.js implementation
 class EncryptionError(Exception):
@@ -22,39 +40,71 @@ class InvalidKeyFormatError(Exception):
 
 class EncryptionService:
     _instance = None
+    _instance_lock = threading.Lock()
 
     def __init__(self, algorithm: str, secret_key: str, logger):
         # In this example, algorithm should be "aes-256-gcm"
         self.algorithm = algorithm
         self.secret_key = secret_key  # this is a hex string
         self.logger = logger
+        # Parse the key and build the cipher once; AESGCM is safe to share
+        # across threads
+        try:
+            self._aesgcm = AESGCM(bytes.fromhex(secret_key))
+        except ValueError as e:
+            raise InvalidKeyFormatError(f"Invalid secret key: {str(e)}")
+
     @classmethod
     def get_instance(cls, algorithm: str, secret_key: str, logger):
         if cls._instance is None:
-            cls._instance = EncryptionService(algorithm, secret_key, logger)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = EncryptionService(algorithm, secret_key, logger)
         return cls._instance
 
-    def encrypt(self, text: str) -> str:
+    def encrypt(self, text: str, compact: bool = False) -> str:
+        """
+        Encrypt text with AES-256-GCM.
+
+        The default hex format is what the Node.js service reads; pass
+        compact=True for the smaller base64 format when the value is only read
+        back by Python.
+        """
         try:
             # Recommended IV length for GCM is 12 bytes
-            iv = os.urandom(12)
-            key = bytes.fromhex(self.secret_key)
-            aesgcm = AESGCM(key)
+            iv = os.urandom(IV_LENGTH)
             # Encrypt returns ciphertext with the tag appended (last 16 bytes)
-            encrypted = aesgcm.encrypt(iv, text.encode("utf-8"), None)
-            # Split ciphertext and auth tag
-            ciphertext = encrypted[:-16]
-            auth_tag = encrypted[-16:]
+            encrypted = self._aesgcm.encrypt(iv, text.encode("utf-8"), None)
+            # Split ciphertext and auth tag without copying the ciphertext
+            encrypted_view = memoryview(encrypted)
+            ciphertext = encrypted_view[:-AUTH_TAG_LENGTH]
+            auth_tag = encrypted_view[-AUTH_TAG_LENGTH:]
+            if compact:
+                return (
+                    f"{COMPACT_FORMAT_PREFIX}{_b64encode(iv)}."
+                    f"{_b64encode(ciphertext)}.{_b64encode(auth_tag)}"
+                )
             # Return the encrypted string as "iv:ciphertext:authTag"
             return f"{iv.hex()}:{ciphertext.hex()}:{auth_tag.hex()}"
         except Exception as e:
             self.logger.error("Encryption failed", exc_info=True)
             raise EncryptionError("Encryption failed", str(e))
 
-    def decrypt(self, encrypted_text: str) -> str:
-        if encrypted_text is None:
-            raise DecryptionError("Decryption failed, encrypted text is None")
-        try:
+    def _decrypt_value(self, encrypted_text: str) -> str:
+        if encrypted_text.startswith(COMPACT_FORMAT_PREFIX):
+            parts = encrypted_text[len(COMPACT_FORMAT_PREFIX):].split(".")
+            if len(parts) != 3:
+                raise InvalidKeyFormatError(
+                    "Invalid encrypted text format; expected format v2:iv.ciphertext.authTag"
+                )
+            iv, ciphertext, auth_tag = (_b64decode(part) for part in parts)
+            if len(iv) != IV_LENGTH or len(auth_tag) != AUTH_TAG_LENGTH:
+                raise InvalidKeyFormatError(
+                    "Invalid encrypted text format; unexpected iv or authTag length"
+                )
+            # Recombine ciphertext and auth tag as expected by AESGCM.decrypt
+            combined = ciphertext + auth_tag
+        else:
             # For AES-256-GCM, expect format "iv:ciphertext:authTag"
             parts = encrypted_text.split(":")
             if len(parts) != 3:
@@ -62,40 +112,30 @@ class EncryptionService:
                     "Invalid encrypted text format; expected format iv:ciphertext:authTag"
                 )
             iv_hex, ciphertext_hex, auth_tag_hex = parts
+            # Reject malformed input before doing any decoding work
+            if (
+                len(iv_hex) != IV_LENGTH * 2
+                or len(auth_tag_hex) != AUTH_TAG_LENGTH * 2
+                or len(ciphertext_hex) % 2
+            ):
+                raise InvalidKeyFormatError(
+                    "Invalid encrypted text format; unexpected iv, ciphertext or authTag length"
+                )
             iv = bytes.fromhex(iv_hex)
-            ciphertext = bytes.fromhex(ciphertext_hex)
-            auth_tag = bytes.fromhex(auth_tag_hex)
-            key = bytes.fromhex(self.secret_key)
-            # Recombine ciphertext and auth tag as expected by AESGCM.decrypt
-            combined = ciphertext + auth_tag
-            aesgcm = AESGCM(key)
-            decrypted = aesgcm.decrypt(iv, combined, None)
-            return decrypted.decode("utf-8")
+            # Decode ciphertext and auth tag in one pass, already in the layout
+            # AESGCM.decrypt expects
+            combined = bytes.fromhex(ciphertext_hex + auth_tag_hex)
+        decrypted = self._aesgcm.decrypt(iv, combined, None)
+        return decrypted.decode("utf-8")
+
+    def decrypt(self, encrypted_text: str) -> str:
+        if encrypted_text is None:
+            raise DecryptionError("Decryption failed, encrypted text is None")
+        try:
+            return self._decrypt_value(encrypted_text)
         except Exception as e:
             self.logger.error("Decryption failed", exc_info=True)
             raise DecryptionError(
                 "Decryption failed, could be due to different encryption algorithm or secret key",
                 str(e),
             )
-
-
-# Example usage:
-if __name__ == "__main__":
-    # Replace these with your actual values.
-    logger = logging.getLogger("Encryption Service")
-    logger.setLevel(logging.DEBUG)
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
-    secret_key = ""
-    service = EncryptionService.get_instance("aes-256-gcm", secret_key, logger)
-
-    # Decrypt the message back
-    try:
-        encrypted = ""
-        decrypted = service.decrypt(encrypted)
-        print("Decrypted:", decrypted)
-    except Exception as error:
-        print(error)
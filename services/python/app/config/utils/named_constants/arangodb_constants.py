@@ -126,6 +126,11 @@ class QdrantCollectionNames(Enum):
     RECORDS = "records"
 
 
+# Payload fields retrieval filters on; indexed as keywords so MatchValue and
+# MatchAny conditions use Qdrant's inverted index
+QDRANT_KEYWORD_INDEX_FIELDS = ("metadata.orgId", "metadata.virtualRecordId")
+
+
 class ExtensionTypes(Enum):
     PDF = "pdf"
     DOCX = "docx"
@@ -74,6 +74,16 @@ EDGE_COLLECTIONS = [
     (CollectionNames.PERMISSIONS_TO_KNOWLEDGE_BASE.value, permissions_schema),
 ]
 
+# Edge collections holding at most one edge per (_from, _to) pair; the unique
+# index lets writers insert and ignore conflicts instead of probing first
+UNIQUE_EDGE_COLLECTIONS = [
+    CollectionNames.BELONGS_TO_DEPARTMENT.value,
+    CollectionNames.BELONGS_TO_CATEGORY.value,
+    CollectionNames.BELONGS_TO_LANGUAGE.value,
+    CollectionNames.BELONGS_TO_TOPIC.value,
+    CollectionNames.INTER_CATEGORY_RELATIONS.value,
+]
+
 class BaseArangoService:
     """Base ArangoDB service class for interacting with the database"""
 
@@ -165,6 +175,22 @@ class BaseArangoService:
                                 f"Failed to update schema for {collection_name}: {str(e)}"
                             )
 
+                for collection_name in UNIQUE_EDGE_COLLECTIONS:
+                    try:
+                        self._collections[collection_name].add_index(
+                            {
+                                "type": "persistent",
+                                "fields": ["_from", "_to"],
+                                "unique": True,
+                            }
+                        )
+                    except Exception as e:
+                        # Usually existing duplicate edges; inserts into this
+                        # collection fall back to probing for the pair first
+                        self.logger.warning(
+                            f"Failed to add unique edge index for {collection_name}: {str(e)}"
+                        )
+
                 # Create the permissions graph if it doesn't exist
                 if not self.db.has_graph(CollectionNames.FILE_ACCESS_GRAPH.value):
                     self.logger.info("🚀 Creating file access graph...")
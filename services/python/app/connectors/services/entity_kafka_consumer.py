@@ -23,7 +23,7 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 class EntityKafkaRouteConsumer:
     def __init__(
-        self, logger, config_service, arango_service, routes=[], app_container=None
+        self, logger, config_service, arango_service, app_container=None
     ) -> None:
         self.logger = logger
         self.producer = None
@@ -31,7 +31,6 @@ class EntityKafkaRouteConsumer:
         self.running = False
         self.config_service = config_service
         self.arango_service = arango_service
-        self.routes = routes
         self.processed_messages: Dict[str, List[int]] = {}
         self.app_container = app_container  # Store the app container reference
         self.route_mapping = {
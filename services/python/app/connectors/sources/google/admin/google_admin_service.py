@@ -1,8 +1,15 @@
-from typing import Dict, List, Optional
+import asyncio
+import base64
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Type
 from uuid import uuid4
 
+from cachetools import TTLCache
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
 
 from app.config.configuration_service import (
@@ -22,9 +29,14 @@ from app.connectors.sources.google.common.connector_google_exceptions import (
     AdminQuotaError,
     AdminServiceError,
     BatchOperationError,
+    GoogleConnectorError,
     GoogleMailError,
     UserOperationError,
 )
+from app.connectors.sources.google.common.discovery import (
+    authorized_http,
+    build_service,
+)
 from app.connectors.sources.google.common.scopes import (
     GOOGLE_CONNECTOR_ENTERPRISE_SCOPES,
     GOOGLE_PARSER_SCOPES,
@@ -36,8 +48,52 @@ from app.connectors.sources.google.google_drive.drive_user_service import (
 from app.connectors.utils.decorators import exponential_backoff
 from app.connectors.utils.rate_limiter import GoogleAPIRateLimiter
 from app.modules.parsers.google_files.parser_user_service import ParserUserService
+from app.utils.batcher import MicroBatcher
 from app.utils.time_conversion import get_epoch_timestamp_in_ms, parse_timestamp
 
+# Google caps batch requests at 1000 calls but recommends keeping them small;
+# 50 keeps a batch well under the per-second quota of the shared limiter.
+ADMIN_BATCH_SIZE = 50
+# Batches and follow-up page listings in flight at once when listing members
+GROUP_MEMBERS_CONCURRENCY = 16
+# Reuse built admin services for a bit less than the one-hour token lifetime
+ADMIN_CONNECTION_TTL_SECONDS = 3300
+# Delegated user credentials are reused for the same window as connections
+DELEGATED_CREDENTIALS_CACHE_SIZE = 10_000
+# Webhook events arrive in bursts for the same users and groups
+ENTITY_KEY_CACHE_SIZE = 10_000
+ENTITY_KEY_CACHE_TTL_SECONDS = 60
+# Node upserts from concurrent events are coalesced into one AQL call
+UPSERT_BATCH_SIZE = 500
+UPSERT_BATCH_WINDOW_SECONDS = 0.05
+
+# Collection names resolved once instead of on every event
+_USERS = CollectionNames.USERS.value
+_GROUPS = CollectionNames.GROUPS.value
+_ORGS = CollectionNames.ORGS.value
+_BELONGS_TO = CollectionNames.BELONGS_TO.value
+
+
+def _new_key() -> str:
+    """Random 128-bit ArangoDB key as 22 url-safe base64 chars (vs 36 for a UUID)"""
+    return base64.urlsafe_b64encode(os.urandom(16)).rstrip(b"=").decode("ascii")
+
+
+def _wrap_error(
+    error_cls: Type[GoogleConnectorError], message: str, error: Exception, **details
+) -> GoogleConnectorError:
+    """Build a connector error for an underlying exception, keeping its text"""
+    return error_cls(f"{message}: {error}", details={**details, "error": str(error)})
+
+
+@dataclass(slots=True)
+class GroupMember:
+    """Member of a Google group as returned by the Directory API"""
+    email: Optional[str]
+    role: str
+    type: Optional[str]
+    status: str
+
 
 class GoogleAdminService:
     def __init__(
@@ -51,15 +107,122 @@ class GoogleAdminService:
         self.logger = logger
         self.config_service = config
         self.rate_limiter = rate_limiter
-        self.google_limiter = self.rate_limiter.google_limiter
+        self.directory_limiter = self.rate_limiter.limiter_for("admin.directory")
+        self.reports_limiter = self.rate_limiter.limiter_for("admin.reports")
         self.google_token_handler = google_token_handler
         self.arango_service = arango_service
         self.admin_reports_service = None
         self.admin_directory_service = None
         self.credentials = None
+        # org_id -> (expiry, credentials, reports service, directory service)
+        self._admin_connections: Dict[str, tuple] = {}
+        self._connect_locks: Dict[str, asyncio.Lock] = {}
+        # (admin credentials, email) -> delegated credentials with their token
+        self._delegated_credentials = TTLCache(
+            maxsize=DELEGATED_CREDENTIALS_CACHE_SIZE, ttl=ADMIN_CONNECTION_TTL_SECONDS
+        )
+        # (kind, delegated credentials) -> connected Drive/Gmail user service
+        self._user_services = TTLCache(
+            maxsize=DELEGATED_CREDENTIALS_CACHE_SIZE, ttl=ADMIN_CONNECTION_TTL_SECONDS
+        )
+        # email -> user/group _key; only hits are cached so new entities show up
+        self._entity_keys = TTLCache(
+            maxsize=ENTITY_KEY_CACHE_SIZE, ttl=ENTITY_KEY_CACHE_TTL_SECONDS
+        )
+
+        self._upsert_batcher = MicroBatcher(
+            self._upsert_batch, UPSERT_BATCH_SIZE, UPSERT_BATCH_WINDOW_SECONDS
+        )
+
+    async def _upsert_node(self, node: Dict, collection: str) -> bool | None:
+        """Upsert one node, sharing a batch_upsert_nodes call with concurrent events"""
+        return await self._upsert_batcher.submit((collection, node))
+
+    async def _upsert_batch(self, batch: List[tuple]) -> list:
+        """Upsert a batch of nodes with one batch_upsert_nodes call per collection"""
+        by_collection = defaultdict(list)
+        for position, (collection, node) in enumerate(batch):
+            by_collection[collection].append((position, node))
+
+        results = [None] * len(batch)
+        for collection, items in by_collection.items():
+            try:
+                result = await self.arango_service.batch_upsert_nodes(
+                    [node for _, node in items], collection
+                )
+            except Exception as e:
+                result = e
+            for position, _ in items:
+                results[position] = result
+        return results
+
+    async def _get_entity_key(self, email: str) -> Optional[str]:
+        entity_key = self._entity_keys.get(email)
+        if entity_key is None:
+            entity_key = await self.arango_service.get_entity_id_by_email(email)
+            if entity_key:
+                self._entity_keys[email] = entity_key
+        return entity_key
+
+    def _use_cached_connection(self, org_id: str) -> bool:
+        cached = self._admin_connections.get(org_id)
+        if cached is None or time.monotonic() >= cached[0]:
+            return False
+        (
+            _,
+            self.credentials,
+            self.admin_reports_service,
+            self.admin_directory_service,
+        ) = cached
+        return True
 
     async def connect_admin(self, org_id: str) -> bool:
         """Initialize admin service with domain-wide delegation"""
+        if self._use_cached_connection(org_id):
+            return True
+
+        # Serialize rebuilds per org so concurrent callers share one connect
+        async with self._connect_locks.setdefault(org_id, asyncio.Lock()):
+            if self._use_cached_connection(org_id):
+                return True
+            await self._connect_admin(org_id)
+            self._admin_connections[org_id] = (
+                time.monotonic() + ADMIN_CONNECTION_TTL_SECONDS,
+                self.credentials,
+                self.admin_reports_service,
+                self.admin_directory_service,
+            )
+            return True
+
+    def _isolated_http(self) -> AuthorizedHttp:
+        """Authorized transport for one concurrent request
+
+        httplib2 connections are not thread-safe; the shared transport gives
+        each worker thread its own keep-alive connection.
+        """
+        return authorized_http(self.credentials)
+
+    def _delegated(self, user_email: str):
+        """Credentials acting as user_email, reused so the JWT exchange happens once"""
+        key = (self.credentials, user_email)
+        credentials = self._delegated_credentials.get(key)
+        if credentials is None:
+            credentials = self.credentials.with_subject(user_email)
+            self._delegated_credentials[key] = credentials
+        return credentials
+
+    async def ensure_connected(self, org_id: str) -> None:
+        """Make the admin services point at org_id, reusing a cached connection
+
+        Call once before a batch of per-user operations; repeat calls for the
+        same org only cost a cache lookup.
+        """
+        if not await self.connect_admin(org_id):
+            raise AdminServiceError(
+                "Failed to connect admin service", details={"org_id": org_id}
+            )
+
+    async def _connect_admin(self, org_id: str) -> bool:
         try:
             SCOPES = GOOGLE_CONNECTOR_ENTERPRISE_SCOPES + GOOGLE_PARSER_SCOPES
 
@@ -82,10 +245,9 @@ class GoogleAdminService:
             except AdminAuthError:
                 raise
             except Exception as e:
-                raise AdminAuthError(
-                    "Error getting enterprise token: " + str(e),
-                    details={"org_id": org_id, "error": str(e)},
-                )
+                raise _wrap_error(
+                    AdminAuthError, "Error getting enterprise token", e, org_id=org_id
+                ) from e
 
             try:
                 self.credentials = (
@@ -94,57 +256,65 @@ class GoogleAdminService:
                     )
                 )
             except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials: " + str(e),
-                    details={
-                        "org_id": org_id,
-                        "admin_email": admin_email,
-                        "error": str(e),
-                    },
-                )
+                raise _wrap_error(
+                    AdminDelegationError,
+                    "Failed to create delegated credentials",
+                    e,
+                    org_id=org_id,
+                    admin_email=admin_email,
+                ) from e
 
             try:
-                self.admin_reports_service = build(
+                self.admin_reports_service = build_service(
                     "admin",
                     "reports_v1",
                     credentials=self.credentials,
-                    cache_discovery=False,
                 )
-                self.admin_directory_service = build(
+                self.admin_directory_service = build_service(
                     "admin",
                     "directory_v1",
                     credentials=self.credentials,
-                    cache_discovery=False,
                 )
             except Exception as e:
-                raise AdminServiceError(
-                    "Failed to build admin service: " + str(e),
-                    details={"org_id": org_id, "error": str(e)},
-                )
+                raise _wrap_error(
+                    AdminServiceError, "Failed to build admin service", e, org_id=org_id
+                ) from e
 
             return True
 
         except (AdminAuthError, AdminDelegationError, AdminServiceError):
             raise
         except Exception as e:
-            raise AdminServiceError(
-                "Failed to connect to Admin Service: " + str(e),
-                details={"error": str(e)},
-            )
+            raise _wrap_error(
+                AdminServiceError, "Failed to connect to Admin Service", e
+            ) from e
 
     @exponential_backoff()
     async def list_enterprise_users(self, org_id: str) -> List[Dict]:
         """List all users in the domain for enterprise setup"""
+        users = []
+        async for page in self.iter_enterprise_users(org_id):
+            users.extend(page)
+        return users
+
+    async def iter_enterprise_users(self, org_id: str) -> AsyncIterator[List[Dict]]:
+        """Yield active users in the domain one page at a time
+
+        Callers that only need to process users page by page should prefer
+        this over list_enterprise_users so the full domain is never held in
+        memory at once.
+        """
         try:
             self.logger.info("🚀 Listing domain users")
-            users = []
+            active_users = 0
+            total_users = 0
             page_token = None
-            failed_items = []
+            failed_items = None
 
             while True:
                 try:
-                    async with self.google_limiter:
-                        results = (
+                    async with self.directory_limiter:
+                        results = await asyncio.to_thread(
                             self.admin_directory_service.users()
                             .list(
                                 customer="my_customer",
@@ -152,66 +322,76 @@ class GoogleAdminService:
                                 projection="full",
                                 pageToken=page_token,
                             )
-                            .execute()
+                            .execute
                         )
                 except HttpError as e:
                     if e.resp.status == HttpStatusCode.FORBIDDEN.value:
-                        raise AdminAuthError(
-                            "Permission denied listing users: " + str(e),
-                            details={"org_id": org_id, "error": str(e)},
-                        )
+                        raise _wrap_error(
+                            AdminAuthError,
+                            "Permission denied listing users",
+                            e,
+                            org_id=org_id,
+                        ) from e
                     elif e.resp.status == HttpStatusCode.TOO_MANY_REQUESTS.value:
-                        raise AdminQuotaError(
-                            "Rate limit exceeded listing users: " + str(e),
-                            details={"org_id": org_id, "error": str(e)},
-                        )
-                    raise AdminListError(
-                        "Failed to list users: " + str(e),
-                        details={"org_id": org_id, "error": str(e)},
-                    )
+                        raise _wrap_error(
+                            AdminQuotaError,
+                            "Rate limit exceeded listing users",
+                            e,
+                            org_id=org_id,
+                        ) from e
+                    raise _wrap_error(
+                        AdminListError, "Failed to list users", e, org_id=org_id
+                    ) from e
 
                 current_users = results.get("users", [])
+                users = []
 
                 for user in current_users:
-                    if not user.get("suspended", False):
-                        try:
-                            users.append(
-                                {
-                                    "_key": str(uuid4()),
-                                    "userId": str(uuid4()),
-                                    "orgId": org_id,
-                                    "email": user.get("primaryEmail"),
-                                    "fullName": user.get("name", {}).get("fullName"),
-                                    "firstName": user.get("name", {}).get(
-                                        "givenName", ""
-                                    ),
-                                    "middleName": user.get("name", {}).get(
-                                        "middleName", ""
-                                    ),
-                                    "lastName": user.get("name", {}).get(
-                                        "familyName", ""
-                                    ),
-                                    "designation": user.get("designation", "user"),
-                                    "businessPhones": user.get("phones", []),
-                                    "isActive": user.get("isActive", False),
-                                    "createdAtTimestamp": int(
-                                        parse_timestamp(
-                                            user.get("creationTime")
-                                        )
-                                    ),
-                                    "updatedAtTimestamp": int(
-                                        parse_timestamp(
-                                            user.get("creationTime")
-                                        )
-                                    ),
-                                }
-                            )
-                        except Exception as e:
-                            failed_items.append(
-                                {"email": user.get("primaryEmail"), "error": str(e)}
-                            )
+                    if user.get("suspended", False):
+                        continue
+                    creation_time = user.get("creationTime")
+                    if not creation_time:
+                        if failed_items is None:
+                            failed_items = []
+                        failed_items.append(
+                            {
+                                "email": user.get("primaryEmail"),
+                                "error": "Missing creationTime",
+                            }
+                        )
+                        continue
+                    key = _new_key()
+                    name = user.get("name") or {}
+                    created_at = parse_timestamp(creation_time)
+                    users.append(
+                        {
+                            "_key": key,
+                            "userId": key,
+                            "orgId": org_id,
+                            "email": user.get("primaryEmail"),
+                            "fullName": name.get("fullName"),
+                            "firstName": name.get("givenName", ""),
+                            "middleName": name.get("middleName", ""),
+                            "lastName": name.get("familyName", ""),
+                            "designation": user.get("designation", "user"),
+                            "businessPhones": user.get("phones", []),
+                            "isActive": user.get("isActive", False),
+                            "createdAtTimestamp": created_at,
+                            "updatedAtTimestamp": created_at,
+                        }
+                    )
 
+                total_users += len(current_users)
                 page_token = results.get("nextPageToken")
+                # Free the raw page before the caller works through the batch,
+                # and the batch before the next page is fetched
+                del results, current_users
+
+                if users:
+                    active_users += len(users)
+                    yield users
+                del users
+
                 if not page_token:
                     break
 
@@ -219,19 +399,17 @@ class GoogleAdminService:
                 raise BatchOperationError(
                     f"Failed to process {len(failed_items)} users",
                     failed_items=failed_items,
-                    details={"org_id": org_id, "total_users": len(current_users)},
+                    details={"org_id": org_id, "total_users": total_users},
                 )
 
-            self.logger.info("✅ Found %s active users in domain", len(users))
-            return users
+            self.logger.info("✅ Found %s active users in domain", active_users)
 
         except (AdminAuthError, AdminQuotaError, AdminListError, BatchOperationError):
             raise
         except Exception as e:
-            raise AdminServiceError(
-                "Unexpected error listing users: " + str(e),
-                details={"org_id": org_id, "error": str(e)},
-            )
+            raise _wrap_error(
+                AdminServiceError, "Unexpected error listing users", e, org_id=org_id
+            ) from e
 
     @exponential_backoff()
     async def list_groups(self, org_id: str) -> Optional[List[Dict]]:
@@ -243,21 +421,20 @@ class GoogleAdminService:
 
             while True:
                 try:
-                    async with self.google_limiter:
-                        results = (
+                    async with self.directory_limiter:
+                        results = await asyncio.to_thread(
                             self.admin_directory_service.groups()
                             .list(customer="my_customer", pageToken=page_token)
-                            .execute()
+                            .execute
                         )
                 except Exception as e:
                     if "quota" in str(e).lower():
-                        raise AdminQuotaError(
-                            "API quota exceeded while listing groups: " + str(e),
-                            details={"error": str(e)},
-                        )
-                    raise AdminListError(
-                        "Failed to list groups" + str(e), details={"error": str(e)}
-                    )
+                        raise _wrap_error(
+                            AdminQuotaError,
+                            "API quota exceeded while listing groups",
+                            e,
+                        ) from e
+                    raise _wrap_error(AdminListError, "Failed to list groups", e) from e
 
                 current_groups = results.get("groups", [])
                 if current_groups is None:
@@ -292,47 +469,39 @@ class GoogleAdminService:
         except (AdminQuotaError, AdminListError):
             raise
         except Exception as e:
-            raise AdminServiceError(
-                "Unexpected error while listing groups: " + str(e),
-                details={"org_id": org_id, "error": str(e)},
-            )
+            raise _wrap_error(
+                AdminServiceError,
+                "Unexpected error while listing groups",
+                e,
+                org_id=org_id,
+            ) from e
 
     @exponential_backoff()
     async def list_domains(self) -> List[Dict]:
         """List all domains for the enterprise"""
         try:
             self.logger.info("🚀 Listing domains")
-            domains = []
-            page_token = None
-
-            while True:
-                async with self.google_limiter:
-                    results = (
-                        self.admin_directory_service.domains()
-                        .list(
-                            customer="my_customer",
-                        )
-                        .execute()
-                    )
-
-                    current_domains = results.get("domains", [])
 
-                    domains.extend(
-                        [
-                            {
-                                "_key": f"gdr_domain_{domain.get('domainName')}",
-                                "domainName": domain.get("domainName"),
-                                "verified": domain.get("verified", False),
-                                "isPrimary": domain.get("isPrimary", False),
-                                "createdAt": domain.get("creationTime"),
-                            }
-                            for domain in current_domains
-                        ]
-                    )
+            # domains.list is not paginated; one call returns every domain
+            async with self.directory_limiter:
+                results = await asyncio.to_thread(
+                    self.admin_directory_service.domains()
+                    .list(customer="my_customer")
+                    .execute
+                )
 
-                    page_token = results.get("nextPageToken")
-                    if not page_token:
-                        break
+            domains = []
+            for domain in results.get("domains", []):
+                domain_name = domain.get("domainName")
+                domains.append(
+                    {
+                        "_key": f"gdr_domain_{domain_name}",
+                        "domainName": domain_name,
+                        "verified": domain.get("verified", False),
+                        "isPrimary": domain.get("isPrimary", False),
+                        "createdAt": domain.get("creationTime"),
+                    }
+                )
 
             self.logger.info("✅ Found %s domains", len(domains))
             return domains
@@ -341,32 +510,56 @@ class GoogleAdminService:
             self.logger.error("❌ Failed to list domains: %s", str(e))
             return []
 
+    @staticmethod
+    def _parse_group_members(results: Dict) -> List[GroupMember]:
+        return [
+            GroupMember(
+                email=member.get("email"),
+                role=member.get("role", "member").lower(),
+                type=member.get("type"),
+                status=member.get("status", "active"),
+            )
+            for member in results.get("members") or []
+        ]
+
     @exponential_backoff()
-    async def list_group_members(self, group_email: str) -> List[Dict]:
-        """List all members of a specific group"""
+    async def list_group_members(
+        self,
+        group_email: str,
+        page_token: Optional[str] = None,
+        http: Optional[AuthorizedHttp] = None,
+    ) -> List[GroupMember]:
+        """List all members of a specific group, optionally resuming from page_token
+
+        Pass an http from _isolated_http when listing several groups at once.
+        """
         try:
             self.logger.info(f"🚀 Listing members for group: {group_email}")
             members = []
-            page_token = None
 
             while True:
                 try:
-                    async with self.google_limiter:
-                        results = (
+                    async with self.directory_limiter:
+                        results = await asyncio.to_thread(
                             self.admin_directory_service.members()
                             .list(groupKey=group_email, pageToken=page_token)
-                            .execute()
+                            .execute,
+                            http=http,
                         )
                 except Exception as e:
                     if "quota" in str(e).lower():
-                        raise AdminQuotaError(
-                            "API quota exceeded while listing group members: " + str(e),
-                            details={"group_email": group_email, "error": str(e)},
-                        )
-                    raise AdminListError(
-                        "Failed to list group members: " + str(e),
-                        details={"group_email": group_email, "error": str(e)},
-                    )
+                        raise _wrap_error(
+                            AdminQuotaError,
+                            "API quota exceeded while listing group members",
+                            e,
+                            group_email=group_email,
+                        ) from e
+                    raise _wrap_error(
+                        AdminListError,
+                        "Failed to list group members",
+                        e,
+                        group_email=group_email,
+                    ) from e
 
                 current_members = results.get("members", [])
                 if current_members is None:
@@ -375,17 +568,7 @@ class GoogleAdminService:
                         details={"group_email": group_email, "results": results},
                     )
 
-                members.extend(
-                    [
-                        {
-                            "email": member.get("email"),
-                            "role": member.get("role", "member").lower(),
-                            "type": member.get("type"),
-                            "status": member.get("status", "active"),
-                        }
-                        for member in current_members
-                    ]
-                )
+                members.extend(self._parse_group_members(results))
 
                 page_token = results.get("nextPageToken")
                 if not page_token:
@@ -397,10 +580,106 @@ class GoogleAdminService:
         except (AdminQuotaError, AdminListError):
             raise
         except Exception as e:
-            raise AdminServiceError(
-                "Unexpected error while listing group members: " + str(e),
-                details={"group_email": group_email, "error": str(e)},
+            raise _wrap_error(
+                AdminServiceError,
+                "Unexpected error while listing group members",
+                e,
+                group_email=group_email,
+            ) from e
+
+    async def batch_list_group_members(
+        self, group_emails: List[str]
+    ) -> Dict[str, List[GroupMember]]:
+        """List members of many groups, fetching first pages in batched HTTP requests
+
+        Groups whose first page fails are logged and left out of the result.
+        """
+        self.logger.info("🚀 Listing members for %s groups", len(group_emails))
+        members_by_group: Dict[str, List[GroupMember]] = {}
+        next_page_tokens: Dict[str, str] = {}
+
+        def collect(request_id, response, exception) -> None:
+            if exception is not None:
+                self.logger.error(
+                    "❌ Failed to list members for group %s: %s",
+                    request_id,
+                    str(exception),
+                )
+                return
+            members_by_group[request_id] = self._parse_group_members(response)
+            if response.get("nextPageToken"):
+                next_page_tokens[request_id] = response["nextPageToken"]
+
+        semaphore = asyncio.Semaphore(GROUP_MEMBERS_CONCURRENCY)
+
+        async def run_batch(chunk: List[str]) -> None:
+            async with semaphore:
+                batch = self.admin_directory_service.new_batch_http_request(
+                    callback=collect
+                )
+                for group_email in chunk:
+                    batch.add(
+                        self.admin_directory_service.members().list(
+                            groupKey=group_email
+                        ),
+                        request_id=group_email,
+                    )
+                # A batch is billed as one call per sub-request
+                await self.directory_limiter.acquire(len(chunk))
+                try:
+                    await asyncio.to_thread(batch.execute, http=self._isolated_http())
+                except Exception as e:
+                    if "quota" in str(e).lower():
+                        raise _wrap_error(
+                            AdminQuotaError,
+                            "API quota exceeded while batch listing group members",
+                            e,
+                            groups=chunk,
+                        ) from e
+                    raise _wrap_error(
+                        AdminListError,
+                        "Failed to batch list group members",
+                        e,
+                        groups=chunk,
+                    ) from e
+
+        await asyncio.gather(
+            *(
+                run_batch(group_emails[start : start + ADMIN_BATCH_SIZE])
+                for start in range(0, len(group_emails), ADMIN_BATCH_SIZE)
             )
+        )
+
+        # Only groups larger than one page need follow-up requests
+        async def list_remaining(group_email: str, page_token: str) -> None:
+            async with semaphore:
+                try:
+                    members_by_group[group_email].extend(
+                        await self.list_group_members(
+                            group_email, page_token, http=self._isolated_http()
+                        )
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        "❌ Failed to list remaining members for group %s: %s",
+                        group_email,
+                        str(e),
+                    )
+                    members_by_group.pop(group_email, None)
+
+        await asyncio.gather(
+            *(
+                list_remaining(group_email, page_token)
+                for group_email, page_token in next_page_tokens.items()
+            )
+        )
+
+        self.logger.info(
+            "✅ Listed members for %s of %s groups",
+            len(members_by_group),
+            len(group_emails),
+        )
+        return members_by_group
 
     async def handle_new_user(self, org_id: str, user_email: str) -> None:
         """Handle new user creation event"""
@@ -415,24 +694,38 @@ class GoogleAdminService:
                 self.logger.error(f"Failed to get user info for {user_email}")
                 return
 
-            user_key = await self.arango_service.get_entity_id_by_email(user_email)
-            if not user_key:
-                # Create user in Arango with isActive=False
-                await self.arango_service.batch_upsert_nodes(
-                    [user_info], CollectionNames.USERS.value
-                )
+            # Create the user (isActive=False) and its org edge in one round
+            # trip, skipping both if a user with this email already exists
+            query = """
+            LET existing = FIRST(
+                FOR doc IN @@users
+                    FILTER doc.email == @email
+                    LIMIT 1
+                    RETURN doc._key
+            )
+            FILTER existing == null
+            INSERT @user INTO @@users
+            LET user = NEW
+            INSERT {
+                _from: user._id,
+                _to: @org_id,
+                entityType: "ORGANIZATION",
+                createdAtTimestamp: @timestamp
+            } INTO @@belongsTo
+            """
 
-                # Create edge between org and user if it doesn't exist
-                edge_data = {
-                    "_to": f"{CollectionNames.ORGS.value}/{org_id}",
-                    "_from": f"{CollectionNames.USERS.value}/{user_info['_key']}",
-                    "entityType": "ORGANIZATION",
-                    "createdAtTimestamp": current_timestamp,
-                }
-                await self.arango_service.batch_create_edges(
-                    [edge_data],
-                    CollectionNames.BELONGS_TO.value,
-                )
+            self.arango_service.db.aql.execute(
+                query,
+                bind_vars={
+                    "email": user_email,
+                    "user": user_info,
+                    "org_id": f"{_ORGS}/{org_id}",
+                    "timestamp": current_timestamp,
+                    "@users": _USERS,
+                    "@belongsTo": _BELONGS_TO,
+                },
+                count=False,
+            )
 
             self.logger.info(f"Successfully created user record for {user_email}")
 
@@ -447,22 +740,20 @@ class GoogleAdminService:
         try:
             self.logger.info(f"Handling user deletion for {user_email}")
 
-            user_key = await self.arango_service.get_entity_id_by_email(user_email)
+            user_key = await self._get_entity_key(user_email)
             if not user_key:
                 self.logger.warning(f"User {user_email} not found in ArangoDB")
                 return
 
             user = await self.arango_service.get_document(
-                user_key, CollectionNames.USERS.value
+                user_key, _USERS
             )
             if not user:
                 self.logger.warning(f"User {user_email} not found in ArangoDB")
                 return
 
             user["isActive"] = False
-            await self.arango_service.batch_upsert_nodes(
-                [user], CollectionNames.USERS.value
-            )
+            await self._upsert_node(user, _USERS)
 
             self.logger.info(f"Successfully marked user {user_email} as inactive")
 
@@ -483,12 +774,10 @@ class GoogleAdminService:
                 self.logger.error(f"Failed to get group info for {group_email}")
                 return
 
-            group_key = await self.arango_service.get_entity_id_by_email(group_email)
+            group_key = await self._get_entity_key(group_email)
             if not group_key:
                 # Create group in Arango
-                await self.arango_service.batch_upsert_nodes(
-                    [group_info], CollectionNames.GROUPS.value
-                )
+                await self._upsert_node(group_info, _GROUPS)
 
             self.logger.info(f"Successfully created group record for {group_email}")
 
@@ -503,30 +792,27 @@ class GoogleAdminService:
         try:
             self.logger.info(f"Handling group deletion for {group_email}")
 
-            group_key = await self.arango_service.get_entity_id_by_email(group_email)
+            group_key = await self._get_entity_key(group_email)
             if not group_key:
                 self.logger.warning(f"Group {group_email} not found in ArangoDB")
                 return
 
-            # AQL query to delete group and all its associated edges
-            query = f"""
-            LET group = DOCUMENT({CollectionNames.GROUPS.value}, '{group_key}')
-
-            // Delete the group document and return the deleted document
-            LET deleted_group = (
-                FOR doc IN {CollectionNames.GROUPS.value}
-                FILTER doc._key == '{group_key}'
-                REMOVE doc IN {CollectionNames.GROUPS.value}
-                RETURN OLD
-            )
-
-            RETURN {{
-                deleted_group: deleted_group[0]
-            }}
+            # Delete the group document
+            query = """
+            FOR doc IN @@groups
+                FILTER doc._key == @group_key
+                REMOVE doc IN @@groups
             """
 
-            cursor = self.arango_service.db.aql.execute(query)
-            cursor.next()
+            self.arango_service.db.aql.execute(
+                query,
+                bind_vars={
+                    "group_key": group_key,
+                    "@groups": _GROUPS,
+                },
+                count=False,
+            )
+            self._entity_keys.pop(group_email, None)
             self.logger.info(
                 f"Successfully deleted group {group_email} and its associated edges"
             )
@@ -546,8 +832,9 @@ class GoogleAdminService:
                 f"Handling member addition to group {group_email}: {user_email}"
             )
 
-            group_key = await self.arango_service.get_entity_id_by_email(group_email)
-            user_key = await self.arango_service.get_entity_id_by_email(user_email)
+            group_key, user_key = await asyncio.gather(
+                self._get_entity_key(group_email), self._get_entity_key(user_email)
+            )
 
             if not group_key or not user_key:
                 self.logger.error(
@@ -559,15 +846,15 @@ class GoogleAdminService:
 
             # Create BELONGS_TO edge
             belongs_to_data = {
-                "_from": f"{CollectionNames.USERS.value}/{user_key}",
-                "_to": f"{CollectionNames.GROUPS.value}/{group_key}",
+                "_from": f"{_USERS}/{user_key}",
+                "_to": f"{_GROUPS}/{group_key}",
                 "entityType": "GROUP",
                 "createdAtTimestamp": current_timestamp,
             }
 
             # Create both edges
             await self.arango_service.batch_create_edges(
-                [belongs_to_data], CollectionNames.BELONGS_TO.value
+                [belongs_to_data], _BELONGS_TO
             )
 
             self.logger.info(f"Successfully added {user_email} to group {group_email}")
@@ -585,8 +872,9 @@ class GoogleAdminService:
                 f"Handling member removal from group {group_email}: {user_email}"
             )
 
-            group_key = await self.arango_service.get_entity_id_by_email(group_email)
-            user_key = await self.arango_service.get_entity_id_by_email(user_email)
+            group_key, user_key = await asyncio.gather(
+                self._get_entity_key(group_email), self._get_entity_key(user_email)
+            )
 
             if not group_key or not user_key:
                 self.logger.error(
@@ -594,28 +882,24 @@ class GoogleAdminService:
                 )
                 return
 
-            # Query to delete both membership and belongs_to edges
-            query = f"""
-            LET user_id = CONCAT({CollectionNames.USERS.value}, '/', '{user_key}')
-            LET group_id = CONCAT({CollectionNames.GROUPS.value}, '/', '{group_key}')
-
-            // Delete belongs_to edge
-            LET deleted_belongs = (
-                FOR edge IN {CollectionNames.BELONGS_TO.value}
-                FILTER edge._from == user_id
-                AND edge._to == group_id
+            # Delete the user's belongs_to edge to the group
+            query = """
+            FOR edge IN @@belongsTo
+                FILTER edge._from == @user_id
+                AND edge._to == @group_id
                 AND edge.entityType == 'GROUP'
-                REMOVE edge IN {CollectionNames.BELONGS_TO.value}
-                RETURN OLD
-            )
-
-            RETURN {{
-                deleted_belongs: deleted_belongs[0]
-            }}
+                REMOVE edge IN @@belongsTo
             """
 
-            cursor = self.arango_service.db.aql.execute(query)
-            cursor.next()
+            self.arango_service.db.aql.execute(
+                query,
+                bind_vars={
+                    "user_id": f"{_USERS}/{user_key}",
+                    "group_id": f"{_GROUPS}/{group_key}",
+                    "@belongsTo": _BELONGS_TO,
+                },
+                count=False,
+            )
             self.logger.info(
                 f"Successfully removed {user_email} from group {group_email}"
             )
@@ -628,37 +912,32 @@ class GoogleAdminService:
     async def get_user_info(self, org_id: str, user_email: str) -> Optional[Dict]:
         """Get user information from Google Admin API"""
         try:
-            if not await self.connect_admin(org_id):
-                raise AdminServiceError(
-                    "Failed to connect admin service for user info retrieval",
-                    details={"org_id": org_id},
-                )
+            await self.ensure_connected(org_id)
 
-            async with self.google_limiter:
-                user_info = (
+            async with self.directory_limiter:
+                user_info = await asyncio.to_thread(
                     self.admin_directory_service.users()
                     .get(userKey=user_email)
-                    .execute()
+                    .execute
                 )
 
+                key = _new_key()
+                name = user_info.get("name") or {}
+                created_at = parse_timestamp(user_info.get("creationTime"))
                 return {
-                    "_key": str(uuid4()),
-                    "userId": str(uuid4()),
+                    "_key": key,
+                    "userId": key,
                     "orgId": org_id,
                     "email": user_info.get("primaryEmail"),
-                    "fullName": user_info.get("name", {}).get("fullName"),
-                    "firstName": user_info.get("name", {}).get("givenName", ""),
-                    "middleName": user_info.get("name", {}).get("middleName", ""),
-                    "lastName": user_info.get("name", {}).get("familyName", ""),
+                    "fullName": name.get("fullName"),
+                    "firstName": name.get("givenName", ""),
+                    "middleName": name.get("middleName", ""),
+                    "lastName": name.get("familyName", ""),
                     "designation": user_info.get("designation", ""),
                     "businessPhones": user_info.get("phones", []),
                     "isActive": False,  # New users start as inactive
-                    "createdAtTimestamp": int(
-                        parse_timestamp(user_info.get("creationTime"))
-                    ),
-                    "updatedAtTimestamp": int(
-                        parse_timestamp(user_info.get("creationTime"))
-                    ),
+                    "createdAtTimestamp": created_at,
+                    "updatedAtTimestamp": created_at,
                 }
 
         except Exception as e:
@@ -669,22 +948,18 @@ class GoogleAdminService:
     async def get_group_info(self, org_id: str, group_email: str) -> Optional[Dict]:
         """Get group information from Google Admin API"""
         try:
-            if not await self.connect_admin(org_id):
-                raise AdminServiceError(
-                    "Failed to connect admin service for group info retrieval",
-                    details={"org_id": org_id},
-                )
+            await self.ensure_connected(org_id)
 
-            async with self.google_limiter:
-                group_info = (
+            async with self.directory_limiter:
+                group_info = await asyncio.to_thread(
                     self.admin_directory_service.groups()
                     .get(groupKey=group_email)
-                    .execute()
+                    .execute
                 )
 
                 return {
-                    "_key": str(uuid4()),
-                    "groupId": str(uuid4()),
+                    "_key": _new_key(),
+                    "groupId": _new_key(),
                     "orgId": org_id,
                     "email": group_info.get("email"),
                     "name": group_info.get("name"),
@@ -703,11 +978,7 @@ class GoogleAdminService:
         try:
             self.logger.info("🔍 Setting up admin activity watch")
 
-            if not await self.connect_admin(org_id):
-                raise AdminServiceError(
-                    "Failed to connect admin service for watch creation",
-                    details={"org_id": org_id},
-                )
+            await self.ensure_connected(org_id)
 
             # Create a channel for notifications
             channel_id = str(uuid4())
@@ -735,10 +1006,9 @@ class GoogleAdminService:
                     return
 
             except Exception as e:
-                raise AdminServiceError(
-                    "Failed to get webhook configuration: " + str(e),
-                    details={"error": str(e)},
-                )
+                raise _wrap_error(
+                    AdminServiceError, "Failed to get webhook configuration", e
+                ) from e
 
             webhook_url = f"{webhook_endpoint.rstrip('/')}/admin/webhook"
 
@@ -753,13 +1023,13 @@ class GoogleAdminService:
             self.logger.info(f"🔍 Creating admin watch for {org_id}")
 
             try:
-                async with self.google_limiter:
-                    (
+                async with self.reports_limiter:
+                    await asyncio.to_thread(
                         self.admin_reports_service.activities()
                         .watch(
                             userKey="all", applicationName="admin", body=channel_body
                         )
-                        .execute()
+                        .execute
                     )
                     self.logger.debug(
                         f"🔍 Admin watch created successfully for {org_id}"
@@ -788,16 +1058,22 @@ class GoogleAdminService:
         try:
             # Create delegated credentials for the user
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value,)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
+                user_key = await self._get_entity_key(user_email)
+                user = await self.arango_service.get_document(user_key, _USERS)
+                await self.ensure_connected(user.get("orgId"))
+                user_credentials = self._delegated(user_email)
             except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                raise _wrap_error(
+                    AdminDelegationError,
+                    "Failed to create delegated credentials for user",
+                    e,
+                    user_email=user_email,
+                ) from e
+
+            # Reuse the connected service built for these credentials
+            user_service = self._user_services.get(("drive", user_credentials))
+            if user_service is not None and user_service.service is not None:
+                return user_service
 
             # Create new user service
             user_service = DriveUserService(
@@ -818,11 +1094,14 @@ class GoogleAdminService:
                         details={"user_email": user_email},
                     )
             except Exception as e:
-                raise UserOperationError(
-                    "Error connecting user service: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                raise _wrap_error(
+                    UserOperationError,
+                    "Error connecting user service",
+                    e,
+                    user_email=user_email,
+                ) from e
 
+            self._user_services[("drive", user_credentials)] = user_service
             return user_service
 
         except (AdminDelegationError, UserOperationError):
@@ -831,10 +1110,12 @@ class GoogleAdminService:
             self.logger.error(
                 f"❌ Failed to create user service for {user_email}: {str(e)}"
             )
-            raise AdminServiceError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
-            )
+            raise _wrap_error(
+                AdminServiceError,
+                "Unexpected error creating user service",
+                e,
+                user_email=user_email,
+            ) from e
 
     async def create_gmail_user_service(
         self, user_email: str
@@ -843,16 +1124,22 @@ class GoogleAdminService:
         try:
             # Create delegated credentials for the user
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
+                user_key = await self._get_entity_key(user_email)
+                user = await self.arango_service.get_document(user_key, _USERS)
+                await self.ensure_connected(user.get("orgId"))
+                user_credentials = self._delegated(user_email)
             except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                raise _wrap_error(
+                    AdminDelegationError,
+                    "Failed to create delegated credentials for user",
+                    e,
+                    user_email=user_email,
+                ) from e
+
+            # Reuse the connected service built for these credentials
+            user_service = self._user_services.get(("gmail", user_credentials))
+            if user_service is not None and user_service.service is not None:
+                return user_service
 
             # Create new user service
             user_service = GmailUserService(
@@ -879,15 +1166,18 @@ class GoogleAdminService:
                     details={"user_email": user_email, "error": str(e)},
                 )
 
+            self._user_services[("gmail", user_credentials)] = user_service
             return user_service
 
         except (AdminDelegationError, UserOperationError):
             raise
         except Exception as e:
-            raise GoogleMailError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
-            )
+            raise _wrap_error(
+                GoogleMailError,
+                "Unexpected error creating user service",
+                e,
+                user_email=user_email,
+            ) from e
 
     async def create_gcal_user_service(
         self, user_email: str
@@ -896,16 +1186,17 @@ class GoogleAdminService:
         try:
             # Create delegated credentials for the user
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
+                user_key = await self._get_entity_key(user_email)
+                user = await self.arango_service.get_document(user_key, _USERS)
+                await self.ensure_connected(user.get("orgId"))
+                user_credentials = self._delegated(user_email)
             except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                raise _wrap_error(
+                    AdminDelegationError,
+                    "Failed to create delegated credentials for user",
+                    e,
+                    user_email=user_email,
+                ) from e
 
             # Create new user service
             user_service = GCalUserService(
@@ -925,10 +1216,12 @@ class GoogleAdminService:
             self.logger.error(
                 f"❌ Failed to create user service for {user_email}: {str(e)}"
             )
-            raise AdminServiceError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
-            )
+            raise _wrap_error(
+                AdminServiceError,
+                "Unexpected error creating user service",
+                e,
+                user_email=user_email,
+            ) from e
 
     async def create_parser_user_service(
         self, user_email: str
@@ -937,16 +1230,17 @@ class GoogleAdminService:
         try:
             self.logger.info("🚀 Creating parser user service for %s", user_email)
             try:
-                user_key = await self.arango_service.get_entity_id_by_email(user_email)
-                user = await self.arango_service.get_document(user_key, CollectionNames.USERS.value)
-                if self.credentials is None:
-                    await self.connect_admin(user.get("orgId"))
-                user_credentials = self.credentials.with_subject(user_email)
+                user_key = await self._get_entity_key(user_email)
+                user = await self.arango_service.get_document(user_key, _USERS)
+                await self.ensure_connected(user.get("orgId"))
+                user_credentials = self._delegated(user_email)
             except Exception as e:
-                raise AdminDelegationError(
-                    "Failed to create delegated credentials for user: " + str(e),
-                    details={"user_email": user_email, "error": str(e)},
-                )
+                raise _wrap_error(
+                    AdminDelegationError,
+                    "Failed to create delegated credentials for user",
+                    e,
+                    user_email=user_email,
+                ) from e
             # Create new user service
             user_service = ParserUserService(
                 logger=self.logger,
@@ -966,7 +1260,9 @@ class GoogleAdminService:
             self.logger.error(
                 f"❌ Failed to create user service for {user_email}: {str(e)}"
             )
-            raise AdminServiceError(
-                "Unexpected error creating user service: " + str(e),
-                details={"user_email": user_email, "error": str(e)},
-            )
+            raise _wrap_error(
+                AdminServiceError,
+                "Unexpected error creating user service",
+                e,
+                user_email=user_email,
+            ) from e
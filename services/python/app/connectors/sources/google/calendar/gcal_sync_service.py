@@ -12,6 +12,9 @@ from app.connectors.sources.google.calendar.gcal_user_service import GCalUserSer
 from app.connectors.sources.google.common.arango_service import ArangoService
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Concurrent user service creations and watch calls during initialize
+WATCH_SETUP_CONCURRENCY = 32
+
 
 class GCalSyncProgress:
     """Class to track sync progress"""
@@ -42,14 +45,11 @@ class BaseGCalSyncService(ABC):
         self.progress = GCalSyncProgress()
 
         # Common state
-        self._pause_event = asyncio.Event()
-        self._pause_event.set()
         self._stop_requested = False
 
         # Locks
         self._sync_lock = asyncio.Lock()
         self._transition_lock = asyncio.Lock()
-        self._progress_lock = asyncio.Lock()
 
         # Configuration
         self._sync_task = None
@@ -140,11 +140,16 @@ class GCalSyncEnterpriseService(BaseGCalSyncService):
             users = []
 
             # List and store enterprise users
-            source_users = await self.gcal_admin_service.list_enterprise_users(org_id)
-            for user in source_users:
-                if not await self.arango_service.get_entity_id_by_email(user["email"]):
-                    self.logger.info("New user found!")
-                    users.append(user)
+            async for source_users in self.gcal_admin_service.iter_enterprise_users(
+                org_id
+            ):
+                existing_emails = await self.arango_service.get_existing_emails(
+                    [user["email"] for user in source_users]
+                )
+                for user in source_users:
+                    if user["email"] not in existing_emails:
+                        self.logger.info("New user found!")
+                        users.append(user)
 
             if users:
                 self.logger.info("🚀 Found %s users", len(users))
@@ -165,9 +170,11 @@ class GCalSyncEnterpriseService(BaseGCalSyncService):
                 sync_hierarchy["status"] = "PAUSED"
                 await self.redis_service.store_sync_hierarchy(sync_hierarchy)
 
-            # Set up calendar watch for each user
-            for user in users:
-                try:
+            # Set up calendar watch for each user; only the writes stay serial
+            semaphore = asyncio.Semaphore(WATCH_SETUP_CONCURRENCY)
+
+            async def setup_watch(user):
+                async with semaphore:
                     user_service = (
                         await self.gcal_admin_service.create_gcal_user_service(
                             user["email"]
@@ -175,27 +182,41 @@ class GCalSyncEnterpriseService(BaseGCalSyncService):
                     )
                     if not user_service:
                         self.logger.warning(
-                            f"❌ Failed to create user service for: {user['email']}"
+                            "❌ Failed to create user service for: %s", user["email"]
                         )
-                        continue
-
-                    watch_response = await user_service.create_calendar_watch()
-                    if not watch_response:
-                        self.logger.warning(
-                            f"❌ Failed to set up calendar watch for user: {user['email']}"
-                        )
-                        continue
-
-                    self.logger.info(
-                        f"✅ Calendar watch set up successfully for user: {user['email']}"
+                        return None
+                    return await user_service.create_calendar_watch()
+
+            watch_responses = await asyncio.gather(
+                *(setup_watch(user) for user in users), return_exceptions=True
+            )
+            for user, watch_response in zip(users, watch_responses):
+                if isinstance(watch_response, Exception):
+                    self.logger.error(
+                        "❌ Error setting up calendar watch for user %s: %s",
+                        user["email"],
+                        str(watch_response),
                     )
+                    continue
+                if not watch_response:
+                    self.logger.warning(
+                        "❌ Failed to set up calendar watch for user: %s", user["email"]
+                    )
+                    continue
+
+                try:
                     await self.arango_service.store_calendar_watch_data(
                         watch_response, user["email"]
                     )
-
+                    self.logger.info(
+                        "✅ Calendar watch set up successfully for user: %s",
+                        user["email"],
+                    )
                 except Exception as e:
                     self.logger.error(
-                        f"❌ Error setting up calendar watch for user {user['email']}: {str(e)}"
+                        "❌ Error setting up calendar watch for user %s: %s",
+                        user["email"],
+                        str(e),
                     )
 
             self.logger.info("✅ Sync service initialized successfully")
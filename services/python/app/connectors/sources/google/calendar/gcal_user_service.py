@@ -1,6 +1,7 @@
 """Google Calendar User Service module for interacting with Google Calendar API"""
 
 # pylint: disable=E1101, W0718
+import asyncio
 import os
 import pickle
 from datetime import datetime, timezone
@@ -8,9 +9,9 @@ from typing import Dict, List
 
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 
 from app.config.configuration_service import ConfigurationService, config_node_constants
+from app.connectors.sources.google.common.discovery import build_service
 from app.connectors.sources.google.common.scopes import (
     GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES,
 )
@@ -58,7 +59,7 @@ class GCalUserService:
                 with open("token.pickle", "wb") as token:
                     pickle.dump(creds, token)
 
-            self.service = build("calendar", "v3", credentials=creds)
+            self.service = build_service("calendar", "v3", credentials=creds)
             self.logger.info("✅ GCalUserService connected successfully")
             return True
 
@@ -74,8 +75,8 @@ class GCalUserService:
             self.logger.info("🚀 Connecting to Enterprise Calendar Service")
             self.org_id = org_id
             self.user_id = user_id
-            self.service = build(
-                "calendar", "v3", credentials=self.credentials, cache_discovery=False
+            self.service = build_service(
+                "calendar", "v3", credentials=self.credentials
             )
             self.logger.info("✅ GCalUserService connected successfully")
             return True
@@ -96,8 +97,8 @@ class GCalUserService:
 
             while True:
                 async with self.google_limiter:
-                    results = (
-                        self.service.calendarList().list(pageToken=page_token).execute()
+                    results = await asyncio.to_thread(
+                        self.service.calendarList().list(pageToken=page_token).execute
                     )
 
                     calendars.extend(
@@ -138,7 +139,7 @@ class GCalUserService:
 
             while True:
                 async with self.google_limiter:
-                    results = (
+                    results = await asyncio.to_thread(
                         self.service.events()
                         .list(
                             calendarId=calendar_id,
@@ -147,7 +148,7 @@ class GCalUserService:
                             orderBy="startTime",
                             pageToken=page_token,
                         )
-                        .execute()
+                        .execute
                     )
 
                     events.extend(
@@ -198,7 +199,9 @@ class GCalUserService:
                     "items": [{"id": calendar_id} for calendar_id in calendar_ids],
                 }
 
-                results = self.service.freebusy().query(body=body).execute()
+                results = await asyncio.to_thread(
+                    self.service.freebusy().query(body=body).execute
+                )
 
                 calendars = {}
                 for calendar_id, busy_info in results.get("calendars", {}).items():
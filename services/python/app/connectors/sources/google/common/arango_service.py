@@ -226,6 +226,40 @@ class ArangoService(BaseArangoService):
         except Exception as e:
             self.logger.error(f"❌ Error storing historyId: {str(e)}")
 
+    async def batch_store_channel_history_ids(self, channels: List[Dict]) -> bool:
+        """
+        Store the latest historyId of many users' channel watches in one query
+
+        Args:
+            channels (List[Dict]): Items with userEmail, historyId and expiration
+        """
+        try:
+            self.logger.info("🚀 Storing historyId for %d users", len(channels))
+
+            query = """
+            FOR channel IN @channels
+                UPSERT { userEmail: channel.userEmail }
+                INSERT {
+                    userEmail: channel.userEmail,
+                    historyId: channel.historyId,
+                    expiration: channel.expiration,
+                    updatedAt: DATE_NOW()
+                }
+                UPDATE {
+                    historyId: channel.historyId,
+                    expiration: channel.expiration,
+                    updatedAt: DATE_NOW()
+                } IN channelHistory
+            """
+
+            self.db.aql.execute(query, bind_vars={"channels": channels})
+            self.logger.info("✅ Stored historyId for %d users", len(channels))
+            return True
+
+        except Exception as e:
+            self.logger.error(f"❌ Error storing historyIds: {str(e)}")
+            return False
+
     async def get_channel_history_id(self, user_email: str) -> Optional[str]:
         """
         Retrieve the latest historyId for a user
@@ -473,6 +507,29 @@ class ArangoService(BaseArangoService):
             )
             return []
 
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        """
+        Get which of the given emails already belong to a user
+
+        Args:
+            emails (List[str]): Email addresses to check
+
+        Returns:
+            Set[str]: Emails that have a user document
+        """
+        try:
+            query = f"""
+            FOR doc IN {CollectionNames.USERS.value}
+                FILTER doc.email IN @emails
+                RETURN doc.email
+            """
+            cursor = self.db.aql.execute(query, bind_vars={"emails": emails})
+            return set(cursor)
+
+        except Exception as e:
+            self.logger.error("❌ Failed to get existing emails: %s", str(e))
+            raise
+
     async def get_entity_id_by_email(
         self, email: str, transaction: Optional[TransactionDatabase] = None
     ) -> Optional[str]:
@@ -1517,6 +1574,56 @@ class ArangoService(BaseArangoService):
             )
             return None
 
+    async def get_user_sync_states(
+        self, user_emails: List[str], service_type: str = Connectors.GOOGLE_DRIVE.value
+    ) -> Dict[str, str]:
+        """
+        Get sync states of many users for a specific service in one query
+
+        Args:
+            user_emails (List[str]): Emails of the users
+            service_type (str): Type of service
+
+        Returns:
+            Dict[str, str]: Sync state by email; users without a relation are left out
+        """
+        try:
+            self.logger.info(
+                "🔍 Getting %s sync states for %d users", service_type, len(user_emails)
+            )
+
+            query = f"""
+            LET app = FIRST(FOR a IN {CollectionNames.APPS.value}
+                          FILTER LOWER(a.name) == LOWER(@service_type)
+                          RETURN a._key)
+
+            FOR user IN {CollectionNames.USERS.value}
+                FILTER user.email IN @user_emails
+                LET edge = FIRST(
+                    FOR rel IN {CollectionNames.USER_APP_RELATION.value}
+                        FILTER rel._from == user._id
+                        FILTER rel._to == CONCAT('apps/', app)
+                        RETURN rel
+                )
+                FILTER edge != null
+                RETURN {{email: user.email, syncState: edge.syncState}}
+            """
+
+            cursor = self.db.aql.execute(
+                query,
+                bind_vars={
+                    "user_emails": user_emails,
+                    "service_type": service_type,
+                },
+            )
+            return {result["email"]: result["syncState"] for result in cursor}
+
+        except Exception as e:
+            self.logger.error(
+                "❌ Failed to get user %s sync states: %s", service_type, str(e)
+            )
+            return {}
+
     async def update_drive_sync_state(
         self, drive_id: str, state: str
     ) -> Optional[Dict]:
@@ -0,0 +1,76 @@
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+import orjson
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.http import build_http
+
+from app.connectors.sources.google.common.json_model import OrjsonModel
+
+
+class SharedHttp:
+    """Process-wide keep-alive transport for Google API clients
+
+    httplib2.Http keeps TLS connections open but is not thread-safe, so each
+    thread that executes requests gets its own Http, shared by every client
+    built through build_service. Per-user clients then reuse connections
+    instead of opening a new one for each user.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = build_http()
+            self._local.http = http
+        return http
+
+    def request(self, *args, **kwargs):
+        return self._http().request(*args, **kwargs)
+
+    def close(self) -> None:
+        # Connections are shared across clients and outlive any one of them
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._http(), name)
+
+
+shared_http = SharedHttp()
+
+
+def authorized_http(credentials) -> AuthorizedHttp:
+    """Authorize credentials on the shared keep-alive transport"""
+    return AuthorizedHttp(credentials, http=shared_http)
+
+
+@lru_cache(maxsize=None)
+def _discovery_document(service_name: str, version: str) -> Optional[Dict]:
+    # Parsed once: build_from_document would json.loads a string on every build
+    document = get_static_doc(service_name, version)
+    return orjson.loads(document) if document is not None else None
+
+
+def build_service(service_name: str, version: str, credentials, **kwargs):
+    """Build a Google API client, reading its discovery document only once
+
+    build() re-reads and re-parses the discovery JSON for every client;
+    per-user enterprise services build one client per user, so the parsed
+    document is kept in memory for the life of the process instead and each
+    client only costs its Resource wrapper.
+
+    Responses are decoded with orjson unless a model is passed in.
+    """
+    http = authorized_http(credentials)
+    kwargs.setdefault("model", OrjsonModel())
+    document = _discovery_document(service_name, version)
+    if document is None:
+        return build(
+            service_name, version, http=http, cache_discovery=False, **kwargs
+        )
+    return build_from_document(document, http=http, **kwargs)
@@ -5,7 +5,7 @@ import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from app.config.configuration_service import (
     ConfigurationService,
@@ -27,6 +27,9 @@ from app.connectors.sources.google.common.arango_service import ArangoService
 from app.connectors.sources.google.gmail.gmail_user_service import GmailUserService
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Gmail rejects batches above 100 calls and recommends staying at 50
+WATCH_BATCH_SIZE = 50
+
 
 class GmailSyncProgress:
     """Class to track sync progress"""
@@ -936,6 +939,89 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
             self.logger.error("Failed to set up changes watch: %s", str(e))
             return None
 
+    async def setup_changes_watches(
+        self, org_id: str, user_emails: List[str]
+    ) -> Dict[str, Dict]:
+        """Set up changes.watch for many users, batching the watch calls"""
+        channels: Dict[str, Dict] = {}
+        user_services: Dict[str, GmailUserService] = {}
+        current_timestamp = get_epoch_timestamp_in_ms()
+
+        for user_email in user_emails:
+            try:
+                channel_history = await self.arango_service.get_channel_history_id(
+                    user_email
+                )
+                expiration_timestamp = (channel_history or {}).get("expiration") or 0
+                if channel_history and expiration_timestamp >= current_timestamp:
+                    channels[user_email] = channel_history
+                    continue
+
+                user_service = await self.gmail_admin_service.create_gmail_user_service(
+                    user_email
+                )
+                if channel_history:
+                    self.logger.info("⚠️ Page token expired for user %s", user_email)
+                    await user_service.stop_gmail_user_watch()
+                else:
+                    self.logger.info("No channel history found for user %s", user_email)
+                user_services[user_email] = user_service
+            except Exception as e:
+                self.logger.error(
+                    "❌ Error preparing changes watch for user %s: %s",
+                    user_email,
+                    str(e),
+                )
+
+        if not user_services:
+            return channels
+
+        creds_data = await self.gmail_admin_service.google_token_handler.get_enterprise_token(
+            org_id
+        )
+        if not creds_data.get("enableRealTimeUpdates", False):
+            self.logger.info("Real time updates disabled, skipping new changes watches")
+            return channels
+        topic = creds_data.get("topicName", "")
+        if not topic:
+            self.logger.error("❌ Topic is required to create changes watches")
+            return channels
+
+        def on_watch(request_id, response, exception) -> None:
+            if exception is not None:
+                self.logger.error(
+                    "❌ Failed to create changes watch for user %s: %s",
+                    request_id,
+                    str(exception),
+                )
+                return
+            response["expiration"] = int(response["expiration"])
+            channels[request_id] = response
+
+        # Each watch keeps its own delegated credentials inside the batch
+        request_body = {"topicName": topic, "labelIds": ["INBOX", "SENT"]}
+        pending = list(user_services)
+        limiter = self.gmail_admin_service.rate_limiter.google_limiter
+        for start in range(0, len(pending), WATCH_BATCH_SIZE):
+            chunk = pending[start : start + WATCH_BATCH_SIZE]
+            batch = user_services[chunk[0]].service.new_batch_http_request(
+                callback=on_watch
+            )
+            for user_email in chunk:
+                batch.add(
+                    user_services[user_email]
+                    .service.users()
+                    .watch(userId="me", body=request_body),
+                    request_id=user_email,
+                )
+            await limiter.acquire(len(chunk))
+            try:
+                await asyncio.to_thread(batch.execute)
+            except Exception as e:
+                self.logger.error("❌ Failed to execute changes watch batch: %s", str(e))
+
+        return channels
+
     async def stop_changes_watch(self, user_email: str) -> bool:
         """Stop changes watch"""
         try:
@@ -986,12 +1072,12 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
 
             # Create relationships between users and groups in belongsTo collection
             belongs_to_group_relations = []
+            members_by_group = await self.gmail_admin_service.batch_list_group_members(
+                [group["email"] for group in groups]
+            )
             for group in groups:
                 try:
-                    # Get group members for each group
-                    group_members = await self.gmail_admin_service.list_group_members(
-                        group["email"]
-                    )
+                    group_members = members_by_group.get(group["email"], [])
 
                     for member in group_members:
                         # Find the matching user
@@ -999,7 +1085,7 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                             (
                                 user
                                 for user in enterprise_users
-                                if user["email"] == member["email"]
+                                if user["email"] == member.email
                             ),
                             None,
                         )
@@ -1018,7 +1104,7 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                                     "_from": f"{CollectionNames.USERS.value}/{matching_user['_key']}",
                                     "_to": f"{CollectionNames.GROUPS.value}/{group['_key']}",
                                     "entityType": "GROUP",
-                                    "role": member.get("role", "member"),
+                                    "role": member.role,
                                 }
                                 belongs_to_group_relations.append(relation)
 
@@ -1071,15 +1157,11 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
 
             # Set up changes watch for each user
             active_users = await self.arango_service.get_users(org_id, active=True)
+            enterprise_emails = {user["email"] for user in enterprise_users}
+            watch_emails = []
             for user in active_users:
                 # Check if user exists in enterprise users
-                is_enterprise_user = False
-                for enterprise_user in enterprise_users:
-                    if enterprise_user["email"] == user["email"]:
-                        is_enterprise_user = True
-                        break
-
-                if not is_enterprise_user:
+                if user["email"] not in enterprise_emails:
                     self.logger.warning(f"User {user['email']} not found in enterprise users")
                     continue
 
@@ -1101,36 +1183,33 @@ class GmailSyncEnterpriseService(BaseGmailSyncService):
                         service_type=Connectors.GOOGLE_MAIL.value,
                     )
 
-                self.logger.info(
-                    "🚀 Setting up changes watch for user %s", user["email"]
-                )
-
-                try:
-                    channel_data = await self.setup_changes_watch(org_id, user["email"])
-                    if not channel_data:
-                        self.logger.warning(
-                            "Changes watch not created for user: %s", user["email"]
-                        )
-                        continue
-                    else:
-                        await self.arango_service.store_channel_history_id(
-                            channel_data["historyId"],
-                            channel_data["expiration"],
-                            user["email"],
-                        )
+                watch_emails.append(user["email"])
 
-                    self.logger.info(
-                        "✅ Changes watch set up successfully for user: %s",
-                        user["email"],
-                    )
-
-                except Exception as e:
-                    self.logger.error(
-                        "❌ Error setting up changes watch for user %s: %s",
-                        user["email"],
-                        str(e),
+            self.logger.info("🚀 Setting up changes watch for %s users", len(watch_emails))
+            channels = await self.setup_changes_watches(org_id, watch_emails)
+            channel_history = []
+            for user_email in watch_emails:
+                channel_data = channels.get(user_email)
+                if not channel_data:
+                    self.logger.warning(
+                        "Changes watch not created for user: %s", user_email
                     )
                     continue
+                channel_history.append(
+                    {
+                        "userEmail": user_email,
+                        "historyId": channel_data["historyId"],
+                        "expiration": channel_data["expiration"],
+                    }
+                )
+
+            if channel_history and await self.arango_service.batch_store_channel_history_ids(
+                channel_history
+            ):
+                self.logger.info(
+                    "✅ Changes watch set up successfully for %d users",
+                    len(channel_history),
+                )
 
             self.logger.info("✅ Gmail Sync service initialized successfully")
             return True
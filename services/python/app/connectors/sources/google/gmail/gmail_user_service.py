@@ -1,5 +1,6 @@
 # pylint: disable=E1101, W0718
 
+import asyncio
 import base64
 import os
 import re
@@ -8,7 +9,6 @@ from typing import Dict, List, Optional
 from uuid import uuid4
 
 import google.oauth2.credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from app.config.configuration_service import ConfigurationService
@@ -22,6 +22,7 @@ from app.connectors.sources.google.common.connector_google_exceptions import (
     GoogleMailError,
     MailOperationError,
 )
+from app.connectors.sources.google.common.discovery import build_service
 from app.connectors.sources.google.common.google_token_handler import CredentialKeys
 from app.connectors.sources.google.common.scopes import (
     GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES,
@@ -137,7 +138,7 @@ class GmailUserService:
                 )
 
             try:
-                self.service = build("gmail", "v1", credentials=creds)
+                self.service = build_service("gmail", "v1", credentials=creds)
                 self.logger.debug("Self Gmail Service: %s", self.service)
             except Exception as e:
                 raise MailOperationError(
@@ -190,7 +191,7 @@ class GmailUserService:
                 scopes=GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES,
             )
 
-            self.service = build("gmail", "v1", credentials=creds)
+            self.service = build_service("gmail", "v1", credentials=creds)
             self.logger.debug("Self Gmail Service: %s", self.service)
             # Update token expiry time
             self.token_expiry = datetime.fromtimestamp(
@@ -209,8 +210,8 @@ class GmailUserService:
             self.org_id = org_id
             self.user_id = user_id
             try:
-                self.service = build(
-                    "gmail", "v1", credentials=self.credentials, cache_discovery=False
+                self.service = build_service(
+                    "gmail", "v1", credentials=self.credentials
                 )
                 self.logger.debug("Self Gmail Service: %s", self.service)
             except Exception as e:
@@ -266,7 +267,9 @@ class GmailUserService:
             self.logger.info("🚀 Getting individual user info")
             try:
                 async with self.google_limiter:
-                    user = self.service.users().getProfile(userId="me").execute()
+                    user = await asyncio.to_thread(
+                        self.service.users().getProfile(userId="me").execute
+                    )
             except HttpError as e:
                 if e.resp.status == HttpStatusCode.FORBIDDEN.value:
                     raise GoogleAuthError(
@@ -324,11 +327,11 @@ class GmailUserService:
             while True:
                 try:
                     async with self.google_limiter:
-                        results = (
+                        results = await asyncio.to_thread(
                             self.service.users()
                             .messages()
                             .list(userId="me", pageToken=page_token, q=query)
-                            .execute()
+                            .execute
                         )
                 except HttpError as e:
                     if e.resp.status == HttpStatusCode.FORBIDDEN.value:
@@ -418,11 +421,11 @@ class GmailUserService:
 
         try:
             try:
-                message = (
+                message = await asyncio.to_thread(
                     self.service.users()
                     .messages()
                     .get(userId="me", id=message_id, format="full")
-                    .execute()
+                    .execute
                 )
                 self.logger.debug("📝 Message: %s", message)
             except HttpError as e:
@@ -501,11 +504,11 @@ class GmailUserService:
             while True:
                 try:
                     async with self.google_limiter:
-                        results = (
+                        results = await asyncio.to_thread(
                             self.service.users()
                             .threads()
                             .list(userId="me", pageToken=page_token, q=query)
-                            .execute()
+                            .execute
                         )
                 except HttpError as e:
                     if e.resp.status == HttpStatusCode.FORBIDDEN.value:
@@ -752,10 +755,10 @@ class GmailUserService:
             try:
                 async with self.google_limiter:
                     request_body = {"topicName": topic, "labelIds": ["INBOX", "SENT"]}
-                    response = (
+                    response = await asyncio.to_thread(
                         self.service.users()
                         .watch(userId=user_id, body=request_body)
-                        .execute()
+                        .execute
                     )
                     response["expiration"] = int(response["expiration"])
             except HttpError as e:
@@ -795,7 +798,7 @@ class GmailUserService:
         """Stop user watch"""
         try:
             self.logger.info("🚀 Stopping user watch for user %s", user_id)
-            self.service.users().stop(userId=user_id).execute()
+            await asyncio.to_thread(self.service.users().stop(userId=user_id).execute)
             self.logger.info("✅ User watch stopped successfully for %s", user_id)
             return True
         except Exception as e:
@@ -822,7 +825,7 @@ class GmailUserService:
             try:
                 async with self.google_limiter:
                     # Fetch both inbox and sent changes
-                    inbox_response = (
+                    inbox_response = await asyncio.to_thread(
                         self.service.users()
                         .history()
                         .list(
@@ -831,11 +834,11 @@ class GmailUserService:
                             labelId="INBOX",
                             historyTypes=["messageAdded", "messageDeleted", "labelAdded"],
                         )
-                        .execute()
+                        .execute
                     )
                     self.logger.info(f"Inbox response: {inbox_response}")
 
-                    sent_response = (
+                    sent_response = await asyncio.to_thread(
                         self.service.users()
                         .history()
                         .list(
@@ -844,7 +847,7 @@ class GmailUserService:
                             labelId="SENT",
                             historyTypes=["messageAdded", "messageDeleted", "labelAdded"],
                         )
-                        .execute()
+                        .execute
                     )
                     self.logger.info(f"Sent response: {sent_response}")
 
@@ -920,11 +923,11 @@ class GmailUserService:
 
             self.logger.info(f"🔍 Fetching message: {message_id} to get attachment ID for part: {part_id}")
 
-            message = (
+            message = await asyncio.to_thread(
                 self.service.users()
                 .messages()
                 .get(userId=user_id, id=message_id, format="full")
-                .execute()
+                .execute
             )
 
             if not message or "payload" not in message:
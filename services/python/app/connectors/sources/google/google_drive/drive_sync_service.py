@@ -732,17 +732,18 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
 
             # Create relationships between users and groups in belongsTo collection
             belongs_to_group_relations = []
+            members_by_group = await self.drive_admin_service.batch_list_group_members(
+                [group["email"] for group in groups]
+            )
             for group in groups:
                 try:
-                    group_members = await self.drive_admin_service.list_group_members(
-                        group["email"]
-                    )
+                    group_members = members_by_group.get(group["email"], [])
                     for member in group_members:
                         matching_user = next(
                             (
                                 user
                                 for user in enterprise_users
-                                if user["email"] == member["email"]
+                                if user["email"] == member.email
                             ),
                             None,
                         )
@@ -760,7 +761,7 @@ class DriveSyncEnterpriseService(BaseDriveSyncService):
                                     "_from": f"{CollectionNames.USERS.value}/{matching_user['_key']}",
                                     "_to": f"{CollectionNames.GROUPS.value}/{group['_key']}",
                                     "entityType": "GROUP",
-                                    "role": member.get("role", "member"),
+                                    "role": member.role,
                                 }
                                 belongs_to_group_relations.append(relation)
                 except Exception as e:
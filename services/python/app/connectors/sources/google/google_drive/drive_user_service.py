@@ -6,7 +6,6 @@ from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import google.oauth2.credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import BatchHttpRequest
 
@@ -32,6 +31,7 @@ from app.connectors.sources.google.common.connector_google_exceptions import (
     GoogleAuthError,
     GoogleDriveError,
 )
+from app.connectors.sources.google.common.discovery import build_service
 from app.connectors.sources.google.common.google_token_handler import CredentialKeys
 from app.connectors.sources.google.common.scopes import (
     GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES,
@@ -115,7 +115,7 @@ class DriveUserService:
             )
 
             try:
-                self.service = build("drive", "v3", credentials=creds)
+                self.service = build_service("drive", "v3", credentials=creds)
                 self.logger.debug("Self Drive Service: %s", self.service)
             except Exception as e:
                 raise DriveOperationError(
@@ -167,7 +167,7 @@ class DriveUserService:
                 scopes=GOOGLE_CONNECTOR_INDIVIDUAL_SCOPES,
             )
 
-            self.service = build("drive", "v3", credentials=creds)
+            self.service = build_service("drive", "v3", credentials=creds)
             self.logger.debug("Self Drive Service: %s", self.service)
 
             # Update token expiry time
@@ -183,9 +183,7 @@ class DriveUserService:
             self.org_id = org_id
             self.user_id = user_id
 
-            self.service = build(
-                "drive", "v3", credentials=self.credentials, cache_discovery=False
-            )
+            self.service = build_service("drive", "v3", credentials=self.credentials)
             self.logger.debug("Self Drive Service: %s", self.service)
             return True
 
@@ -221,7 +219,9 @@ class DriveUserService:
         try:
             self.logger.info("🚀 Getting individual user info")
             async with self.google_limiter:
-                about = self.service.about().get(fields="user").execute()
+                about = await asyncio.to_thread(
+                    self.service.about().get(fields="user").execute
+                )
 
                 user = about.get("user", {})
                 self.logger.info("🚀 User info: %s", user)
@@ -272,7 +272,7 @@ class DriveUserService:
                 while True:
                     try:
                         async with self.google_limiter:
-                            response = (
+                            response = await asyncio.to_thread(
                                 self.service.files()
                                 .list(
                                     q=f"'{current_folder}' in parents and trashed=false",
@@ -283,7 +283,7 @@ class DriveUserService:
                                     supportsAllDrives=True,
                                     includeItemsFromAllDrives=True,
                                 )
-                                .execute()
+                                .execute
                             )
                     except HttpError as e:
                         if e.resp.status == HttpStatusCode.FORBIDDEN.value:
@@ -336,14 +336,14 @@ class DriveUserService:
 
                 while True:
                     try:
-                        response = (
+                        response = await asyncio.to_thread(
                             self.service.drives()
                             .list(
                                 pageSize=100,
                                 fields="nextPageToken, drives(id, name, kind)",
                                 pageToken=page_token,
                             )
-                            .execute()
+                            .execute
                         )
                     except HttpError as e:
                         if e.resp.status == HttpStatusCode.FORBIDDEN.value:
@@ -444,7 +444,7 @@ class DriveUserService:
                 }
 
                 try:
-                    response = (
+                    response = await asyncio.to_thread(
                         self.service.changes()
                         .watch(
                             pageToken=page_token,
@@ -453,7 +453,7 @@ class DriveUserService:
                             includeItemsFromAllDrives=True,
                             includeRemoved=True,
                         )
-                        .execute()
+                        .execute
                     )
                     self.logger.info(
                         "🚀 Changes watch created successfully: %s", response
@@ -500,9 +500,11 @@ class DriveUserService:
                 self.logger.warning("⚠️ No channel ID or resource ID to stop")
                 return True
 
-            self.service.channels().stop(
-                body={"id": channel_id, "resourceId": resource_id}
-            ).execute()
+            await asyncio.to_thread(
+                self.service.channels()
+                .stop(body={"id": channel_id, "resourceId": resource_id})
+                .execute
+            )
             self.logger.info("✅ Changes watch stopped successfully")
             return True
         except Exception as e:
@@ -525,7 +527,7 @@ class DriveUserService:
             while next_token:
                 try:
                     async with self.google_limiter:
-                        response = (
+                        response = await asyncio.to_thread(
                             self.service.changes()
                             .list(
                                 pageToken=next_token,
@@ -534,7 +536,7 @@ class DriveUserService:
                                 supportsAllDrives=True,
                                 fields="changes/*, nextPageToken, newStartPageToken",
                             )
-                            .execute()
+                            .execute
                         )
                 except HttpError as e:
                     if e.resp.status == HttpStatusCode.NOT_FOUND.value:  # Invalid page token
@@ -587,10 +589,10 @@ class DriveUserService:
             self.logger.info("🚀 Getting start page token")
             async with self.google_limiter:
                 try:
-                    response = (
+                    response = await asyncio.to_thread(
                         self.service.changes()
                         .getStartPageToken(supportsAllDrives=True)
-                        .execute()
+                        .execute
                     )
                 except HttpError as e:
                     if e.resp.status == HttpStatusCode.FORBIDDEN.value:
@@ -740,14 +742,14 @@ class DriveUserService:
                     and result.get("mimeType") != MimeTypes.GOOGLE_DRIVE_FOLDER.value
                 ):
                     try:
-                        revisions = (
+                        revisions = await asyncio.to_thread(
                             self.service.revisions()
                             .list(
                                 fileId=file_id,
                                 fields="revisions(id, modifiedTime)",
                                 pageSize=10,
                             )
-                            .execute()
+                            .execute
                         )
 
                         revisions_list = revisions.get("revisions", [])
@@ -809,10 +811,10 @@ class DriveUserService:
         try:
             if drive_id == "root":
                 try:
-                    response = (
+                    response = await asyncio.to_thread(
                         self.service.files()
                         .get(fileId="root", supportsAllDrives=True)
-                        .execute()
+                        .execute
                     )
                 except HttpError as e:
                     if e.resp.status == HttpStatusCode.FORBIDDEN.value:
@@ -858,12 +860,12 @@ class DriveUserService:
                 }
             else:
                 try:
-                    response = (
+                    response = await asyncio.to_thread(
                         self.service.drives()
                         .get(
                             driveId=drive_id, fields="id,name,capabilities,createdTime"
                         )
-                        .execute()
+                        .execute
                     )
                 except HttpError as e:
                     if e.resp.status == HttpStatusCode.FORBIDDEN.value:
@@ -933,7 +935,7 @@ class DriveUserService:
 
             try:
                 async with self.google_limiter:
-                    response = (
+                    response = await asyncio.to_thread(
                         self.service.files()
                         .list(
                             q="sharedWithMe=true",
@@ -942,7 +944,7 @@ class DriveUserService:
                             supportsAllDrives=True,
                             includeItemsFromAllDrives=True,
                         )
-                        .execute()
+                        .execute
                     )
             except HttpError as e:
                 if e.resp.status == HttpStatusCode.FORBIDDEN.value:
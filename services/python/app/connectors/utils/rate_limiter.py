@@ -1,21 +1,48 @@
 # src/workers/rate_limiter.py
+from typing import Dict
+
 from aiolimiter import AsyncLimiter
 
 
 class GoogleAPIRateLimiter:
-    """Rate limiter for Google Drive API"""
+    """Rate limiter for Google APIs
+
+    A single instance is shared through the connector container, so the
+    Drive, Gmail, Calendar and parser user services all draw from the same
+    google_limiter token bucket. AsyncLimiter lets bursts up to the bucket
+    capacity through at once and only throttles at the sustained rate.
+    """
 
     def __init__(self, max_rate: int = 6000):
         """
         Initialize rate limiter with Google's default quota
 
         Args:
-            max_rate (int): Maximum requests per 100 seconds (default: 10000)
+            max_rate (int): Maximum requests per 100 seconds (default: 6000)
                           Based on Google Drive API quotas
         """
-        # Single limiter for all Drive API operations
+        # Single bucket for all user-service API operations
         # Converting max_rate to per-second rate
         self.google_limiter = AsyncLimiter(max_rate / 100, 1)  # requests per second
+        self.max_rate = max_rate
+        self._api_limiters: Dict[str, AsyncLimiter] = {}
+
+    def limiter_for(self, api: str) -> AsyncLimiter:
+        """
+        Get the limiter for a single Google API
+
+        Google enforces quotas per API, so APIs such as the Admin Directory
+        and Reports APIs get their own bucket instead of queueing behind
+        each other on the shared google_limiter.
+
+        Args:
+            api (str): Name of the API, e.g. "admin.directory"
+        """
+        limiter = self._api_limiters.get(api)
+        if limiter is None:
+            limiter = AsyncLimiter(self.max_rate / 100, 1)
+            self._api_limiters[api] = limiter
+        return limiter
 
     async def __aenter__(self):
         await self.google_limiter.acquire()
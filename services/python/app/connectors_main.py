@@ -1,9 +1,10 @@
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, List
 
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -21,6 +22,13 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 container = AppContainer()
 
+# Sync states picked up again on startup
+RESUMABLE_SYNC_STATES = ("IN_PROGRESS", "PAUSED", "FAILED")
+# Users whose sync is resumed at the same time on startup
+RESUME_SYNC_CONCURRENCY = 16
+# Threads for blocking Google API calls run through asyncio.to_thread
+GOOGLE_API_WORKERS = 64
+
 
 async def get_initialized_container() -> AppContainer:
     """Dependency provider for initialized container"""
@@ -41,6 +49,57 @@ async def get_initialized_container() -> AppContainer:
     return container
 
 
+async def _resume_user_syncs(
+    logger,
+    label: str,
+    sync_service,
+    users: List[Dict],
+    org_id: str,
+    user_type: str,
+    concurrency: int = RESUME_SYNC_CONCURRENCY,
+) -> None:
+    """Resume one service's sync for the given users of an org, at most
+    concurrency users at a time"""
+    if not users or not sync_service:
+        return
+
+    logger.info("Resuming %s sync for %d users in org %s", label, len(users), org_id)
+
+    if user_type != AccountType.ENTERPRISE.value:
+        # Individual accounts sync the whole org in one call
+        try:
+            await sync_service.perform_initial_sync(org_id)
+            logger.info("✅ Resumed %s sync for org %s", label, org_id)
+        except Exception as e:
+            logger.error(
+                "❌ Error resuming %s sync for org %s: %s", label, org_id, str(e)
+            )
+        return
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def resume_user(user: Dict) -> None:
+        async with semaphore:
+            try:
+                await sync_service.sync_specific_user(user["email"])
+                logger.info(
+                    "✅ Resumed %s sync for user %s in org %s",
+                    label,
+                    user["email"],
+                    org_id,
+                )
+            except Exception as e:
+                logger.error(
+                    "❌ Error resuming %s sync for user %s in org %s: %s",
+                    label,
+                    user["email"],
+                    org_id,
+                    str(e),
+                )
+
+    await asyncio.gather(*(resume_user(user) for user in users))
+
+
 async def resume_sync_services(app_container: AppContainer) -> None:
     """Resume sync services for users with active sync states"""
     logger = app_container.logger()
@@ -83,12 +142,42 @@ async def resume_sync_services(app_container: AppContainer) -> None:
 
             # Get users for this organization
             users = await arango_service.get_users(org_id, active=True)
-            logger.info(f"User: {users}")
+            logger.info("Found %d active users in org %s", len(users), org_id)
             if not users:
                 logger.info("No users found for organization %s", org_id)
                 continue
 
             logger.info("Found %d users for organization %s", len(users), org_id)
+            user_emails = [user["email"] for user in users]
+
+            # Sort users by Drive and Gmail sync state
+            drive_states = await arango_service.get_user_sync_states(
+                user_emails, Connectors.GOOGLE_DRIVE.value
+            )
+            gmail_states = await arango_service.get_user_sync_states(
+                user_emails, Connectors.GOOGLE_MAIL.value
+            )
+            drive_user_states = [
+                drive_states.get(email, "NOT_STARTED") for email in user_emails
+            ]
+            gmail_user_states = [
+                gmail_states.get(email, "NOT_STARTED") for email in user_emails
+            ]
+            drive_sync_needed = [
+                user
+                for user, state in zip(users, drive_user_states)
+                if state in RESUMABLE_SYNC_STATES
+            ]
+            gmail_sync_needed = [
+                user
+                for user, state in zip(users, gmail_user_states)
+                if state in RESUMABLE_SYNC_STATES
+            ]
+
+            # initialize() lists the whole directory and renews watches; skip it
+            # when no user has a sync to resume or keep up to date
+            drive_service_needed = bool(drive_sync_needed) or "COMPLETED" in drive_user_states
+            gmail_service_needed = bool(gmail_sync_needed) or "COMPLETED" in gmail_user_states
 
             enabled_apps = await arango_service.get_org_apps(org_id)
 
@@ -101,180 +190,43 @@ async def resume_sync_services(app_container: AppContainer) -> None:
                     continue
 
                 if app["name"] == Connectors.GOOGLE_DRIVE.value:
+                    if not drive_service_needed:
+                        logger.info("No Drive syncs to resume for org %s", org_id)
+                        continue
                     drive_sync_service = app_container.drive_sync_service()
                     await drive_sync_service.initialize(org_id)
                     logger.info("Drive Service initialized for org %s", org_id)
 
                 if app["name"] == Connectors.GOOGLE_MAIL.value:
+                    if not gmail_service_needed:
+                        logger.info("No Gmail syncs to resume for org %s", org_id)
+                        continue
                     gmail_sync_service = app_container.gmail_sync_service()
                     await gmail_sync_service.initialize(org_id)
                     logger.info("Gmail Service initialized for org %s", org_id)
 
-            # Check if Drive sync needs to be initialized
-            drive_service_needed = False
-            for user in users:
-                drive_state = (
-                    await arango_service.get_user_sync_state(
-                        user["email"], Connectors.GOOGLE_DRIVE.value
-                    )
-                    or {}
-                ).get("syncState", "NOT_STARTED")
-                if drive_state in ["COMPLETED", "IN_PROGRESS", "PAUSED", "FAILED"]:
-                    drive_service_needed = True
-                    logger.info(
-                        "Drive Service needed for org %s: %s",
-                        org_id,
-                        drive_service_needed,
-                    )
-                    break
-
-            # Initialize Drive sync if needed and collect users
-            drive_sync_needed = []
-            if drive_service_needed:
-                # Re-iterate to collect users needing sync
-                for user in users:
-                    drive_state = (
-                        await arango_service.get_user_sync_state(
-                            user["email"], Connectors.GOOGLE_DRIVE.value
-                        )
-                        or {}
-                    ).get("syncState", "NOT_STARTED")
-                    if drive_state in ["IN_PROGRESS", "PAUSED", "FAILED"]:
-                        logger.info(
-                            "User %s in org %s needs Drive sync (state: %s)",
-                            user["email"],
-                            org_id,
-                            drive_state,
-                        )
-                        drive_sync_needed.append(user)
-                    elif drive_state == "COMPLETED":
-                        if drive_sync_service:
-                            logger.info(
-                                "Drive sync is already completed for user %s",
-                                user["email"],
-                            )
-                            await drive_sync_service.perform_initial_sync(
-                                org_id, action="resume"
-                            )
-
-            # Check if Gmail sync needs to be initialized
-            gmail_service_needed = False
-            for user in users:
-                gmail_state = (
-                    await arango_service.get_user_sync_state(
-                        user["email"], Connectors.GOOGLE_MAIL.value
-                    )
-                    or {}
-                ).get("syncState", "NOT_STARTED")
-                if gmail_state in ["COMPLETED", "IN_PROGRESS", "PAUSED", "FAILED"]:
-                    gmail_service_needed = True
-                    logger.info(
-                        "Gmail Service needed for org %s: %s",
-                        org_id,
-                        gmail_service_needed,
-                    )
-                    break
-
-            # Initialize Gmail sync if needed and collect users
-            gmail_sync_needed = []
-            if gmail_service_needed:
-                # Re-iterate to collect users needing sync
-                for user in users:
-                    gmail_state = (
-                        await arango_service.get_user_sync_state(
-                            user["email"], Connectors.GOOGLE_MAIL.value
-                        )
-                        or {}
-                    ).get("syncState", "NOT_STARTED")
-                    if gmail_state in ["IN_PROGRESS", "PAUSED", "FAILED"]:
-                        logger.info(
-                            "User %s in org %s needs Gmail sync (state: %s)",
-                            user["email"],
-                            org_id,
-                            gmail_state,
-                        )
-                        gmail_sync_needed.append(user)
-                    elif gmail_state == "COMPLETED":
-                        if gmail_sync_service:
-                            logger.info(
-                                "Gmail sync is already completed for user %s",
-                                user["email"],
-                            )
-                            await gmail_sync_service.perform_initial_sync(
-                                org_id, action="resume"
-                            )
-
-            # Resume Drive syncs if needed
-            if drive_sync_needed:
-                logger.info(
-                    "Resuming Drive sync for %d users in org %s",
-                    len(drive_sync_needed),
-                    org_id,
-                )
-
-                for user in drive_sync_needed:
-                    if drive_sync_service:
-                        try:
-                            if user_type == AccountType.ENTERPRISE.value or user_type == AccountType.BUSINESS.value:
-                                await drive_sync_service.sync_specific_user(
-                                    user["email"]
-                                )
-                                logger.info(
-                                    "✅ Resumed Drive sync for user %s in org %s",
-                                    user["email"],
-                                    org_id,
-                                )
-                            else:  # individual
-                                # Start sync
-                                await drive_sync_service.perform_initial_sync(org_id)
-                                logger.info(
-                                    "✅ Resumed Drive sync for user %s in org %s",
-                                    user["email"],
-                                    org_id,
-                                )
-                        except Exception as e:
-                            logger.error(
-                                "❌ Error resuming Drive sync for user %s in org %s: %s",
-                                user["email"],
-                                org_id,
-                                str(e),
-                            )
-
-            # Resume Gmail syncs if needed
-            if gmail_sync_needed:
-                logger.info(
-                    "Resuming Gmail sync for %d users in org %s",
-                    len(gmail_sync_needed),
-                    org_id,
-                )
-
-                for user in gmail_sync_needed:
-                    if gmail_sync_service:
-                        try:
-                            if user_type == AccountType.ENTERPRISE.value or user_type == AccountType.BUSINESS.value:
-                                await gmail_sync_service.sync_specific_user(
-                                    user["email"]
-                                )
-                                logger.info(
-                                    "✅ Resumed Gmail sync for user %s in org %s",
-                                    user["email"],
-                                    org_id,
-                                )
-                            else:  # individual
-                                # Start sync
-                                await gmail_sync_service.perform_initial_sync(org_id)
-                                logger.info(
-                                    "✅ Resumed Gmail sync for user %s in org %s",
-                                    user["email"],
-                                    org_id,
-                                )
-                        except Exception as e:
-                            logger.error(
-                                "❌ Error resuming Gmail sync for user %s in org %s: %s",
-                                user["email"],
-                                org_id,
-                                str(e),
-                            )
+            # perform_initial_sync resumes the whole org, so run it once
+            if drive_sync_service and "COMPLETED" in drive_user_states:
+                logger.info("Drive sync is already completed for users in org %s", org_id)
+                await drive_sync_service.perform_initial_sync(org_id, action="resume")
+            if gmail_sync_service and "COMPLETED" in gmail_user_states:
+                logger.info("Gmail sync is already completed for users in org %s", org_id)
+                await gmail_sync_service.perform_initial_sync(org_id, action="resume")
+
+            # Resume Drive and Gmail syncs if needed. Drive keeps the current
+            # user's workers on the service instance, so its users go one at a time
+            await _resume_user_syncs(
+                logger,
+                "Drive",
+                drive_sync_service,
+                drive_sync_needed,
+                org_id,
+                user_type,
+                concurrency=1,
+            )
+            await _resume_user_syncs(
+                logger, "Gmail", gmail_sync_service, gmail_sync_needed, org_id, user_type
+            )
 
     except Exception as e:
         logger.error("❌ Error during sync service resumption: %s", str(e))
@@ -283,6 +235,10 @@ async def resume_sync_services(app_container: AppContainer) -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for FastAPI"""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=GOOGLE_API_WORKERS)
+    )
+
     # Initialize container
     app_container = await get_initialized_container()
     app.container = app_container
@@ -294,26 +250,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger = app_container.logger()
     logger.debug("🚀 Starting application")
 
-    # Define the routes that Kafka consumer should handle
-    kafka_routes = [
-        "/drive/{org_id}",
-        "/gmail/{org_id}",
-        "/drive/{org_id}/sync/start",
-        "/drive/{org_id}/sync/pause",
-        "/drive/{org_id}/sync/resume",
-        "/gmail/{org_id}/sync/start",
-        "/gmail/{org_id}/sync/pause",
-        "/gmail/{org_id}/sync/resume",
-        "/drive/sync/user/{user_email}",
-        "/gmail/sync/user/{user_email}",
-    ]
-
     # Kafka Consumer - pass the app_container
     kafka_consumer = EntityKafkaRouteConsumer(
         logger=logger,
         config_service=app.container.config_service(),
         arango_service=await app.container.arango_service(),
-        routes=kafka_routes,  # Pass the list of route patterns
         app_container=app.container,
     )
 
@@ -357,7 +298,6 @@ app = FastAPI(
     description="Service for syncing Google Drive content to ArangoDB",
     version="1.0.0",
     lifespan=lifespan,
-    dependencies=[Depends(get_initialized_container)],
 )
 
 # List of paths to apply authentication to
@@ -367,7 +307,7 @@ INCLUDE_PATHS = ["/api/v1/stream/record/", "/api/v1/delete/"]
 @app.middleware("http")
 async def authenticate_requests(request: Request, call_next)-> JSONResponse:
     logger = app.container.logger()
-    logger.info(f"Middleware request: {request.url.path}")
+    logger.info("Middleware request: %s", request.url.path)
     # Apply middleware only to specific paths
     if not any(request.url.path.startswith(path) for path in INCLUDE_PATHS):
         # Skip authentication for other paths
@@ -448,6 +388,9 @@ def run(host: str = "0.0.0.0", port: int = 8088, workers: int = 1, reload: bool
         log_level="info",
         reload=reload,
         workers=workers,
+        # uvloop and httptools for the IO-bound sync workload
+        loop="auto" if reload else "uvloop",
+        http="httptools",
     )
 
 
@@ -1,6 +1,7 @@
 """ArangoDB service for interacting with the database"""
 
 # pylint: disable=E1101, W0718
+import hashlib
 from typing import Dict, List, Optional
 
 from arango import ArangoClient
@@ -11,6 +12,11 @@ from app.config.utils.named_constants.arangodb_constants import CollectionNames
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
+def _name_key(name: str) -> str:
+    """Document key derived from a node name; hex is always a valid _key"""
+    return hashlib.blake2b(name.encode("utf-8"), digest_size=12).hexdigest()
+
+
 class ArangoService:
     """ArangoDB service for interacting with the database"""
 
@@ -22,6 +28,8 @@ class ArangoService:
         self.config_service = config
         self.client = arango_client
         self.db = None
+        # Edge collections known to carry the unique (_from, _to) index
+        self._unique_edge_collections = set()
 
     async def connect(self) -> bool:
         """Connect to ArangoDB and initialize collections"""
@@ -295,6 +303,67 @@ class ArangoService:
                 raise
             return False
 
+    async def update_node(self, key: str, fields: Dict, collection: str) -> bool:
+        """Set fields on an existing node without sending the whole document"""
+        try:
+            self.db.aql.execute(
+                "UPDATE @key WITH @fields IN @@collection",
+                bind_vars={"key": key, "fields": fields, "@collection": collection},
+            )
+            return True
+
+        except Exception as e:
+            self.logger.error("❌ Update of node %s failed: %s", key, str(e))
+            return False
+
+    async def get_or_create_named_nodes(
+        self, names: List[str], collection: str
+    ) -> Dict[str, str]:
+        """Resolve nodes by name in one query, creating any that are missing
+
+        New nodes get a key derived from their name, so concurrent writers
+        creating the same name converge on one node instead of racing.
+        Nodes created before that keep their random keys and are still
+        found by name.
+
+        Returns:
+            Dict[str, str]: Node name -> node key
+        """
+        if not names:
+            return {}
+        try:
+            query = """
+            LET existing = (
+                FOR doc IN @@collection
+                    FILTER doc.name IN @names
+                    RETURN { name: doc.name, key: doc._key }
+            )
+            LET created = (
+                FOR node IN @nodes
+                    FILTER node.name NOT IN existing[*].name
+                    INSERT node INTO @@collection OPTIONS { overwriteMode: "ignore" }
+                    RETURN { name: node.name, key: node._key }
+            )
+            FOR node IN APPEND(existing, created)
+                RETURN node
+            """
+            unique_names = list(dict.fromkeys(names))
+            nodes = [{"_key": _name_key(name), "name": name} for name in unique_names]
+            cursor = self.db.aql.execute(
+                query,
+                bind_vars={
+                    "names": unique_names,
+                    "nodes": nodes,
+                    "@collection": collection,
+                },
+            )
+            return {node["name"]: node["key"] for node in cursor}
+        except Exception as e:
+            self.logger.error(
+                "❌ Error resolving named nodes in %s: %s", collection, str(e)
+            )
+            raise
+
     async def batch_create_edges(
         self,
         edges: List[Dict],
@@ -329,6 +398,84 @@ class ArangoService:
             self.logger.error("❌ Batch edge creation failed: %s", str(e))
             return False
 
+    def _has_unique_edge_index(self, collection: str) -> bool:
+        """Whether the collection has the unique (_from, _to) index
+
+        Only a positive answer is cached: the index is built by the connector
+        service and may appear after this process first looks.
+        """
+        if collection in self._unique_edge_collections:
+            return True
+        has_index = any(
+            index.get("unique") and list(index.get("fields", [])) == ["_from", "_to"]
+            for index in self.db.collection(collection).indexes()
+        )
+        if has_index:
+            self._unique_edge_collections.add(collection)
+        return has_index
+
+    async def batch_insert_unique_edges(self, edges: Dict[str, List[Dict]]):
+        """Insert edges into several edge collections in one query, skipping
+        pairs that already exist
+
+        Collections with the unique (_from, _to) index insert with ignoreErrors
+        and let the index reject duplicates. The index fails to build when a
+        collection already holds duplicates, so collections without it fall
+        back to an UPSERT that probes for the pair first.
+
+        Args:
+            edges: Edge collection name -> edges to insert into it
+        """
+        # Drop repeated pairs within a batch; an UPSERT can't see rows
+        # inserted earlier in the same query
+        edges = {
+            collection: list(
+                {(edge["_from"], edge["_to"]): edge for edge in batch}.values()
+            )
+            for collection, batch in edges.items()
+            if batch
+        }
+        if not edges:
+            return True
+        try:
+            self.logger.info("🚀 Batch inserting edges: %s", list(edges))
+
+            # One insert subquery per collection; collections can't be bound
+            # per row, so each gets its own bind parameter pair
+            subqueries = []
+            bind_vars = {}
+            for i, (collection, batch) in enumerate(edges.items()):
+                if self._has_unique_edge_index(collection):
+                    subqueries.append(
+                        f"""LET inserted{i} = (
+                FOR edge IN @edges{i}
+                    INSERT edge INTO @@collection{i} OPTIONS {{ ignoreErrors: true }}
+            )"""
+                    )
+                else:
+                    self.logger.warning(
+                        "⚠️ No unique edge index on %s, probing before insert",
+                        collection,
+                    )
+                    subqueries.append(
+                        f"""LET inserted{i} = (
+                FOR edge IN @edges{i}
+                    UPSERT {{ _from: edge._from, _to: edge._to }}
+                    INSERT edge
+                    UPDATE {{}}
+                    IN @@collection{i}
+            )"""
+                    )
+                bind_vars[f"edges{i}"] = batch
+                bind_vars[f"@collection{i}"] = collection
+
+            batch_query = "\n".join(subqueries) + "\nRETURN true"
+            self.db.aql.execute(batch_query, bind_vars=bind_vars)
+            return True
+        except Exception as e:
+            self.logger.error("❌ Batch edge insert failed: %s", str(e))
+            return False
+
     async def get_user_by_user_id(self, user_id: str) -> Optional[Dict]:
         """Get user by user ID"""
         try:
@@ -356,10 +503,10 @@ class ArangoService:
         """
         query = f"""
             FOR department IN {CollectionNames.DEPARTMENTS.value}
-                FILTER department.orgId == null OR department.orgId == '{org_id}'
+                FILTER department.orgId == null OR department.orgId == @org_id
                 RETURN department.departmentName
         """
-        cursor = self.db.aql.execute(query)
+        cursor = self.db.aql.execute(query, bind_vars={"org_id": org_id})
         return list(cursor)
 
     async def find_duplicate_files(
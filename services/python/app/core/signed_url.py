@@ -1,10 +1,12 @@
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
 
 import jwt
+from cachetools import TTLCache
 from fastapi import HTTPException
-from jose import JWTError
-from pydantic import BaseModel, ValidationError
+from jwt.algorithms import get_default_algorithms
+from pydantic import BaseModel
 
 from app.config.configuration_service import (
     ConfigurationService,
@@ -12,8 +14,13 @@ from app.config.configuration_service import (
     config_node_constants,
 )
 
+# Retries and bursts minting the same plain URL within this window reuse it
+SIGNED_URL_CACHE_SIZE = 4096
+SIGNED_URL_CACHE_TTL_SECONDS = 60
 
-class SignedUrlConfig(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class SignedUrlConfig:
     private_key: str | None = None
     expiration_minutes: int = 60
     algorithm: str = "HS256"
@@ -36,8 +43,7 @@ class SignedUrlConfig(BaseModel):
         except Exception:
             raise
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    def __post_init__(self):
         if not self.private_key:
             raise ValueError(
                 "Private key must be provided through configuration or environment"
@@ -47,15 +53,10 @@ class SignedUrlConfig(BaseModel):
 class TokenPayload(BaseModel):
     record_id: str
     user_id: str
-    exp: datetime
-    iat: datetime
+    exp: float  # Epoch seconds, as carried in the token
+    iat: float
     additional_claims: Dict[str, Any] = {}
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.timestamp()  # Convert datetime to timestamp
-        }
-
 
 class SignedUrlHandler:
     def __init__(
@@ -68,6 +69,13 @@ class SignedUrlHandler:
         self.signed_url_config = config
         self.config_service = configuration_service
         self._validate_config()
+        self._signing_key, self._verification_key = self._prepare_keys()
+        self._expiration_seconds = self.signed_url_config.expiration_minutes * 60
+        self._endpoints = None
+        self._url_template = None
+        self._signed_urls = TTLCache(
+            maxsize=SIGNED_URL_CACHE_SIZE, ttl=SIGNED_URL_CACHE_TTL_SECONDS
+        )
 
     def _validate_config(self) -> None:
         """Validate handler configuration"""
@@ -76,6 +84,34 @@ class SignedUrlHandler:
         if self.signed_url_config.expiration_minutes <= 0:
             raise ValueError("Expiration minutes must be positive")
 
+    def _prepare_keys(self) -> Tuple[Any, Any]:
+        """Parse the private key once instead of on every encode and decode"""
+        algorithm = get_default_algorithms()[self.signed_url_config.algorithm]
+        signing_key = algorithm.prepare_key(self.signed_url_config.private_key)
+        # Asymmetric algorithms verify with the public half of the key
+        public_key = getattr(signing_key, "public_key", None)
+        return signing_key, public_key() if public_key else signing_key
+
+    async def _get_url_template(self) -> str:
+        """Signed URL template, rebuilt only when the endpoints config changes
+
+        get_config serves the endpoints node from ConfigurationService's
+        in-memory cache, which etcd watch events invalidate, so there is no
+        round trip to avoid here; a new config dict means the node changed.
+        """
+        endpoints = await self.config_service.get_config(
+            config_node_constants.ENDPOINTS.value
+        )
+        if endpoints is not self._endpoints:
+            connector_endpoint = endpoints.get("connectors").get(
+                "endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value
+            )
+            prefix = f"{connector_endpoint}{self.signed_url_config.url_prefix}"
+            # Filled with org_id, connector, record_id and token
+            self._url_template = prefix.replace("%", "%%") + "/%s/%s/record/%s?token=%s"
+            self._endpoints = endpoints
+        return self._url_template
+
     async def create_signed_url(
         self,
         record_id: str,
@@ -86,37 +122,36 @@ class SignedUrlHandler:
     ) -> str:
         """Create a signed URL with optional additional claims"""
         try:
-            expiration = datetime.now(
-                timezone(timedelta(hours=5, minutes=30))
-            ) + timedelta(minutes=self.signed_url_config.expiration_minutes)
+            url_template = await self._get_url_template()
 
-            endpoints = await self.config_service.get_config(
-                config_node_constants.ENDPOINTS.value
+            # Per-request claims make every URL unique, so only plain ones are cached
+            cache_key = (
+                None
+                if additional_claims
+                else (url_template, org_id, connector, record_id, user_id)
             )
-            connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
+            if cache_key is not None:
+                signed_url = self._signed_urls.get(cache_key)
+                if signed_url is not None:
+                    return signed_url
 
-            self.logger.info(f"user_id: {user_id}")
+            issued_at = time.time()
+            expiration = issued_at + self._expiration_seconds
 
-            payload = TokenPayload(
-                record_id=record_id,
-                user_id=user_id,
-                exp=expiration,
-                iat=datetime.utcnow(),
-                additional_claims=additional_claims or {},
-            )
+            self.logger.debug("user_id: %s", user_id)
 
-            # Convert to dict before encoding
+            # Built directly; every field is produced here, nothing to validate
             payload_dict = {
                 "record_id": record_id,  # Ensure file_id is at the top level
                 "user_id": user_id,
-                "exp": payload.exp.timestamp(),  # Convert datetime to timestamp
-                "iat": payload.iat.timestamp(),
+                "exp": expiration,
+                "iat": issued_at,
                 "additional_claims": additional_claims or {},
             }
 
             token = jwt.encode(
                 payload_dict,
-                self.signed_url_config.private_key,
+                self._signing_key,
                 algorithm=self.signed_url_config.algorithm,
             )
 
@@ -126,11 +161,11 @@ class SignedUrlHandler:
                 connector,
             )
 
-            return f"{connector_endpoint}{self.signed_url_config.url_prefix}/{org_id}/{connector}/record/{record_id}?token={token}"
+            signed_url = url_template % (org_id, connector, record_id, token)
+            if cache_key is not None:
+                self._signed_urls[cache_key] = signed_url
+            return signed_url
 
-        except ValidationError as e:
-            self.logger.error("Payload validation error: %s", str(e))
-            raise HTTPException(status_code=400, detail="Invalid payload data")
         except Exception as e:
             self.logger.error("Error creating signed URL: %s", str(e))
             raise HTTPException(status_code=500, detail="Error creating signed URL")
@@ -140,38 +175,33 @@ class SignedUrlHandler:
     ) -> TokenPayload:
         """Validate the JWT token and optional required claims"""
         try:
-            self.logger.info(f"Validating token: {token}")
+            self.logger.debug("Validating token of length %d", len(token))
             payload = jwt.decode(
                 token,
-                self.signed_url_config.private_key,
+                self._verification_key,
                 algorithms=[self.signed_url_config.algorithm],
+                options={"require": ["exp", "iat", "record_id", "user_id"]},
             )
-            self.logger.info(f"Payload: {payload}")
-
-            # Convert timestamps back to datetime for validation
-            if "exp" in payload:
-                payload["exp"] = datetime.fromtimestamp(payload["exp"])
-            if "iat" in payload:
-                payload["iat"] = datetime.fromtimestamp(payload["iat"])
-
-            token_data = TokenPayload(**payload)
-            self.logger.info(f"Token data: {token_data}")
+            self.logger.debug("Token claims: %s", list(payload))
 
             if required_claims:
+                additional_claims = payload.get("additional_claims") or {}
                 for key, value in required_claims.items():
-                    if token_data.additional_claims.get(key) != value:
+                    if additional_claims.get(key) != value:
                         raise HTTPException(
                             status_code=401, detail=f"Required claim '{key}' is invalid"
                         )
 
+            # jwt.decode checked the signature, expiry and required claims
+            token_data = TokenPayload.model_construct(**payload)
+
             return token_data
 
-        except JWTError as e:
+        except HTTPException:
+            raise
+        except jwt.PyJWTError as e:
             self.logger.error("JWT validation error: %s", str(e))
             raise HTTPException(status_code=401, detail="Invalid or expired token")
-        except ValidationError as e:
-            self.logger.error("Payload validation error: %s", str(e))
-            raise HTTPException(status_code=400, detail="Invalid token payload")
         except Exception as e:
             self.logger.error("Unexpected error during token validation: %s", str(e))
             raise HTTPException(status_code=500, detail="Error validating token")
@@ -1,6 +1,7 @@
 import asyncio
 import hashlib
 import json
+import os
 from io import BytesIO
 from uuid import uuid4
 
@@ -15,8 +16,44 @@ from app.config.utils.named_constants.arangodb_constants import (
     RecordTypes,
 )
 from app.config.utils.named_constants.http_status_code_constants import HttpStatusCode
+from app.utils.batcher import MicroBatcher
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Extension -> (processor method, keyword argument taking the file content)
+EXTENSION_HANDLERS = {
+    ExtensionTypes.PDF.value: ("process_pdf_document", "pdf_binary"),
+    ExtensionTypes.DOCX.value: ("process_docx_document", "docx_binary"),
+    ExtensionTypes.DOC.value: ("process_doc_document", "doc_binary"),
+    ExtensionTypes.XLSX.value: ("process_excel_document", "excel_binary"),
+    ExtensionTypes.XLS.value: ("process_xls_document", "xls_binary"),
+    ExtensionTypes.CSV.value: ("process_csv_document", "csv_binary"),
+    ExtensionTypes.HTML.value: ("process_html_document", "html_content"),
+    ExtensionTypes.PPTX.value: ("process_pptx_document", "pptx_binary"),
+    ExtensionTypes.PPT.value: ("process_ppt_document", "ppt_binary"),
+    ExtensionTypes.MD.value: ("process_md_document", "md_binary"),
+    ExtensionTypes.MDX.value: ("process_mdx_document", "mdx_content"),
+    ExtensionTypes.TXT.value: ("process_txt_document", "txt_binary"),
+}
+
+# Enum values checked on every event, resolved once at import
+NEW_RECORD_EVENT = EventTypes.NEW_RECORD.value
+REEMBED_EVENTS = frozenset(
+    (EventTypes.REINDEX_RECORD.value, EventTypes.UPDATE_RECORD.value)
+)
+RECORDS_COLLECTION = CollectionNames.RECORDS.value
+FILE_RECORD_TYPE = RecordTypes.FILE.value
+
+# Signed URL downloads all go to the connector service; keep its
+# connections alive between events instead of a handshake per download
+DOWNLOAD_CONNECTION_LIMIT = 100
+DOWNLOAD_CONNECTIONS_PER_HOST = 20
+DOWNLOAD_KEEPALIVE_SECONDS = 75
+
+# Status flips from concurrent events are written together: a flush goes out
+# once this many are pending or the oldest has waited this long
+STATUS_BATCH_SIZE = 64
+STATUS_FLUSH_INTERVAL_SECONDS = 0.01
+
 
 class EventProcessor:
     def __init__(self, logger, processor, arango_service) -> None:
@@ -24,17 +61,65 @@ class EventProcessor:
         self.logger.info("🚀 Initializing EventProcessor")
         self.processor = processor
         self.arango_service = arango_service
+        self._session: aiohttp.ClientSession | None = None
+        self._status_batcher = MicroBatcher(
+            self._write_status_batch, STATUS_BATCH_SIZE, STATUS_FLUSH_INTERVAL_SECONDS
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared download session, created on first use inside the event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=DOWNLOAD_CONNECTION_LIMIT,
+                    limit_per_host=DOWNLOAD_CONNECTIONS_PER_HOST,
+                    keepalive_timeout=DOWNLOAD_KEEPALIVE_SECONDS,
+                )
+            )
+        return self._session
+
+    async def update_status(self, record_id: str, fields: dict) -> bool:
+        """
+        Queue a status change for a record and wait for the batch holding it
+        to be written
+
+        Returns:
+            bool: Whether the batch upsert succeeded
+        """
+        return await self._status_batcher.submit((record_id, fields))
+
+    async def _write_status_batch(self, changes: list) -> list:
+        """Write a batch of status changes in one upsert"""
+        # One node per record so the upsert never sees a key twice
+        nodes = {}
+        for record_id, fields in changes:
+            nodes.setdefault(record_id, {"_key": record_id}).update(fields)
+
+        try:
+            success = await self.arango_service.batch_upsert_nodes(
+                list(nodes.values()), RECORDS_COLLECTION
+            )
+        except Exception as e:
+            self.logger.error("❌ Error flushing status updates: %s", str(e))
+            success = False
+        return [success] * len(changes)
+
+    async def close(self) -> None:
+        """Stop the status writer and close the shared download session"""
+        await self._status_batcher.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def _download_from_signed_url(
-        self, signed_url: str, record_id: str, doc: dict
+        self, signed_url: str, record_id: str
     ) -> bytes:
         """
         Download file from signed URL with exponential backoff retry
 
         Args:
             signed_url: The signed URL to download from
-            record_id: Record ID for logging
-            doc: Document object for status updates
+            record_id: Record ID for logging and status updates
 
         Returns:
             bytes: The downloaded file content
@@ -53,51 +138,55 @@ class EventProcessor:
             delay = base_delay * (2**attempt)  # Exponential backoff
             file_buffer = BytesIO()
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    try:
-                        async with session.get(signed_url) as response:
-                            if response.status != HttpStatusCode.SUCCESS.value:
-                                raise aiohttp.ClientError(
-                                    f"Failed to download file: {response.status}"
-                                )
-
-                            content_length = response.headers.get("Content-Length")
-                            if content_length:
-                                self.logger.info(
-                                    f"Expected file size: {int(content_length) / (1024*1024):.2f} MB"
-                                )
-
-                            last_logged_size = 0
-                            total_size = 0
-                            log_interval = chunk_size
-
-                            self.logger.info("Starting chunked download...")
-                            try:
-                                async for chunk in response.content.iter_chunked(
-                                    chunk_size
-                                ):
-                                    file_buffer.write(chunk)
-                                    total_size += len(chunk)
-                                    if total_size - last_logged_size >= log_interval:
-                                        self.logger.debug(
-                                            f"Total size so far: {total_size / (1024*1024):.2f} MB"
-                                        )
-                                        last_logged_size = total_size
-                            except IOError as io_err:
-                                raise aiohttp.ClientError(
-                                    f"IO error during chunk download: {str(io_err)}"
-                                )
+                session = self._get_session()
+                try:
+                    async with session.get(signed_url, timeout=timeout) as response:
+                        if response.status != HttpStatusCode.SUCCESS.value:
+                            raise aiohttp.ClientError(
+                                f"Failed to download file: {response.status}"
+                            )
 
-                            file_content = file_buffer.getvalue()
+                        content_length = response.headers.get("Content-Length")
+                        if content_length:
                             self.logger.info(
-                                f"✅ Download complete. Total size: {total_size / (1024*1024):.2f} MB"
+                                "Expected file size: %.2f MB",
+                                int(content_length) / (1024 * 1024),
+                            )
+
+                        last_logged_size = 0
+                        total_size = 0
+                        log_interval = chunk_size
+
+                        self.logger.info("Starting chunked download...")
+                        try:
+                            async for chunk in response.content.iter_chunked(
+                                chunk_size
+                            ):
+                                file_buffer.write(chunk)
+                                total_size += len(chunk)
+                                if total_size - last_logged_size >= log_interval:
+                                    self.logger.debug(
+                                        "Total size so far: %.2f MB",
+                                        total_size / (1024 * 1024),
+                                    )
+                                    last_logged_size = total_size
+                        except IOError as io_err:
+                            raise aiohttp.ClientError(
+                                f"IO error during chunk download: {str(io_err)}"
                             )
-                            return file_content
 
-                    except aiohttp.ServerDisconnectedError as sde:
-                        raise aiohttp.ClientError(f"Server disconnected: {str(sde)}")
-                    except aiohttp.ClientConnectorError as cce:
-                        raise aiohttp.ClientError(f"Connection error: {str(cce)}")
+                        # getvalue() hands over the buffer without copying it
+                        file_content = file_buffer.getvalue()
+                        self.logger.info(
+                            "✅ Download complete. Total size: %.2f MB",
+                            total_size / (1024 * 1024),
+                        )
+                        return file_content
+
+                except aiohttp.ServerDisconnectedError as sde:
+                    raise aiohttp.ClientError(f"Server disconnected: {str(sde)}")
+                except aiohttp.ClientConnectorError as cce:
+                    raise aiohttp.ClientError(f"Connection error: {str(cce)}")
 
             except (aiohttp.ClientError, asyncio.TimeoutError, IOError) as e:
                 error_type = type(e).__name__
@@ -111,7 +200,8 @@ class EventProcessor:
                         f"❌ All download attempts failed for record {record_id}. "
                         f"Error type: {error_type}, Details: {repr(e)}"
                     )
-                    doc.update(
+                    await self.arango_service.update_node(
+                        record_id,
                         {
                             "indexingStatus": ProgressStatus.FAILED.value,
                             "extractionStatus": ProgressStatus.FAILED.value,
@@ -119,10 +209,8 @@ class EventProcessor:
                                 f"Download failed after {max_retries} attempts. "
                                 f"Error: {error_type} - {str(e)}. File id: {record_id}"
                             ),
-                        }
-                    )
-                    await self.arango_service.batch_upsert_nodes(
-                        [doc], CollectionNames.RECORDS.value
+                        },
+                        RECORDS_COLLECTION,
                     )
                     raise Exception(
                         f"Download failed after {max_retries} attempts. "
@@ -150,7 +238,7 @@ class EventProcessor:
         try:
             # Extract event type and record ID
             event_type = event_data.get(
-                "eventType", EventTypes.NEW_RECORD.value
+                "eventType", NEW_RECORD_EVENT
             )  # default to create
             event_data = event_data.get("payload")
             record_id = event_data.get("recordId")
@@ -164,7 +252,7 @@ class EventProcessor:
                 return
 
             # For both create and update events, we need to process the document
-            if event_type == EventTypes.REINDEX_RECORD.value or event_type == EventTypes.UPDATE_RECORD.value:
+            if event_type in REEMBED_EVENTS:
                 # For updates, first delete existing embeddings
                 self.logger.info(
                     f"""🔄 Updating record {record_id} - deleting existing embeddings"""
@@ -176,12 +264,12 @@ class EventProcessor:
 
             # Update indexing status to IN_PROGRESS
             record = await self.arango_service.get_document(
-                record_id, CollectionNames.RECORDS.value
+                record_id, RECORDS_COLLECTION
             )
             if record is None:
                 self.logger.error(f"❌ Record {record_id} not found in database")
                 return
-            doc = dict(record)
+            doc = record
 
             # Extract necessary data
             record_version = event_data.get("version", 0)
@@ -191,7 +279,7 @@ class EventProcessor:
             mime_type = event_data.get("mimeType", "unknown")
 
             if extension is None and mime_type != "text/gmail_content":
-                extension = event_data["recordName"].split(".")[-1]
+                extension = os.path.splitext(event_data["recordName"])[1][1:].lower()
 
             if mime_type == "text/gmail_content":
                 self.logger.info("🚀 Processing Gmail Message")
@@ -210,7 +298,7 @@ class EventProcessor:
             if signed_url:
                 self.logger.debug("Signed URL received")
                 file_content = await self._download_from_signed_url(
-                    signed_url, record_id, doc
+                    signed_url, record_id
                 )
             else:
                 file_content = event_data.get("buffer")
@@ -218,20 +306,24 @@ class EventProcessor:
             self.logger.debug(f"file_content type: {type(file_content)}")
 
             record_type = doc.get("recordType")
-            if record_type == RecordTypes.FILE.value:
+            if record_type == FILE_RECORD_TYPE:
                 try:
                     file = await self.arango_service.get_document(
                         record_id, CollectionNames.FILES.value
                     )
-                    file_doc = dict(file)
+                    file_doc = file
 
                     md5_checksum = file_doc.get("md5Checksum")
                     size_in_bytes = file_doc.get("sizeInBytes")
                     if md5_checksum is None:
                         md5_checksum = hashlib.md5(file_content).hexdigest()
-                        file_doc.update({"md5Checksum": md5_checksum})
+                        file_doc["md5Checksum"] = md5_checksum
                         self.logger.info(f"🚀 Calculated md5_checksum: {md5_checksum}")
-                        await self.arango_service.batch_upsert_nodes([file_doc], CollectionNames.FILES.value)
+                        await self.arango_service.update_node(
+                            file_doc["_key"],
+                            {"md5Checksum": md5_checksum},
+                            CollectionNames.FILES.value,
+                        )
 
                     # Add indexingStatus to initial duplicate check to find in-progress files
                     duplicate_files = await self.arango_service.find_duplicate_files(file_doc.get('_key'), md5_checksum, size_in_bytes)
@@ -245,16 +337,19 @@ class EventProcessor:
 
                             if processed_duplicate:
                                 # Use data from processed duplicate
-                                doc.update({
-                                    "isDirty": False,
-                                    "summaryDocumentId": processed_duplicate.get("summaryDocumentId"),
-                                    "virtualRecordId": processed_duplicate.get("virtualRecordId"),
-                                    "indexingStatus": ProgressStatus.COMPLETED.value,
-                                    "lastIndexTimestamp": get_epoch_timestamp_in_ms(),
-                                    "extractionStatus": ProgressStatus.COMPLETED.value,
-                                    "lastExtractionTimestamp": get_epoch_timestamp_in_ms(),
-                                })
-                                await self.arango_service.batch_upsert_nodes([doc], CollectionNames.RECORDS.value)
+                                await self.arango_service.update_node(
+                                    doc["_key"],
+                                    {
+                                        "isDirty": False,
+                                        "summaryDocumentId": processed_duplicate.get("summaryDocumentId"),
+                                        "virtualRecordId": processed_duplicate.get("virtualRecordId"),
+                                        "indexingStatus": ProgressStatus.COMPLETED.value,
+                                        "lastIndexTimestamp": get_epoch_timestamp_in_ms(),
+                                        "extractionStatus": ProgressStatus.COMPLETED.value,
+                                        "lastExtractionTimestamp": get_epoch_timestamp_in_ms(),
+                                    },
+                                    RECORDS_COLLECTION,
+                                )
 
                                 # Copy all relationships from the processed duplicate to this document
                                 await self.arango_service.copy_document_relationships(
@@ -336,137 +431,19 @@ class EventProcessor:
                 )
                 return result
 
-            if extension == ExtensionTypes.PDF.value:
-                result = await self.processor.process_pdf_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    pdf_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.DOCX.value:
-                result = await self.processor.process_docx_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    docx_binary=BytesIO(file_content),
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.DOC.value:
-                result = await self.processor.process_doc_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    doc_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-            elif extension == ExtensionTypes.XLSX.value:
-                result = await self.processor.process_excel_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    excel_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-            elif extension == ExtensionTypes.XLS.value:
-                result = await self.processor.process_xls_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    xls_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-            elif extension == ExtensionTypes.CSV.value:
-                result = await self.processor.process_csv_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    csv_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.HTML.value:
-                result = await self.processor.process_html_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    html_content=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.PPTX.value:
-                result = await self.processor.process_pptx_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    pptx_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.PPT.value:
-                result = await self.processor.process_ppt_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    ppt_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.MD.value:
-                result = await self.processor.process_md_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    md_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.MDX.value:
-                result = await self.processor.process_mdx_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    mdx_content=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            elif extension == ExtensionTypes.TXT.value:
-                result = await self.processor.process_txt_document(
-                    recordName=f"Record-{record_id}",
-                    recordId=record_id,
-                    version=record_version,
-                    source=connector,
-                    orgId=org_id,
-                    txt_binary=file_content,
-                    virtual_record_id = virtual_record_id
-                )
-
-            else:
+            handler = EXTENSION_HANDLERS.get(extension)
+            if handler is None:
                 raise Exception(f"Unsupported file extension: {extension}")
+            method_name, content_kwarg = handler
+            result = await getattr(self.processor, method_name)(
+                recordName=f"Record-{record_id}",
+                recordId=record_id,
+                version=record_version,
+                source=connector,
+                orgId=org_id,
+                virtual_record_id=virtual_record_id,
+                **{content_kwarg: file_content},
+            )
 
             self.logger.info(
                 f"✅ Successfully processed document for record {record_id}"
@@ -49,6 +49,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except asyncio.CancelledError:
         logger.info("Kafka consumer task cancelled")
 
+    event_processor = await container.event_processor()
+    await event_processor.close()
+
 
 app = FastAPI(
     lifespan=lifespan,
@@ -2,6 +2,8 @@
 import asyncio
 from typing import Any
 
+from jinja2 import Template
+
 from app.config.utils.named_constants.arangodb_constants import (
     AccountType,
     CollectionNames,
@@ -14,6 +16,13 @@ from app.modules.retrieval.retrieval_service import RetrievalService
 from app.utils.citations import process_citations
 from app.utils.query_transform import setup_query_transformation
 
+qna_template = Template(qna_prompt)
+
+SYSTEM_MESSAGE = {"role": "system", "content": "You are an enterprise questions answering expert"}
+
+# Maps stored conversation roles to LLM message roles
+CONVERSATION_ROLES = {"user_query": "user", "bot_response": "assistant"}
+
 
 # 1. Decomposition Node (FIXED - made async compatible)
 async def decompose_query_node(
@@ -41,7 +50,7 @@ async def decompose_query_node(
         else:
             state["decomposed_queries"] = decomposed_queries
 
-        logger.debug(f"decomposed_queries {state['decomposed_queries']}")
+        logger.debug("decomposed_queries %s", state['decomposed_queries'])
         return state
     except Exception as e:
         logger.error(f"Error in decomposition node: {str(e)}", exc_info=True)
@@ -58,35 +67,26 @@ async def transform_query_node(
     try:
         rewrite_chain, expansion_chain = setup_query_transformation(llm)
 
-        transformed_queries = []
-        expanded_queries_set = set()
-
-        for query_dict in state["decomposed_queries"]:
-            query = query_dict.get("query")
-
-            # Run query transformations in parallel
-            rewritten_query, expanded_queries = await asyncio.gather(
-                rewrite_chain.ainvoke(query), expansion_chain.ainvoke(query)
-            )
-
-            # Process rewritten query
-            if rewritten_query.strip():
-                transformed_queries.append(rewritten_query.strip())
+        queries = [query_dict.get("query") for query_dict in state["decomposed_queries"]]
 
-            # Process expanded queries
-            expanded_queries_list = [q.strip() for q in expanded_queries.split("\n") if q.strip()]
-            for q in expanded_queries_list:
-                if q.lower() not in expanded_queries_set:
-                    expanded_queries_set.add(q.lower())
-                    transformed_queries.append(q)
+        # Run every rewrite and expansion concurrently in a single round-trip
+        results = await asyncio.gather(
+            *(rewrite_chain.ainvoke(query) for query in queries),
+            *(expansion_chain.ainvoke(query) for query in queries),
+        )
+        rewritten_queries = results[:len(queries)]
+        expanded_queries_results = results[len(queries):]
 
-        # Remove duplicates while preserving order
+        # Single order-preserving, case-insensitive dedup across all subqueries
         unique_queries = []
         seen = set()
-        for q in transformed_queries:
-            if q.lower() not in seen:
-                seen.add(q.lower())
-                unique_queries.append(q)
+        for rewritten_query, expanded_queries in zip(rewritten_queries, expanded_queries_results):
+            for q in (rewritten_query, *expanded_queries.split("\n")):
+                q = q.strip()
+                key = q.lower()
+                if q and key not in seen:
+                    seen.add(key)
+                    unique_queries.append(q)
 
         state["rewritten_queries"] = unique_queries
         return state
@@ -130,7 +130,7 @@ async def retrieve_documents_node(
             return state
 
         search_results = results.get("searchResults", [])
-        logger.debug(f"Retrieved {len(search_results)} documents")
+        logger.debug("Retrieved %s documents", len(search_results))
 
         state["search_results"] = search_results
         return state
@@ -195,7 +195,7 @@ async def rerank_results_node(
         else:
             final_results = flattened_results
 
-        logger.debug(f"Final reranked results: {len(final_results)} documents")
+        logger.debug("Final reranked results: %s documents", len(final_results))
         state["final_results"] = final_results
         return state
     except Exception as e:
@@ -232,9 +232,7 @@ def prepare_prompt_node(
                     "Please provide accurate and relevant information based on the available context."
                 )
 
-        from jinja2 import Template
-        template = Template(qna_prompt)
-        rendered_prompt = template.render(
+        rendered_prompt = qna_template.render(
             user_data=user_data,
             query=state["query"],
             rephrased_queries=[],  # This keeps all query results for reference
@@ -242,16 +240,16 @@ def prepare_prompt_node(
         )
 
         # Add conversation history to the messages
-        messages = [{"role": "system", "content": "You are an enterprise questions answering expert"}]
-
-        for conversation in state["previous_conversations"]:
-            if conversation.get("role") == "user_query":
-                messages.append({"role": "user", "content": conversation.get("content")})
-            elif conversation.get("role") == "bot_response":
-                messages.append({"role": "assistant", "content": conversation.get("content")})
-
-        # Add current query with context
-        messages.append({"role": "user", "content": rendered_prompt})
+        messages = [
+            SYSTEM_MESSAGE,
+            *(
+                {"role": CONVERSATION_ROLES[conversation["role"]], "content": conversation.get("content")}
+                for conversation in state["previous_conversations"]
+                if conversation.get("role") in CONVERSATION_ROLES
+            ),
+            # Add current query with context
+            {"role": "user", "content": rendered_prompt},
+        ]
 
         state["messages"] = messages
         return state
@@ -273,8 +271,10 @@ async def generate_answer_node(
 
         # Make async LLM call
         response = await llm.ainvoke(state["messages"])
-        # Process citations
-        processed_response = process_citations(response, state["final_results"])
+        # Process citations off the event loop; the JSON repair is CPU-bound
+        processed_response = await asyncio.to_thread(
+            process_citations, response, state["final_results"]
+        )
 
         state["response"] = processed_response
         return state
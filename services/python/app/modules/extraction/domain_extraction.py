@@ -1,17 +1,18 @@
+import asyncio
 import json
-import uuid
-from typing import List, Literal
+import os
+from functools import lru_cache
+from typing import List, Literal, Tuple
 
 import aiohttp
 import jwt
 import numpy as np
 from langchain.output_parsers import PydanticOutputParser
-from langchain.prompts import PromptTemplate
-from langchain.schema import AIMessage, HumanMessage
+from langchain.schema import AIMessage, HumanMessage, SystemMessage
+from langchain_anthropic import ChatAnthropic
 from pydantic import BaseModel, Field
-from sklearn.decomposition import LatentDirichletAllocation
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import load_npz, save_npz, vstack
+from sklearn.feature_extraction.text import HashingVectorizer
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -30,12 +31,51 @@ from app.config.utils.named_constants.arangodb_constants import (
 )
 from app.config.utils.named_constants.http_status_code_constants import HttpStatusCode
 from app.modules.extraction.prompt_template import prompt
+from app.utils.batcher import MicroBatcher
 from app.utils.llm import get_llm
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Width of the hashed term space used to compare topics
+TOPIC_HASH_FEATURES = 2**14
+# Where accepted topics survive restarts: hashed rows as CSR, labels as JSON
+TOPICS_STORE_DIR = os.getenv("TOPICS_STORE_DIR", os.path.join("data", "topics"))
+TOPIC_MATRIX_FILE = "topics.npz"
+TOPIC_LABELS_FILE = "topics.json"
+# Upper bound on classification requests sent to the LLM together
+EXTRACTION_BATCH_SIZE = 16
+# How long the first queued classification waits for others to join its batch
+EXTRACTION_BATCH_WAIT_SECONDS = 0.05
+
 # Update the Literal types
 SentimentType = Literal["Positive", "Neutral", "Negative"]
 
+# Number of distinct department lists whose prompt halves are kept
+PROMPT_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=PROMPT_CACHE_SIZE)
+def _split_prompt(department_list: str) -> Tuple[str, str]:
+    """
+    Fill the extraction prompt for a department list and split it around the
+    document content. The instructions before the content are identical for
+    every document of an org, so they can be served from the provider's
+    prompt cache.
+
+    Returns:
+        (instructions, trailer): the text before and after {content}
+    """
+    sentiment_list = "\n".join(
+        f'     - "{sentiment}"' for sentiment in SentimentType.__args__
+    )
+    filled_prompt = prompt.replace("{department_list}", department_list).replace(
+        "{sentiment_list}", sentiment_list
+    )
+    instructions, trailer = filled_prompt.split("{content}", 1)
+    # Undo the template's brace escaping, as PromptTemplate.format would
+    return tuple(
+        part.replace("{{", "{").replace("}}", "}") for part in (instructions, trailer)
+    )
+
 
 class SubCategories(BaseModel):
     level1: str = Field(description="Level 1 subcategory")
@@ -76,14 +116,30 @@ class DomainExtractor:
 
         # Initialize topics storage
         self.topics_store = set()  # Store all accepted topics
-
-        # Initialize TF-IDF vectorizer for topic similarity
-        self.vectorizer = TfidfVectorizer(stop_words="english")
-        self.similarity_threshold = 0.65  # Adjusted for TF-IDF similarity
-
-        # Initialize LDA model as backup
-        self.lda = LatentDirichletAllocation(
-            n_components=10, random_state=42  # Adjust based on your needs
+        # Accepted topics in insertion order, one per row of _topic_matrix
+        self._topics_list: List[str] = []
+        self._topic_matrix = None
+        # Background write of the topics to disk, and whether another is due
+        self._topic_save_task = None
+        self._topics_dirty = False
+
+        # Stateless hashing vectorizer: topics are vectorized once, never refit.
+        # Rows are L2-normalised, so a dot product is the cosine similarity
+        self.vectorizer = HashingVectorizer(
+            n_features=TOPIC_HASH_FEATURES,
+            norm="l2",
+            alternate_sign=False,
+            stop_words="english",
+        )
+        self.similarity_threshold = 0.65
+        self._load_topics()
+
+        # Classification requests waiting to be sent to the LLM in one batch
+        self._extraction_batcher = MicroBatcher(
+            self._run_extraction_batch,
+            EXTRACTION_BATCH_SIZE,
+            EXTRACTION_BATCH_WAIT_SECONDS,
+            overlap_batches=True,
         )
 
         # Configure retry parameters
@@ -102,82 +158,173 @@ class DomainExtractor:
         """Wrapper for LLM calls with retry logic"""
         return await self.llm.ainvoke(messages)
 
-    async def find_similar_topics(self, new_topic: str) -> str:
+    async def _classify(self, llm, messages) -> DocumentClassification:
         """
-        Find if a similar topic already exists in the topics store using TF-IDF similarity.
-        Returns the existing topic if a match is found, otherwise returns the new topic.
+        Queue a classification request and wait for the batch holding it
+
+        Raises:
+            NotImplementedError: If the model has no structured output support
         """
-        # First check exact matches
-        if new_topic in self.topics_store:
-            return new_topic
+        return await self._extraction_batcher.submit((llm, messages))
 
-        # If no topics exist yet, return the new topic
-        if not self.topics_store:
-            return new_topic
+    async def _run_extraction_batch(self, batch) -> list:
+        """
+        Send one batch per LLM client through a single abatch call. A failed
+        request yields its exception without failing the rest of the batch
+        """
+        results = [None] * len(batch)
+        groups = {}
+        for position, (llm, messages) in enumerate(batch):
+            groups.setdefault(id(llm), (llm, []))[1].append((position, messages))
 
-        try:
-            # Convert topics to TF-IDF vectors
-            all_topics = list(self.topics_store) + [new_topic]
-            tfidf_matrix = self.vectorizer.fit_transform(all_topics)
-
-            # Calculate cosine similarity between new topic and existing topics
-            # Get the last row (new topic)
-            new_topic_vector = tfidf_matrix[-1:]
-            # Get all but the last row
-            existing_topics_matrix = tfidf_matrix[:-1]
-
-            similarities = cosine_similarity(new_topic_vector, existing_topics_matrix)[
-                0
-            ]
+        for llm, requests in groups.values():
+            try:
+                structured_llm = llm.with_structured_output(DocumentClassification)
+                outputs = await structured_llm.abatch(
+                    [messages for _, messages in requests], return_exceptions=True
+                )
+            except Exception as e:
+                outputs = [e] * len(requests)
 
-            # Find the most similar topic
-            max_similarity_idx = np.argmax(similarities)
-            max_similarity = similarities[max_similarity_idx]
+            for (position, _), output in zip(requests, outputs):
+                results[position] = output
+        return results
 
-            if max_similarity >= self.similarity_threshold:
-                return list(self.topics_store)[max_similarity_idx]
+    def _load_topics(self) -> None:
+        """Restore the accepted topics saved by a previous run, if any"""
+        matrix_path = os.path.join(TOPICS_STORE_DIR, TOPIC_MATRIX_FILE)
+        labels_path = os.path.join(TOPICS_STORE_DIR, TOPIC_LABELS_FILE)
+        if not (os.path.exists(matrix_path) and os.path.exists(labels_path)):
+            return
 
-            # If TF-IDF similarity is low, try LDA as backup
-            if max_similarity < self.similarity_threshold:
-                try:
-                    # Fit LDA on all topics
-                    dtm = self.vectorizer.fit_transform(all_topics)
-                    topic_distributions = self.lda.fit_transform(dtm)
+        try:
+            matrix = load_npz(matrix_path).tocsr()
+            with open(labels_path, encoding="utf-8") as f:
+                topics = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not load saved topics: {str(e)}")
+            return
 
-                    # Compare topic distributions
-                    new_topic_dist = topic_distributions[-1]
-                    existing_topics_dist = topic_distributions[:-1]
+        if matrix.shape != (len(topics), TOPIC_HASH_FEATURES):
+            self.logger.warning("⚠️ Saved topics do not match the vectorizer, ignoring")
+            return
 
-                    # Calculate Jensen-Shannon divergence or cosine similarity
-                    lda_similarities = cosine_similarity(
-                        [new_topic_dist], existing_topics_dist
-                    )[0]
-                    max_lda_sim_idx = np.argmax(lda_similarities)
-                    max_lda_similarity = lda_similarities[max_lda_sim_idx]
+        self._topic_matrix = matrix
+        self._topics_list = topics
+        self.topics_store = set(topics)
+        self.logger.info(f"✅ Loaded {len(topics)} saved topics")
 
-                    if max_lda_similarity >= self.similarity_threshold:
-                        return list(self.topics_store)[max_lda_sim_idx]
+    def _schedule_topic_save(self) -> None:
+        """Persist the topics without blocking the event loop
 
-                except Exception as e:
-                    self.logger.error(f"❌ Error in LDA similarity check: {str(e)}")
+        Changes made while a write is running are picked up by one follow-up
+        write instead of queueing one write per change.
+        """
+        self._topics_dirty = True
+        if self._topic_save_task is not None and not self._topic_save_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called outside the event loop, nothing to block
+            self._topics_dirty = False
+            self._save_topics(self._topic_matrix, list(self._topics_list))
+            return
+        self._topic_save_task = loop.create_task(self._flush_topics())
+
+    async def _flush_topics(self) -> None:
+        """Write the topics in a worker thread until no change is pending"""
+        while self._topics_dirty:
+            self._topics_dirty = False
+            # The matrix is replaced, never mutated, on each change; copy the
+            # labels so the thread sees rows and labels that agree
+            await asyncio.to_thread(
+                self._save_topics, self._topic_matrix, list(self._topics_list)
+            )
 
+    def _save_topics(self, matrix, topics: List[str]) -> None:
+        """Write the accepted topics to disk, replacing the files atomically"""
+        matrix_path = os.path.join(TOPICS_STORE_DIR, TOPIC_MATRIX_FILE)
+        labels_path = os.path.join(TOPICS_STORE_DIR, TOPIC_LABELS_FILE)
+        try:
+            os.makedirs(TOPICS_STORE_DIR, exist_ok=True)
+            # save_npz appends .npz to names that lack it
+            save_npz(matrix_path + ".tmp.npz", matrix, compressed=False)
+            with open(labels_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(topics, f)
+            os.replace(matrix_path + ".tmp.npz", matrix_path)
+            os.replace(labels_path + ".tmp", labels_path)
         except Exception as e:
-            self.logger.error(f"❌ Error in topic similarity check: {str(e)}")
-
-        return new_topic
+            self.logger.warning(f"⚠️ Could not save topics: {str(e)}")
 
-    async def process_new_topics(self, new_topics: List[str]) -> List[str]:
+    def process_new_topics(self, new_topics: List[str]) -> List[str]:
         """
         Process new topics against existing topics store.
         Returns list of topics, using existing ones where matches are found.
+
+        The whole batch is vectorized in one transform and scored against the
+        accepted topics, and against itself, with one sparse product each.
         """
+        if not new_topics:
+            return []
+
+        try:
+            new_matrix = self.vectorizer.transform(new_topics)
+            # Rows are L2-normalised, so these products are cosine similarities.
+            # Only the best existing match per row is needed, so take it from the
+            # sparse product instead of densifying a batch x N array
+            existing_best = None
+            if self._topic_matrix is not None:
+                existing_similarities = (new_matrix @ self._topic_matrix.T).tocsr()
+                existing_best = (
+                    np.asarray(existing_similarities.argmax(axis=1)).ravel(),
+                    existing_similarities.max(axis=1).toarray().ravel(),
+                )
+            batch_similarities = (new_matrix @ new_matrix.T).toarray()
+        except Exception as e:
+            self.logger.error(f"❌ Error in topic similarity check: {str(e)}")
+            return list(set(new_topics))
+
         processed_topics = []
-        for topic in new_topics:
-            matched_topic = await self.find_similar_topics(topic)
-            processed_topics.append(matched_topic)
-            # Only add to topics_store if it's a new topic
-            if matched_topic == topic:  # This means no match was found
-                self.topics_store.add(topic)
+        accepted_rows = []  # Rows of new_matrix accepted as new topics
+        accepted_topics = set()
+        for row, topic in enumerate(new_topics):
+            # First check exact matches
+            if topic in self.topics_store or topic in accepted_topics:
+                processed_topics.append(topic)
+                continue
+
+            best_topic, best_similarity = topic, 0.0
+            if existing_best is not None:
+                best_topic = self._topics_list[int(existing_best[0][row])]
+                best_similarity = existing_best[1][row]
+
+            # Topics accepted earlier in this batch are candidates too
+            if accepted_rows:
+                similarities = batch_similarities[row, accepted_rows]
+                idx = int(np.argmax(similarities))
+                if similarities[idx] > best_similarity:
+                    best_topic = new_topics[accepted_rows[idx]]
+                    best_similarity = similarities[idx]
+
+            if best_similarity >= self.similarity_threshold:
+                processed_topics.append(best_topic)
+            else:
+                accepted_rows.append(row)
+                accepted_topics.add(topic)
+                processed_topics.append(topic)
+
+        if accepted_rows:
+            accepted_matrix = new_matrix[accepted_rows]
+            if self._topic_matrix is None:
+                self._topic_matrix = accepted_matrix
+            else:
+                self._topic_matrix = vstack(
+                    [self._topic_matrix, accepted_matrix], format="csr"
+                )
+            self._topics_list.extend(new_topics[row] for row in accepted_rows)
+            self.topics_store.update(accepted_topics)
+            self._schedule_topic_save()
 
         return list(set(processed_topics))
 
@@ -189,7 +336,8 @@ class DomainExtractor:
         Includes reflection logic to attempt recovery from parsing failures.
         """
         self.logger.info("🎯 Extracting domain metadata")
-        self.llm = await get_llm(self.logger, self.config_service)
+        llm = await get_llm(self.logger, self.config_service)
+        self.llm = llm
 
         try:
             self.logger.info(f"🎯 Extracting departments for org_id: {org_id}")
@@ -199,21 +347,39 @@ class DomainExtractor:
 
             # Format department list for the prompt
             department_list = "\n".join(f'     - "{dept}"' for dept in departments)
+            instructions, trailer = _split_prompt(department_list)
 
-            # Format sentiment list for the prompt
-            sentiment_list = "\n".join(
-                f'     - "{sentiment}"' for sentiment in SentimentType.__args__
-            )
-
-            filled_prompt = prompt.replace(
-                "{department_list}", department_list
-            ).replace("{sentiment_list}", sentiment_list)
-            self.prompt_template = PromptTemplate.from_template(filled_prompt)
-
-            formatted_prompt = self.prompt_template.format(content=content)
+            # Static instructions go first, in their own message, so repeated
+            # extractions share a cacheable prompt prefix
+            if isinstance(llm, ChatAnthropic):
+                system_message = SystemMessage(
+                    content=[
+                        {
+                            "type": "text",
+                            "text": instructions,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ]
+                )
+            else:
+                system_message = SystemMessage(content=instructions)
+            messages = [system_message, HumanMessage(content=content + trailer)]
             self.logger.info("🎯 Prompt formatted successfully")
 
-            messages = [HumanMessage(content=formatted_prompt)]
+            # Prefer the provider's native structured output: the SDK returns a
+            # validated DocumentClassification, with no fence stripping or parse.
+            # Concurrent extractions are batched into one call per LLM client
+            try:
+                parsed_response = await self._classify(llm, messages)
+                if isinstance(parsed_response, DocumentClassification):
+                    return parsed_response
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                self.logger.warning(
+                    f"⚠️ Structured output failed, falling back to parsing: {str(e)}"
+                )
+
             # Use retry wrapper for LLM call
             response = await self._call_llm(messages)
 
@@ -257,7 +423,7 @@ class DomainExtractor:
                     """
 
                     reflection_messages = [
-                        HumanMessage(content=formatted_prompt),
+                        *messages,
                         AIMessage(content=response_text),
                         HumanMessage(content=reflection_prompt),
                     ]
@@ -279,7 +445,7 @@ class DomainExtractor:
                     parsed_reflection = self.parser.parse(reflection_text)
 
                     # Process topics through similarity check
-                    canonical_topics = await self.process_new_topics(
+                    canonical_topics = self.process_new_topics(
                         parsed_reflection.topics
                     )
                     parsed_reflection.topics = canonical_topics
@@ -315,258 +481,80 @@ class DomainExtractor:
                 record_id, CollectionNames.RECORDS.value
             )
             doc = dict(record)
-            # Create relationships with departments
-            for department in metadata.departments:
-                try:
-                    dept_query = f"FOR d IN {CollectionNames.DEPARTMENTS.value} FILTER d.departmentName == @department RETURN d"
-                    cursor = self.arango_service.db.aql.execute(
-                        dept_query, bind_vars={"department": department}
-                    )
-                    dept_doc = cursor.next()
-                    self.logger.info(f"🚀 Department: {dept_doc}")
-
-                    if dept_doc:
-                        edge = {
-                            "_from": f"{CollectionNames.RECORDS.value}/{record_id}",
-                            "_to": f"{CollectionNames.DEPARTMENTS.value}/{dept_doc['_key']}",
-                            "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                        }
-                        await self.arango_service.batch_create_edges(
-                            [edge], CollectionNames.BELONGS_TO_DEPARTMENT.value
-                        )
-                        self.logger.info(
-                            f"🔗 Created relationship between document {record_id} and department {department}"
-                        )
-
-                except StopIteration:
-                    self.logger.warning(f"⚠️ No department found for: {department}")
-                    continue
-                except Exception as e:
-                    self.logger.error(
-                        f"❌ Error creating relationship with department {department}: {str(e)}"
-                    )
-                    continue
+            record_node = f"{CollectionNames.RECORDS.value}/{record_id}"
+            timestamp = get_epoch_timestamp_in_ms()
 
-            # Handle single category
-            category_query = f"FOR c IN {CollectionNames.CATEGORIES.value} FILTER c.name == @name RETURN c"
-            cursor = self.arango_service.db.aql.execute(
-                category_query, bind_vars={"name": metadata.categories}
-            )
-            try:
-                category_doc = cursor.next()
-                if category_doc is None:
-                    raise KeyError("No category found")
-                category_key = category_doc["_key"]
-            except (StopIteration, KeyError, TypeError):
-                category_key = str(uuid.uuid4())
-                self.arango_service.db.collection(
-                    CollectionNames.CATEGORIES.value
-                ).insert(
-                    {
-                        "_key": category_key,
-                        "name": metadata.categories,
-                    }
-                )
+            def record_edge(node: str) -> dict:
+                return {"_from": record_node, "_to": node, "createdAtTimestamp": timestamp}
 
-            # Create category relationship if it doesn't exist
-            edge_query = f"""
-            FOR e IN {CollectionNames.BELONGS_TO_CATEGORY.value}
-            FILTER e._from == @from AND e._to == @to
-            RETURN e
+            # Edges are collected per collection and written in one query at the end
+            edges = {}
+
+            # Departments are only linked, never created: resolve all in one query
+            dept_query = f"""
+            FOR d IN {CollectionNames.DEPARTMENTS.value}
+                FILTER d.departmentName IN @departments
+                RETURN {{ name: d.departmentName, key: d._key }}
             """
             cursor = self.arango_service.db.aql.execute(
-                edge_query,
-                bind_vars={
-                    "from": f"records/{record_id}",
-                    "to": f"categories/{category_key}",
-                },
-            )
-            if not cursor.count():
-                self.arango_service.db.collection(
-                    CollectionNames.BELONGS_TO_CATEGORY.value
-                ).insert(
-                    {
-                        "_from": f"{CollectionNames.RECORDS.value}/{record_id}",
-                        "_to": f"{CollectionNames.CATEGORIES.value}/{category_key}",
-                        "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                    }
-                )
-
-            # Handle subcategories with similar pattern
-            def handle_subcategory(name, level, parent_key, parent_collection) -> str:
-                collection_name = getattr(
-                    CollectionNames, f"SUBCATEGORIES{level}"
-                ).value
-                query = f"FOR s IN {collection_name} FILTER s.name == @name RETURN s"
-                cursor = self.arango_service.db.aql.execute(
-                    query, bind_vars={"name": name}
-                )
-                try:
-                    doc = cursor.next()
-                    if doc is None:
-                        raise KeyError("No subcategory found")
-                    key = doc["_key"]
-                except (StopIteration, KeyError, TypeError):
-                    key = str(uuid.uuid4())
-                    self.arango_service.db.collection(collection_name).insert(
-                        {
-                            "_key": key,
-                            "name": name,
-                        }
-                    )
-
-                # Create belongs_to relationship
-                edge_query = f"""
-                FOR e IN {CollectionNames.BELONGS_TO_CATEGORY.value}
-                FILTER e._from == @from AND e._to == @to
-                RETURN e
-                """
-                cursor = self.arango_service.db.aql.execute(
-                    edge_query,
-                    bind_vars={
-                        "from": f"{CollectionNames.RECORDS.value}/{record_id}",
-                        "to": f"{collection_name}/{key}",
-                    },
-                )
-                if not cursor.count():
-                    self.arango_service.db.collection(
-                        CollectionNames.BELONGS_TO_CATEGORY.value
-                    ).insert(
-                        {
-                            "_from": f"{CollectionNames.RECORDS.value}/{record_id}",
-                            "_to": f"{collection_name}/{key}",
-                            "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                        }
-                    )
-
-                # Create hierarchy relationship
-                if parent_key:
-                    edge_query = f"""
-                    FOR e IN {CollectionNames.INTER_CATEGORY_RELATIONS.value}
-                    FILTER e._from == @from AND e._to == @to
-                    RETURN e
-                    """
-                    cursor = self.arango_service.db.aql.execute(
-                        edge_query,
-                        bind_vars={
-                            "from": f"{collection_name}/{key}",
-                            "to": f"{parent_collection}/{parent_key}",
-                        },
-                    )
-                    if not cursor.count():
-                        self.arango_service.db.collection(
-                            CollectionNames.INTER_CATEGORY_RELATIONS.value
-                        ).insert(
-                            {
-                                "_from": f"{collection_name}/{key}",
-                                "_to": f"{parent_collection}/{parent_key}",
-                                "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                            }
-                        )
-                return key
-
-            # Process subcategories
-            sub1_key = handle_subcategory(
-                metadata.subcategories.level1, "1", category_key, "categories"
-            )
-            sub2_key = handle_subcategory(
-                metadata.subcategories.level2, "2", sub1_key, "subcategories1"
-            )
-            handle_subcategory(
-                metadata.subcategories.level3, "3", sub2_key, "subcategories2"
+                dept_query, bind_vars={"departments": metadata.departments}
             )
+            department_keys = {dept["name"]: dept["key"] for dept in cursor}
+            for department in metadata.departments:
+                if department not in department_keys:
+                    self.logger.warning(f"⚠️ No department found for: {department}")
+            edges[CollectionNames.BELONGS_TO_DEPARTMENT.value] = [
+                record_edge(f"{CollectionNames.DEPARTMENTS.value}/{key}")
+                for key in department_keys.values()
+            ]
 
-            # Handle languages
-            for language in metadata.languages:
-                query = f"FOR l IN {CollectionNames.LANGUAGES.value} FILTER l.name == @name RETURN l"
-                cursor = self.arango_service.db.aql.execute(
-                    query, bind_vars={"name": language}
-                )
-                try:
-                    lang_doc = cursor.next()
-                    if lang_doc is None:
-                        raise KeyError("No language found")
-                    lang_key = lang_doc["_key"]
-                except (StopIteration, KeyError, TypeError):
-                    lang_key = str(uuid.uuid4())
-                    self.arango_service.db.collection(
-                        CollectionNames.LANGUAGES.value
-                    ).insert(
-                        {
-                            "_key": lang_key,
-                            "name": language,
-                        }
-                    )
-
-                # Create relationship if it doesn't exist
-                edge_query = f"""
-                FOR e IN {CollectionNames.BELONGS_TO_LANGUAGE.value}
-                FILTER e._from == @from AND e._to == @to
-                RETURN e
-                """
-                cursor = self.arango_service.db.aql.execute(
-                    edge_query,
-                    bind_vars={
-                        "from": f"records/{record_id}",
-                        "to": f"languages/{lang_key}",
-                    },
+            # Category and its subcategory chain, one upsert query per level
+            category_edges = edges[CollectionNames.BELONGS_TO_CATEGORY.value] = []
+            hierarchy_edges = edges[CollectionNames.INTER_CATEGORY_RELATIONS.value] = []
+            parent_node = None
+            for collection_name, name in (
+                (CollectionNames.CATEGORIES.value, metadata.categories),
+                (CollectionNames.SUBCATEGORIES1.value, metadata.subcategories.level1),
+                (CollectionNames.SUBCATEGORIES2.value, metadata.subcategories.level2),
+                (CollectionNames.SUBCATEGORIES3.value, metadata.subcategories.level3),
+            ):
+                keys = await self.arango_service.get_or_create_named_nodes(
+                    [name], collection_name
                 )
-                if not cursor.count():
-                    self.arango_service.db.collection(
-                        CollectionNames.BELONGS_TO_LANGUAGE.value
-                    ).insert(
+                node = f"{collection_name}/{keys[name]}"
+                category_edges.append(record_edge(node))
+                if parent_node:
+                    hierarchy_edges.append(
                         {
-                            "_from": f"{CollectionNames.RECORDS.value}/{record_id}",
-                            "_to": f"{CollectionNames.LANGUAGES.value}/{lang_key}",
-                            "createdAtTimestamp": get_epoch_timestamp_in_ms(),
+                            "_from": node,
+                            "_to": parent_node,
+                            "createdAtTimestamp": timestamp,
                         }
                     )
-
-            # Handle topics
-            for topic in metadata.topics:
-                query = f"FOR t IN {CollectionNames.TOPICS.value} FILTER t.name == @name RETURN t"
-                cursor = self.arango_service.db.aql.execute(
-                    query, bind_vars={"name": topic}
+                parent_node = node
+
+            # Languages and topics: one upsert query each
+            for names, collection_name, edge_collection in (
+                (
+                    metadata.languages,
+                    CollectionNames.LANGUAGES.value,
+                    CollectionNames.BELONGS_TO_LANGUAGE.value,
+                ),
+                (
+                    metadata.topics,
+                    CollectionNames.TOPICS.value,
+                    CollectionNames.BELONGS_TO_TOPIC.value,
+                ),
+            ):
+                keys = await self.arango_service.get_or_create_named_nodes(
+                    names, collection_name
                 )
-                try:
-                    topic_doc = cursor.next()
-                    if topic_doc is None:
-                        raise KeyError("No topic found")
-                    topic_key = topic_doc["_key"]
-                except (StopIteration, KeyError, TypeError):
-                    topic_key = str(uuid.uuid4())
-                    self.arango_service.db.collection(
-                        CollectionNames.TOPICS.value
-                    ).insert(
-                        {
-                            "_key": topic_key,
-                            "name": topic,
-                        }
-                    )
+                edges[edge_collection] = [
+                    record_edge(f"{collection_name}/{key}") for key in keys.values()
+                ]
 
-                # Create relationship if it doesn't exist
-                edge_query = f"""
-                FOR e IN {CollectionNames.BELONGS_TO_TOPIC.value}
-                FILTER e._from == @from AND e._to == @to
-                RETURN e
-                """
-                cursor = self.arango_service.db.aql.execute(
-                    edge_query,
-                    bind_vars={
-                        "from": f"records/{record_id}",
-                        "to": f"topics/{topic_key}",
-                    },
-                )
-                if not cursor.count():
-                    self.arango_service.db.collection(
-                        CollectionNames.BELONGS_TO_TOPIC.value
-                    ).insert(
-                        {
-                            "_from": f"{CollectionNames.RECORDS.value}/{record_id}",
-                            "_to": f"{CollectionNames.TOPICS.value}/{topic_key}",
-                            "createdAtTimestamp": get_epoch_timestamp_in_ms(),
-                        }
-                    )
+            await self.arango_service.batch_insert_unique_edges(edges)
+            self.logger.info(f"🔗 Linked document {record_id} to its metadata")
 
             # Handle summary document
             if metadata.summary:
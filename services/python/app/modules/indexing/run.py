@@ -14,6 +14,7 @@ from app.config.utils.named_constants.ai_models_named_constants import (
     EmbeddingProvider,
 )
 from app.config.utils.named_constants.arangodb_constants import (
+    QDRANT_KEYWORD_INDEX_FIELDS,
     CollectionNames,
 )
 from app.core.embedding_service import (
@@ -362,6 +363,8 @@ class IndexingPipeline:
             self.qdrant_client = qdrant_client
             self.collection_name = collection_name
             self.vector_store = None
+            # Embedding config the vector store was last built for
+            self._embedding_model = None
 
         except (IndexingError, VectorStoreError):
             raise
@@ -371,10 +374,22 @@ class IndexingPipeline:
                 details={"error": str(e)},
             )
 
+    def _create_payload_indexes(self, indexed_fields=()) -> None:
+        """Index the payload fields retrieval filters on, skipping indexed ones"""
+        for field_name in QDRANT_KEYWORD_INDEX_FIELDS:
+            if field_name in indexed_fields:
+                continue
+            self.qdrant_client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
+
     def _initialize_collection(
         self, embedding_size: int = 1024, sparse_idf: bool = False
     ) -> None:
         """Initialize Qdrant collection with proper configuration."""
+        indexed_fields = ()
         try:
             collection_info = self.qdrant_client.get_collection(self.collection_name)
             current_vector_size = collection_info.config.params.vectors["dense"].size
@@ -388,6 +403,7 @@ class IndexingPipeline:
                 raise Exception(
                     "Recreating collection due to vector dimension mismatch."
                 )
+            indexed_fields = collection_info.payload_schema or {}
 
         except Exception:
             self.logger.info(
@@ -422,6 +438,14 @@ class IndexingPipeline:
                     details={"collection": self.collection_name, "error": str(e)},
                 )
 
+        # Also covers collections created before these indexes were added
+        try:
+            self._create_payload_indexes(indexed_fields)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to create payload indexes on {self.collection_name}: {str(e)}"
+            )
+
     async def get_embedding_model_instance(self, embedding_configs = None) -> bool:
         try:
             self.logger.info("Getting embedding model")
@@ -469,6 +493,14 @@ class IndexingPipeline:
                 elif provider == EmbeddingProvider.DEFAULT.value:
                     embedding_model = DEFAULT_EMBEDDING_MODEL
 
+            # Same model as last time: the size probe, collection check and
+            # vector store setup would all give the same result again
+            if (
+                self.vector_store is not None
+                and (embedding_model or DEFAULT_EMBEDDING_MODEL) == self._embedding_model
+            ):
+                return True
+
             try:
                 if not embedding_model or embedding_model == DEFAULT_EMBEDDING_MODEL:
                     self.logger.info(
@@ -532,6 +564,7 @@ class IndexingPipeline:
                     details={"error": str(e)},
                 )
 
+            self._embedding_model = embedding_model
             return True
         except IndexingError as e:
             self.logger.error(f"Error getting embedding model: {str(e)}")
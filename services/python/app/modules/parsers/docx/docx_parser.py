@@ -1,3 +1,5 @@
+from io import BytesIO
+
 from docling.datamodel.base_models import DocumentStream
 from docling.document_converter import DocumentConverter
 
@@ -8,6 +10,10 @@ class DocxParser:
         self.metadata = None
 
     def parse(self, file_binary):
+        # Raw bytes get wrapped here; converted .doc files already arrive as a stream
+        if isinstance(file_binary, (bytes, bytearray)):
+            file_binary = BytesIO(file_binary)
+
         # Create a DocumentStream directly from the bytes
         source = DocumentStream(name="content.docx", stream=file_binary)
 
@@ -6,6 +6,7 @@ import google.oauth2.credentials
 from googleapiclient.discovery import build
 
 from app.config.configuration_service import ConfigurationService
+from app.connectors.sources.google.common.discovery import build_service
 from app.connectors.sources.google.common.google_token_handler import CredentialKeys
 from app.connectors.sources.google.common.scopes import GOOGLE_PARSER_SCOPES
 from app.connectors.sources.google.gmail.gmail_user_service import (
@@ -188,11 +189,13 @@ class ParserUserService:
             self.user_id = user_id
             try:
                 # Initialize services
-                self.docs_service = build("docs", "v1", credentials=self.credentials)
-                self.sheets_service = build(
+                self.docs_service = build_service(
+                    "docs", "v1", credentials=self.credentials
+                )
+                self.sheets_service = build_service(
                     "sheets", "v4", credentials=self.credentials
                 )
-                self.slides_service = build(
+                self.slides_service = build_service(
                     "slides", "v1", credentials=self.credentials
                 )
 
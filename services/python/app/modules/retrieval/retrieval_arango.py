@@ -110,6 +110,27 @@ class ArangoService:
             self.logger.error("❌ Error getting document: %s", str(e))
             return None
 
+    async def get_documents(
+        self, document_keys: List[str], collection: str
+    ) -> Dict[str, Dict]:
+        """Get several documents by key in one query, keyed by _key"""
+        if not document_keys:
+            return {}
+        try:
+            query = """
+            FOR doc IN @@collection
+                FILTER doc._key IN @document_keys
+                RETURN doc
+            """
+            cursor = self.db.aql.execute(
+                query,
+                bind_vars={"document_keys": document_keys, "@collection": collection},
+            )
+            return {doc["_key"]: doc for doc in cursor}
+        except Exception as e:
+            self.logger.error("❌ Error getting documents: %s", str(e))
+            return {}
+
     async def get_accessible_records(
         self, user_id: str, org_id: str, filters: dict = None
     ) -> list:
@@ -1,18 +1,36 @@
+import asyncio
+import hashlib
+import time
 from typing import Any, Dict, List, Optional, Union
 
+from cachetools import LRUCache
 from langchain.chat_models.base import BaseChatModel
 from langchain.embeddings.base import Embeddings
+from langchain_community.embeddings import FastEmbedEmbeddings, HuggingFaceEmbeddings
+from langchain_core.documents import Document
+from langchain_huggingface import (
+    HuggingFaceEmbeddings as LocalHuggingFaceEmbeddings,
+)
+from langchain_openai.embeddings import OpenAIEmbeddings
 from langchain_qdrant import FastEmbedSparse, QdrantVectorStore, RetrievalMode
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import FieldCondition, Filter, MatchValue
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    Fusion,
+    FusionQuery,
+    MatchAny,
+    MatchValue,
+    Prefetch,
+    QueryRequest,
+    SparseVector,
+)
 
 from app.config.configuration_service import config_node_constants
 from app.config.utils.named_constants.ai_models_named_constants import (
     AZURE_EMBEDDING_API_VERSION,
     DEFAULT_EMBEDDING_MODEL,
-    AzureOpenAILLM,
     EmbeddingProvider,
-    LLMProvider,
 )
 from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
@@ -28,21 +46,27 @@ from app.core.embedding_service import (
     OpenAIEmbeddingConfig,
     SentenceTransformersEmbeddingConfig,
 )
-from app.core.llm_service import (
-    AnthropicLLMConfig,
-    AwsBedrockLLMConfig,
-    AzureLLMConfig,
-    GeminiLLMConfig,
-    LLMFactory,
-    OllamaConfig,
-    OpenAICompatibleLLMConfig,
-    OpenAILLMConfig,
-)
 from app.exceptions.embedding_exceptions import EmbeddingModelCreationError
 from app.exceptions.fastapi_responses import Status
 from app.exceptions.indexing_exceptions import IndexingError
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.utils.embeddings import get_default_embedding_model
+from app.utils.llm import get_llm
+
+# Dense embedders whose query embedding is the same as a one-text document
+# embedding, so a batch of queries can go through embed_documents in one call.
+# Others (Cohere, Gemini) embed queries with a different task type
+BATCH_QUERY_EMBEDDINGS = (
+    FastEmbedEmbeddings,
+    HuggingFaceEmbeddings,
+    LocalHuggingFaceEmbeddings,
+    OpenAIEmbeddings,
+)
+
+# How long a fetched ai_models config is reused before it is looked up again
+AI_MODELS_CACHE_TTL_SECONDS = 30.0
+# Number of (dense, sparse) query embeddings kept for repeated queries
+QUERY_EMBEDDING_CACHE_SIZE = 4096
 
 
 class RetrievalService:
@@ -79,76 +103,31 @@ class RetrievalService:
         self.collection_name = collection_name
         self.logger.info(f"Retrieval service initialized with collection name: {self.collection_name}")
         self.vector_store = None
-
-    async def get_llm_instance(self) -> Optional[BaseChatModel]:
-        try:
-            self.logger.info("Getting LLM")
-            ai_models = await self.config_service.get_config(
+        self._ai_models = None
+        self._ai_models_expires_at = 0.0
+        # query -> (dense vector, sparse vector) for _query_embedder
+        self._query_embeddings = LRUCache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+        self._query_embedder = None
+
+    async def _get_ai_models(self) -> Dict[str, Any]:
+        """Return the ai_models config, refetching it once the cached copy expires"""
+        now = time.monotonic()
+        if self._ai_models is None or now >= self._ai_models_expires_at:
+            self._ai_models = await self.config_service.get_config(
                 config_node_constants.AI_MODELS.value
             )
-            llm_configs = ai_models["llm"]
-            # For now, we'll use the first available provider that matches our supported types
-            # We will add logic to choose a specific provider based on our needs
-            llm_config = None
-
-            for config in llm_configs:
-                provider = config["provider"]
-                if provider == LLMProvider.AZURE_OPENAI.value:
-                    llm_config = AzureLLMConfig(
-                        model=config["configuration"]["model"],
-                        temperature=0.2,
-                        api_key=config["configuration"]["apiKey"],
-                        azure_endpoint=config["configuration"]["endpoint"],
-                        azure_api_version=AzureOpenAILLM.AZURE_OPENAI_VERSION.value,
-                        azure_deployment=config["configuration"]["deploymentName"],
-                    )
-                    break
-                elif provider == LLMProvider.OPENAI.value:
-                    llm_config = OpenAILLMConfig(
-                        model=config["configuration"]["model"],
-                        temperature=0.2,
-                        api_key=config["configuration"]["apiKey"],
-                    )
-                    break
-                elif provider == LLMProvider.GEMINI.value:
-                    llm_config = GeminiLLMConfig(
-                        model=config["configuration"]["model"],
-                        temperature=0.2,
-                        api_key=config["configuration"]["apiKey"],
-                    )
-                elif provider == LLMProvider.ANTHROPIC.value:
-                    llm_config = AnthropicLLMConfig(
-                        model=config["configuration"]["model"],
-                        temperature=0.2,
-                        api_key=config["configuration"]["apiKey"],
-                    )
-                elif provider == LLMProvider.AWS_BEDROCK.value:
-                    llm_config = AwsBedrockLLMConfig(
-                        model=config["configuration"]["model"],
-                        temperature=0.2,
-                        region=config["configuration"]["region"],
-                        access_key=config["configuration"]["aws_access_key_id"],
-                        access_secret=config["configuration"]["aws_access_secret_key"],
-                        api_key=config["configuration"]["aws_access_secret_key"],
-                    )
-                elif provider == LLMProvider.OLLAMA.value:
-                    llm_config = OllamaConfig(
-                        model=config['configuration']['model'],
-                        temperature=0.2,
-                        api_key=config['configuration']['apiKey'],
-                    )
-                elif provider == LLMProvider.OPENAI_COMPATIBLE.value:
-                    llm_config = OpenAICompatibleLLMConfig(
-                        model=config['configuration']['model'],
-                        temperature=0.2,
-                        api_key=config['configuration']['apiKey'],
-                        endpoint=config['configuration']['endpoint'],
-                    )
+            self._ai_models_expires_at = now + AI_MODELS_CACHE_TTL_SECONDS
+        return self._ai_models
 
-            if not llm_config:
-                raise ValueError("No supported LLM provider found in configuration")
+    def invalidate_ai_models_cache(self) -> None:
+        """Drop the cached ai_models config so the next lookup refetches it"""
+        self._ai_models = None
+        self._ai_models_expires_at = 0.0
 
-            self.llm = LLMFactory.create_llm(self.logger, llm_config)
+    async def get_llm_instance(self) -> Optional[BaseChatModel]:
+        try:
+            self.logger.info("Getting LLM")
+            self.llm = await get_llm(self.logger, self.config_service)
             self.logger.info("LLM created successfully")
             return self.llm
         except Exception as e:
@@ -214,9 +193,7 @@ class RetrievalService:
         """
         try:
             if not embedding_configs:
-                ai_models = await self.config_service.get_config(
-                    config_node_constants.AI_MODELS.value
-                )
+                ai_models = await self._get_ai_models()
                 embedding_configs = ai_models["embedding"]
             embedding_model = None
             for config in embedding_configs:
@@ -264,9 +241,7 @@ class RetrievalService:
         """Get the current embedding model name from configuration or instance."""
         try:
             # First try to get from AI_MODELS config
-            ai_models = await self.config_service.get_config(
-                config_node_constants.AI_MODELS.value
-            )
+            ai_models = await self._get_ai_models()
             if ai_models and "embedding" in ai_models and ai_models["embedding"]:
                 for config in ai_models["embedding"]:
                     # Only one embedding model is supported
@@ -322,39 +297,117 @@ class RetrievalService:
             formatted_results.append(formatted_result)
         return formatted_results
 
-    async def _build_qdrant_filter(
-        self, org_id: str, accessible_records: List[str], arango_service: ArangoService
+    async def _search_batch(
+        self, queries: List[str], qdrant_filter: Filter, limit: int
+    ) -> List[List[tuple]]:
+        """
+        Run a hybrid (dense + sparse, RRF fused) search for every query in a
+        single Qdrant round-trip.
+
+        Returns:
+            One list of (Document, score) tuples per query, in query order
+        """
+        embeddings = self.vector_store.embeddings
+        # Cached vectors are only valid for the dense model that produced them
+        if embeddings is not self._query_embedder:
+            self._query_embeddings.clear()
+            self._query_embedder = embeddings
+        # Copy hits out now: the shared cache may evict or clear entries while
+        # this call is awaiting the embedders
+        vectors_by_query = {}
+        missing = []
+        for query in dict.fromkeys(queries):
+            cached = self._query_embeddings.get(query)
+            if cached is None:
+                missing.append(query)
+            else:
+                vectors_by_query[query] = cached
+        if missing:
+            dense_embeddings, sparse_embeddings = await asyncio.gather(
+                embeddings.aembed_documents(missing)
+                if isinstance(embeddings, BATCH_QUERY_EMBEDDINGS)
+                else asyncio.gather(*(embeddings.aembed_query(q) for q in missing)),
+                asyncio.gather(
+                    *(self.sparse_embeddings.aembed_query(q) for q in missing)
+                ),
+            )
+            fresh = dict(zip(missing, zip(dense_embeddings, sparse_embeddings)))
+            vectors_by_query.update(fresh)
+            # Skip caching if the embedder was swapped while these were computed
+            if self._query_embedder is embeddings:
+                self._query_embeddings.update(fresh)
+        vectors = [vectors_by_query[q] for q in queries]
+
+        requests = [
+            QueryRequest(
+                prefetch=[
+                    Prefetch(
+                        query=dense,
+                        using=self.vector_store.vector_name,
+                        filter=qdrant_filter,
+                        limit=limit,
+                    ),
+                    Prefetch(
+                        query=SparseVector(indices=sparse.indices, values=sparse.values),
+                        using=self.vector_store.sparse_vector_name,
+                        filter=qdrant_filter,
+                        limit=limit,
+                    ),
+                ],
+                query=FusionQuery(fusion=Fusion.RRF),
+                limit=limit,
+                with_payload=True,
+                with_vector=False,
+            )
+            for dense, sparse in vectors
+        ]
+        responses = await asyncio.to_thread(
+            self.qdrant_client.query_batch_points,
+            collection_name=self.collection_name,
+            requests=requests,
+        )
+
+        content_key = self.vector_store.content_payload_key
+        metadata_key = self.vector_store.metadata_payload_key
+        batch_results = []
+        for response in responses:
+            results = []
+            for point in response.points:
+                payload = point.payload or {}
+                metadata = payload.get(metadata_key) or {}
+                metadata["_id"] = point.id
+                metadata["_collection_name"] = self.collection_name
+                results.append(
+                    (
+                        Document(page_content=payload.get(content_key, ""), metadata=metadata),
+                        point.score,
+                    )
+                )
+            batch_results.append(results)
+        return batch_results
+
+    def _build_qdrant_filter(
+        self, org_id: str, virtual_record_ids: List[str]
     ) -> Filter:
         """
-        Build Qdrant filter for accessible records with both org_id and record_id conditions.
+        Build Qdrant filter for accessible records with both org_id and
+        virtualRecordId conditions.
 
         Args:
             org_id: Organization ID to filter
-            accessible_records: List of record IDs the user has access to
+            virtual_record_ids: Virtual record IDs of the records the user can access
 
         Returns:
             Qdrant Filter object
         """
-        virtual_record_ids = []
-        for record_id in accessible_records:
-            record = await arango_service.get_document(
-                record_id, CollectionNames.RECORDS.value
-            )
-            if record.get("virtualRecordId"):
-                virtual_record_ids.append(record.get("virtualRecordId"))
-
         return Filter(
             must=[
                 FieldCondition(  # org_id condition
                     key="metadata.orgId", match=MatchValue(value=org_id)
                 ),
-                Filter(  # recordId must be one of the accessible_records
-                    should=[
-                        FieldCondition(
-                            key="metadata.virtualRecordId", match=MatchValue(value=virtual_record_id)
-                        )
-                        for virtual_record_id in virtual_record_ids
-                    ]
+                FieldCondition(  # virtualRecordId must be an accessible one
+                    key="metadata.virtualRecordId",
+                    match=MatchAny(any=virtual_record_ids),
                 ),
             ]
         )
@@ -407,8 +460,16 @@ class RetrievalService:
             accessible_record_ids = [
                 record["_key"] for record in accessible_records if record is not None
             ]
-            # Build Qdrant filter
-            qdrant_filter = await self._build_qdrant_filter(org_id, accessible_record_ids, arango_service)
+            # Build Qdrant filter; accessible records are full documents, so
+            # their virtualRecordIds need no further lookups
+            virtual_record_ids = list(
+                {
+                    record["virtualRecordId"]
+                    for record in accessible_records
+                    if record is not None and record.get("virtualRecordId")
+                }
+            )
+            qdrant_filter = self._build_qdrant_filter(org_id, virtual_record_ids)
 
             all_results = []
             seen_chunks = set()
@@ -466,18 +527,23 @@ class RetrievalService:
                     retrieval_mode=RetrievalMode.HYBRID,
                 )
 
-            # Process each query
-            for query in queries:
-                # Perform similarity search
-                processed_query = await self._preprocess_query(query)
-                results = await self.vector_store.asimilarity_search_with_score(
-                    query=processed_query, k=limit, filter=qdrant_filter
-                )
-                # Add to results if content not already seen
+            # Search all queries in one batched round-trip
+            processed_queries = [
+                await self._preprocess_query(query) for query in queries
+            ]
+            batch_results = await self._search_batch(
+                processed_queries, qdrant_filter, limit
+            )
+            for results in batch_results:
+                # Add to results if content not already seen; chunks are
+                # tracked by an 8-byte digest rather than their full text
                 for doc, score in results:
-                    if doc.page_content not in seen_chunks:
+                    digest = hashlib.blake2b(
+                        doc.page_content.encode(), digest_size=8
+                    ).digest()
+                    if digest not in seen_chunks:
                         all_results.append((doc, score))
-                        seen_chunks.add(doc.page_content)
+                        seen_chunks.add(digest)
 
             search_results = self._format_results(all_results)
 
@@ -502,61 +568,64 @@ class RetrievalService:
             unique_record_ids = set(all_record_ids)
             user = await arango_service.get_user_by_user_id(user_id)
 
+            # Fetch all records, then their file and mail details, one query
+            # per collection instead of one round trip per record
+            record_docs = await arango_service.get_documents(
+                list(unique_record_ids), CollectionNames.RECORDS.value
+            )
+            file_docs = await arango_service.get_documents(
+                [
+                    key
+                    for key, record in record_docs.items()
+                    if record.get("recordType", "") == RecordTypes.FILE.value
+                ],
+                CollectionNames.FILES.value,
+            )
+            mail_docs = await arango_service.get_documents(
+                [
+                    key
+                    for key, record in record_docs.items()
+                    if record.get("recordType", "") == RecordTypes.MAIL.value
+                ],
+                CollectionNames.MAILS.value,
+            )
+
+            def record_details(record_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+                """File or mail document of a record, with its webUrl resolved"""
+                record_type = record.get("recordType", "")
+                if record_type == RecordTypes.FILE.value:
+                    details = file_docs.get(record_id) or {}
+                    weburl = details.get("webUrl")
+                    if weburl and record.get("connectorName", "") == Connectors.GOOGLE_MAIL.value:
+                        weburl = weburl.replace("{user.email}", user["email"])
+                elif record_type == RecordTypes.MAIL.value:
+                    details = mail_docs.get(record_id) or {}
+                    weburl = details.get("webUrl")
+                    if weburl:
+                        weburl = weburl.replace("{user.email}", user["email"])
+                else:
+                    return {}
+                return {**details, "webUrl": weburl}
+
             # Replace virtualRecordId with first accessible record ID in search results
             for result in search_results:
                 virtual_id = result["metadata"]["virtualRecordId"]
                 if virtual_id in virtual_to_record_map:
                     record_id = virtual_to_record_map[virtual_id]
                     result["metadata"]["recordId"] = record_id
-                    record = await arango_service.get_document(
-                        record_id, CollectionNames.RECORDS.value
-                    )
+                    record = record_docs.get(record_id) or {}
                     result["metadata"]["origin"] = record.get("origin")
                     result["metadata"]["connector"] = record.get("connectorName")
 
-                    if record.get("recordType", "") == RecordTypes.FILE.value:
-                        files = await arango_service.get_document(
-                            record_id, CollectionNames.FILES.value
-                        )
-                        weburl = files.get("webUrl")
-                        if weburl and record.get("connectorName", "") == Connectors.GOOGLE_MAIL.value:
-                            weburl = weburl.replace("{user.email}", user["email"])
-                        result["metadata"]["webUrl"] = weburl
-
-                    if record.get("recordType", "") == RecordTypes.MAIL.value:
-                        mail = await arango_service.get_document(
-                            record_id, CollectionNames.MAILS.value
-                        )
-                        weburl = mail.get("webUrl")
-                        if weburl:
-                            weburl = weburl.replace("{user.email}", user["email"])
-                        result["metadata"]["webUrl"] = weburl
+                    details = record_details(record_id, record)
+                    if details:
+                        result["metadata"]["webUrl"] = details["webUrl"]
 
             # Get full record documents from Arango
-            records = []
-            if unique_record_ids:
-                for record_id in unique_record_ids:
-                    record = await arango_service.get_document(
-                        record_id, CollectionNames.RECORDS.value
-                    )
-                    if record.get("recordType", "") == RecordTypes.FILE.value:
-                        files = await arango_service.get_document(
-                            record_id, CollectionNames.FILES.value
-                        )
-                        if record.get("connectorName", "") == Connectors.GOOGLE_MAIL.value:
-                            weburl = files.get("webUrl")
-                            weburl = weburl.replace("{user.email}", user["email"])
-                            files["webUrl"] = weburl
-                        record = {**record, **files}
-                    if record.get("recordType", "") == RecordTypes.MAIL.value:
-                        mail = await arango_service.get_document(
-                            record_id, CollectionNames.MAILS.value
-                        )
-                        weburl = mail.get("webUrl")
-                        weburl = weburl.replace("{user.email}", user["email"])
-                        mail["webUrl"] = weburl
-                        record = {**record, **mail}
-                    records.append(record)
+            records = [
+                {**record, **record_details(record_id, record)}
+                for record_id, record in record_docs.items()
+            ]
 
             if search_results or records:
                 return {
@@ -79,10 +79,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger = app.container.logger()
     logger.debug("🚀 Starting retrieval application")
 
+    # Resolve request-scoped dependencies once so routes only read app.state
+    app.state.retrieval_service = await app_container.retrieval_service()
+    app.state.arango_service = await app_container.arango_service()
+    app.state.config_service = app_container.config_service()
+
     consumer = await container.llm_config_handler()
     consume_task = asyncio.create_task(consumer.consume_messages())
 
-    arango_service = await app_container.arango_service()
+    arango_service = app.state.arango_service
 
     # Get all organizations
     orgs = await arango_service.get_all_orgs()
@@ -90,8 +95,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("No organizations found in the system")
     else:
         logger.info("Found organizations in the system")
-        retrieval_service = await container.retrieval_service()
-        await retrieval_service.get_embedding_model_instance()
+        await app.state.retrieval_service.get_embedding_model_instance()
 
     yield
     # Shutdown
@@ -83,6 +83,7 @@ class RetrievalAiConfigHandler:
         try:
             self.logger.info("📥 Processing LLM configured event")
 
+            self.retrieval_service.invalidate_ai_models_cache()
             await self.retrieval_service.get_llm_instance()
 
             self.logger.info(
@@ -98,6 +99,7 @@ class RetrievalAiConfigHandler:
         try:
             self.logger.info("📥 Processing embedding model configured event")
 
+            self.retrieval_service.invalidate_ai_models_cache()
             await self.retrieval_service.get_embedding_model_instance()
             self.logger.info("✅ Successfully updated embedding model in all services")
             return True
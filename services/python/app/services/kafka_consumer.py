@@ -1,9 +1,11 @@
 import asyncio
-import json
-from datetime import datetime, timedelta, timezone
+import os
+import time
+from datetime import datetime
 from typing import Dict, List, Set
 
 import aiohttp
+import orjson
 from confluent_kafka import Consumer, KafkaError
 from jose import jwt
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -24,8 +26,9 @@ from app.config.utils.named_constants.http_status_code_constants import HttpStat
 from app.exceptions.indexing_exceptions import IndexingError
 
 # Concurrency control settings
-MAX_CONCURRENT_TASKS = 5  # Maximum number of messages to process concurrently
+MAX_CONCURRENT_TASKS = 16  # Maximum number of messages to process concurrently
 RATE_LIMIT_PER_SECOND = 2  # Maximum number of new tasks to start per second
+JWT_EXPIRATION_SECONDS = 3600  # Lifetime of tokens minted for signed URL routes
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=15))
@@ -157,18 +160,15 @@ class KafkaConsumerManager:
 
             # Message parsing
             try:
+                # orjson parses the raw bytes directly, no utf-8 decode pass
                 message_value = message.value()
-                if isinstance(message_value, bytes):
-                    message_value = message_value.decode("utf-8")
-                    self.logger.debug(f"Decoded message {message_id} from bytes")
-
-                data = json.loads(message_value)
+                data = orjson.loads(message_value)
                 if isinstance(data, str):
-                    data = json.loads(data)
+                    data = orjson.loads(data)
                     self.logger.debug(
                         f"Handled double-encoded JSON for message {message_id}"
                     )
-            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            except orjson.JSONDecodeError as e:
                 self.logger.error(
                     f"Failed to parse message {message_id}: {str(e)}\n"
                     f"Raw value: {message_value[:1000]}..."
@@ -218,7 +218,7 @@ class KafkaConsumerManager:
                 return True
 
             if extension is None and mime_type != "text/gmail_content":
-                extension = payload_data["recordName"].split(".")[-1]
+                extension = os.path.splitext(payload_data["recordName"])[1][1:].lower()
 
             self.logger.info("🚀 Checking for mime_type")
             self.logger.info("🚀 mime_type: %s", mime_type)
@@ -230,9 +230,8 @@ class KafkaConsumerManager:
             if record is None:
                 self.logger.error(f"❌ Record {record_id} not found in database")
                 return
-            doc = dict(record)
 
-            if event_type == EventTypes.NEW_RECORD.value and doc.get("indexingStatus") == ProgressStatus.COMPLETED.value:
+            if event_type == EventTypes.NEW_RECORD.value and record.get("indexingStatus") == ProgressStatus.COMPLETED.value:
                 self.logger.info(f"🔍 Embeddings already exist for record {record_id} with virtual_record_id {virtual_record_id}")
                 return True
 
@@ -266,30 +265,23 @@ class KafkaConsumerManager:
                     f"🔴🔴🔴 Unsupported file: Mime Type: {mime_type}, Extension: {extension} 🔴🔴🔴"
                 )
 
-                doc.update(
+                await self.event_processor.update_status(
+                    record_id,
                     {
                         "indexingStatus": ProgressStatus.FILE_TYPE_NOT_SUPPORTED.value,
                         "extractionStatus": ProgressStatus.FILE_TYPE_NOT_SUPPORTED.value,
-                    }
-                )
-                docs = [doc]
-                await self.event_processor.arango_service.batch_upsert_nodes(
-                    docs, CollectionNames.RECORDS.value
+                    },
                 )
 
                 return True
 
             # Update with new metadata fields
-            doc.update(
+            await self.event_processor.update_status(
+                record_id,
                 {
                     "indexingStatus": ProgressStatus.IN_PROGRESS.value,
                     "extractionStatus": ProgressStatus.IN_PROGRESS.value,
-                }
-            )
-
-            docs = [doc]
-            await self.event_processor.arango_service.batch_upsert_nodes(
-                docs, CollectionNames.RECORDS.value
+                },
             )
 
             # Signed URL handling
@@ -412,7 +404,9 @@ class KafkaConsumerManager:
             self.logger.info("Starting Kafka consumer loop")
             while self.running:
                 try:
-                    message = self.consumer.poll(0.1)
+                    # Non-blocking poll: a blocking one would stall the
+                    # in-flight processing tasks sharing this event loop
+                    message = self.consumer.poll(0)
 
                     if message is None:
                         await asyncio.sleep(0.1)
@@ -496,14 +490,11 @@ class KafkaConsumerManager:
         if not scoped_jwt_secret:
             raise ValueError("SCOPED_JWT_SECRET environment variable is not set")
 
-        # Add standard claims if not present
-        if "exp" not in token_payload:
-            # Set expiration to 1 hour from now
-            token_payload["exp"] = datetime.now(timezone.utc) + timedelta(hours=1)
-
-        if "iat" not in token_payload:
-            # Set issued at to current time
-            token_payload["iat"] = datetime.now(timezone.utc)
+        # Add standard claims if not present, as the epoch seconds jose
+        # would otherwise derive from datetimes
+        now = int(time.time())
+        token_payload.setdefault("exp", now + JWT_EXPIRATION_SECONDS)
+        token_payload.setdefault("iat", now)
 
         # Generate the JWT token using jose
         token = jwt.encode(token_payload, scoped_jwt_secret, algorithm="HS256")
@@ -526,7 +517,7 @@ class KafkaConsumerManager:
                         mime_type = payload_data.get("mimeType", "unknown")
 
                         if extension is None and mime_type != "text/gmail_content":
-                            extension = payload_data["recordName"].split(".")[-1]
+                            extension = os.path.splitext(payload_data["recordName"])[1][1:].lower()
 
                         self.logger.info(
                             f"Processing update for record {record_id}"
@@ -539,19 +530,14 @@ class KafkaConsumerManager:
                         if record is None:
                             self.logger.error(f"❌ Record {record_id} not found in database")
                             return
-                        doc = dict(record)
 
                         # Update with new metadata fields
-                        doc.update(
+                        await self.event_processor.update_status(
+                            record_id,
                             {
                                 "indexingStatus": ProgressStatus.IN_PROGRESS.value,
                                 "extractionStatus": ProgressStatus.IN_PROGRESS.value,
-                            }
-                        )
-
-                        docs = [doc]
-                        await self.event_processor.arango_service.batch_upsert_nodes(
-                            docs, CollectionNames.RECORDS.value
+                            },
                         )
 
                         if payload_data and payload_data.get("signedUrlRoute"):
@@ -21,6 +21,7 @@ from app.config.configuration_service import (
     RedisConfig,
     config_node_constants,
 )
+from app.config.utils.named_constants.arangodb_constants import AccountType
 from app.config.utils.named_constants.http_status_code_constants import HttpStatusCode
 from app.connectors.services.kafka_service import KafkaService
 from app.connectors.services.sync_kafka_consumer import SyncKafkaRouteConsumer
@@ -66,6 +67,7 @@ from app.modules.parsers.google_files.google_docs_parser import GoogleDocsParser
 from app.modules.parsers.google_files.google_sheets_parser import GoogleSheetsParser
 from app.modules.parsers.google_files.google_slides_parser import GoogleSlidesParser
 from app.modules.parsers.google_files.parser_user_service import ParserUserService
+from app.utils.json_serialization import orjson_dumps, orjson_loads
 from app.utils.logger import create_logger
 
 
@@ -83,6 +85,11 @@ async def initialize_individual_account_services_fn(org_id, container) -> None:
                 asyncio.create_task(refresh_google_workspace_user_credentials(org_id, arango_service,logger, container))
                 break
 
+        # Providers are the same for every individual org; wire them once
+        if getattr(container, "account_services_type", None) == AccountType.INDIVIDUAL.value:
+            logger.info("Services already initialized for individual accounts")
+            return
+
         print("Initializing base services")
         # Initialize base services
         container.drive_service.override(
@@ -255,6 +262,7 @@ async def initialize_individual_account_services_fn(org_id, container) -> None:
         ]
     )
 
+    container.account_services_type = AccountType.INDIVIDUAL.value
     logger.info("✅ Successfully initialized services for individual account")
 
 
@@ -277,6 +285,15 @@ async def initialize_enterprise_account_services_fn(org_id, container) -> None:
                 await cache_google_workspace_service_credentials(org_id, arango_service, logger, container)
                 break
 
+        # Providers are the same for every enterprise org; wire them once and
+        # only connect the admin service and its watch for this org
+        if getattr(container, "account_services_type", None) == AccountType.ENTERPRISE.value:
+            google_admin_service = container.google_admin_service()
+            await google_admin_service.connect_admin(org_id)
+            await google_admin_service.create_admin_watch(org_id)
+            logger.info("Services already initialized for enterprise accounts")
+            return
+
         # Initialize base services
         container.drive_service.override(
             providers.Singleton(
@@ -456,6 +473,7 @@ async def initialize_enterprise_account_services_fn(org_id, container) -> None:
         ]
     )
 
+    container.account_services_type = AccountType.ENTERPRISE.value
     logger.info("✅ Successfully initialized services for enterprise account")
 
 async def cache_google_workspace_service_credentials(org_id, arango_service, logger, container) -> None:
@@ -587,7 +605,9 @@ class AppContainer(containers.DeclarativeContainer):
             config_node_constants.ARANGODB.value
         )
         hosts = arangodb_config["url"]
-        return ArangoClient(hosts=hosts)
+        return ArangoClient(
+            hosts=hosts, serializer=orjson_dumps, deserializer=orjson_loads
+        )
 
     async def _create_redis_client(config_service) -> Redis:
         """Async method to initialize RedisClient."""
@@ -2,6 +2,7 @@
 app/setup.py
 """
 
+import importlib
 import os
 
 import aiohttp
@@ -29,21 +30,43 @@ from app.events.events import EventProcessor
 from app.events.processor import Processor
 from app.modules.extraction.domain_extraction import DomainExtractor
 from app.modules.indexing.run import IndexingPipeline
-from app.modules.parsers.csv.csv_parser import CSVParser
-from app.modules.parsers.docx.docparser import DocParser
-from app.modules.parsers.docx.docx_parser import DocxParser
-from app.modules.parsers.excel.excel_parser import ExcelParser
-from app.modules.parsers.excel.xls_parser import XLSParser
-from app.modules.parsers.html_parser.html_parser import HTMLParser
-from app.modules.parsers.markdown.markdown_parser import MarkdownParser
-from app.modules.parsers.markdown.mdx_parser import MDXParser
-from app.modules.parsers.pptx.ppt_parser import PPTParser
-from app.modules.parsers.pptx.pptx_parser import PPTXParser
 from app.services.kafka_consumer import KafkaConsumerManager
+from app.utils.json_serialization import orjson_dumps, orjson_loads
 from app.utils.logger import create_logger
 
 load_dotenv(override=True)
 
+# Extension -> (module, class, takes logger) of its parser. Parsers pull in
+# docling, openpyxl and friends, so each is imported on first use only
+PARSER_CLASSES = {
+    ExtensionTypes.DOCX.value: ("app.modules.parsers.docx.docx_parser", "DocxParser", False),
+    ExtensionTypes.DOC.value: ("app.modules.parsers.docx.docparser", "DocParser", False),
+    ExtensionTypes.PPTX.value: ("app.modules.parsers.pptx.pptx_parser", "PPTXParser", False),
+    ExtensionTypes.PPT.value: ("app.modules.parsers.pptx.ppt_parser", "PPTParser", False),
+    ExtensionTypes.HTML.value: ("app.modules.parsers.html_parser.html_parser", "HTMLParser", False),
+    ExtensionTypes.MD.value: ("app.modules.parsers.markdown.markdown_parser", "MarkdownParser", False),
+    ExtensionTypes.MDX.value: ("app.modules.parsers.markdown.mdx_parser", "MDXParser", False),
+    ExtensionTypes.CSV.value: ("app.modules.parsers.csv.csv_parser", "CSVParser", False),
+    ExtensionTypes.XLSX.value: ("app.modules.parsers.excel.excel_parser", "ExcelParser", True),
+    ExtensionTypes.XLS.value: ("app.modules.parsers.excel.xls_parser", "XLSParser", False),
+}
+
+
+class LazyParsers(dict):
+    """Parser lookup by extension that builds each parser on first access"""
+
+    def __init__(self, logger) -> None:
+        super().__init__()
+        self.logger = logger
+
+    def __missing__(self, extension: str):
+        module_name, class_name, takes_logger = PARSER_CLASSES[extension]
+        parser_class = getattr(importlib.import_module(module_name), class_name)
+        parser = parser_class(self.logger) if takes_logger else parser_class()
+        self[extension] = parser
+        return parser
+
+
 
 class AppContainer(containers.DeclarativeContainer):
     """Dependency injection container for the application."""
@@ -66,7 +89,9 @@ class AppContainer(containers.DeclarativeContainer):
     async def _create_arango_client(config_service) -> ArangoClient:
         """Async factory method to initialize ArangoClient."""
         hosts = await AppContainer._fetch_arango_host(config_service)
-        return ArangoClient(hosts=hosts)
+        return ArangoClient(
+            hosts=hosts, serializer=orjson_dumps, deserializer=orjson_loads
+        )
 
     arango_client = providers.Resource(
         _create_arango_client, config_service=config_service
@@ -156,19 +181,7 @@ class AppContainer(containers.DeclarativeContainer):
     # Parsers
     async def _create_parsers(logger) -> dict:
         """Async factory for Parsers"""
-        parsers = {
-            ExtensionTypes.DOCX.value: DocxParser(),
-            ExtensionTypes.DOC.value: DocParser(),
-            ExtensionTypes.PPTX.value: PPTXParser(),
-            ExtensionTypes.PPT.value: PPTParser(),
-            ExtensionTypes.HTML.value: HTMLParser(),
-            ExtensionTypes.MD.value: MarkdownParser(),
-            ExtensionTypes.MDX.value: MDXParser(),
-            ExtensionTypes.CSV.value: CSVParser(),
-            ExtensionTypes.XLSX.value: ExcelParser(logger),
-            ExtensionTypes.XLS.value: XLSParser(),
-        }
-        return parsers
+        return LazyParsers(logger)
 
     parsers = providers.Resource(_create_parsers, logger=logger)
 
@@ -8,6 +8,7 @@ from app.modules.reranker.reranker import RerankerService
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.modules.retrieval.retrieval_service import RetrievalService
 from app.services.ai_config_handler import RetrievalAiConfigHandler
+from app.utils.json_serialization import orjson_dumps, orjson_loads
 from app.utils.logger import create_logger
 
 
@@ -32,7 +33,9 @@ class AppContainer(containers.DeclarativeContainer):
     async def _create_arango_client(config_service) -> ArangoClient:
         """Async factory method to initialize ArangoClient."""
         hosts = await AppContainer._fetch_arango_host(config_service)
-        return ArangoClient(hosts=hosts)
+        return ArangoClient(
+            hosts=hosts, serializer=orjson_dumps, deserializer=orjson_loads
+        )
 
     arango_client = providers.Resource(
         _create_arango_client, config_service=config_service
@@ -0,0 +1,90 @@
+import asyncio
+
+from app.utils.batcher import MicroBatcher
+
+
+def test_concurrent_submissions_share_one_batch():
+    calls = []
+
+    async def process_batch(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    async def run():
+        batcher = MicroBatcher(process_batch, max_batch_size=10, max_wait_seconds=0.05)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.close()
+        return results
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8]
+    assert calls == [[0, 1, 2, 3, 4]]
+
+
+def test_batches_are_capped_at_max_batch_size():
+    calls = []
+
+    async def process_batch(items):
+        calls.append(len(items))
+        return items
+
+    async def run():
+        batcher = MicroBatcher(process_batch, max_batch_size=2, max_wait_seconds=0.05)
+        await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.close()
+
+    asyncio.run(run())
+    assert calls == [2, 2, 1]
+
+
+def test_item_exception_only_fails_its_caller():
+    async def process_batch(items):
+        return [ValueError(item) if item == 1 else item for item in items]
+
+    async def run():
+        batcher = MicroBatcher(process_batch, max_batch_size=10, max_wait_seconds=0.05)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+        await batcher.close()
+        return results
+
+    first, second, third = asyncio.run(run())
+    assert first == 0
+    assert isinstance(second, ValueError)
+    assert third == 2
+
+
+def test_close_cancels_waiting_callers():
+    async def process_batch(items):
+        await asyncio.sleep(10)
+        return items
+
+    async def run():
+        batcher = MicroBatcher(process_batch, max_batch_size=10, max_wait_seconds=0.01)
+        waiting = asyncio.ensure_future(batcher.submit(1))
+        await asyncio.sleep(0.05)
+        await batcher.close()
+        return await asyncio.gather(waiting, return_exceptions=True)
+
+    (result,) = asyncio.run(run())
+    assert isinstance(result, asyncio.CancelledError)
+
+
+def test_failed_batch_fails_every_waiting_caller():
+    async def process_batch(items):
+        raise ConnectionError("database unavailable")
+
+    async def run():
+        batcher = MicroBatcher(process_batch, max_batch_size=10, max_wait_seconds=0.05)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(batcher.submit(i) for i in range(3)), return_exceptions=True
+            ),
+            timeout=1,
+        )
+        await batcher.close()
+        return results
+
+    results = asyncio.run(run())
+    assert len(results) == 3
+    assert all(isinstance(result, ConnectionError) for result in results)
@@ -0,0 +1,75 @@
+import orjson
+
+from app.utils.citations import process_citations, process_citations_bytes
+
+DOCUMENTS = [
+    {"content": "first chunk", "metadata": {"_id": "a"}},
+    {"content": "second chunk", "metadata": {"_id": "b"}},
+]
+
+
+def _cited_contents(result) -> list:
+    return [citation["content"] for citation in result["citations"]]
+
+
+def test_cites_documents_in_the_order_given():
+    response = orjson.dumps({"answer": "ok", "chunkIndexes": [[1, 2], [2, 1]]}).decode()
+
+    result = process_citations(response, DOCUMENTS)
+
+    assert result["answer"] == "ok"
+    assert _cited_contents(result) == ["second chunk", "first chunk"]
+    assert [citation["chunkIndex"] for citation in result["citations"]] == [1, 2]
+
+
+def test_no_documents_means_no_citations():
+    response = {"answer": "ok", "chunkIndexes": [[1, 1]]}
+
+    assert process_citations(response, [])["citations"] == []
+
+
+def test_chunk_indexes_sent_as_a_string():
+    response = {"answer": "ok", "chunk_indexes": "[[1, '2'], [2, \"1\"]]"}
+
+    result = process_citations(response, DOCUMENTS)
+
+    assert _cited_contents(result) == ["second chunk", "first chunk"]
+
+
+def test_malformed_and_out_of_range_entries_are_skipped():
+    response = {"answer": "ok", "chunkIndexes": [[1, "x"], [], [1, 5], [1], [2, " 2 "]]}
+
+    result = process_citations(response, DOCUMENTS)
+
+    assert _cited_contents(result) == ["second chunk"]
+
+
+def test_falls_back_to_citations_in_the_answer_text():
+    result = process_citations({"answer": "See [1, 2] for details"}, DOCUMENTS)
+
+    assert _cited_contents(result) == ["second chunk"]
+
+
+def test_unreadable_answer_returns_an_error_payload():
+    result = process_citations({"answer": ["not", "text"]}, DOCUMENTS)
+
+    assert result["error"].startswith("Citation processing failed")
+    assert "citations" not in result
+
+
+def test_caller_dict_is_copied_not_modified():
+    response = {"answer": "ok", "chunkIndexes": [[1, 1]]}
+
+    result = process_citations(response, DOCUMENTS)
+
+    assert "citations" not in response
+    assert result is not response
+    assert _cited_contents(result) == ["first chunk"]
+
+
+def test_bytes_variant_matches_the_dict_result():
+    response = {"answer": "ok", "chunkIndexes": [[1, 1]]}
+
+    assert orjson.loads(process_citations_bytes(response, DOCUMENTS)) == (
+        process_citations(response, DOCUMENTS)
+    )
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+
+from app.modules.extraction import domain_extraction
+from app.modules.extraction.domain_extraction import (
+    DocumentClassification,
+    DomainExtractor,
+)
+
+
+def _classification(summary: str) -> dict:
+    return {
+        "departments": ["Engineering"],
+        "categories": "Technical",
+        "subcategories": {"level1": "a", "level2": "b", "level3": "c"},
+        "languages": ["English"],
+        "sentiment": "Neutral",
+        "confidence_score": 0.9,
+        "topics": ["testing"],
+        "summary": summary,
+    }
+
+
+class FakeStructuredLLM:
+    def __init__(self, llm) -> None:
+        self.llm = llm
+
+    async def abatch(self, inputs, return_exceptions=False):
+        self.llm.batch_sizes.append(len(inputs))
+        return [
+            ValueError("tool call did not validate")
+            if "broken" in messages[-1].content
+            else DocumentClassification(**_classification("structured"))
+            for messages in inputs
+        ]
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.batch_sizes = []
+        self.invocations = 0
+
+    def with_structured_output(self, schema):
+        return FakeStructuredLLM(self)
+
+    async def ainvoke(self, messages):
+        self.invocations += 1
+        return SimpleNamespace(content=json.dumps(_classification("parsed")))
+
+
+class FakeArangoService:
+    db = None
+
+    async def get_departments(self, org_id):
+        return ["Engineering"]
+
+
+def test_failed_structured_item_falls_back_without_failing_its_batch(
+    monkeypatch, tmp_path
+):
+    llm = FakeLLM()
+
+    async def fake_get_llm(logger, config_service):
+        return llm
+
+    monkeypatch.setattr(domain_extraction, "get_llm", fake_get_llm)
+    monkeypatch.setattr(domain_extraction, "TOPICS_STORE_DIR", str(tmp_path))
+    extractor = DomainExtractor(logging.getLogger("test"), FakeArangoService(), None)
+
+    async def run():
+        return await asyncio.gather(
+            extractor.extract_metadata("first document", "org"),
+            extractor.extract_metadata("broken document", "org"),
+            extractor.extract_metadata("third document", "org"),
+        )
+
+    results = asyncio.run(run())
+
+    assert [result.summary for result in results] == [
+        "structured",
+        "parsed",
+        "structured",
+    ]
+    # All three went out in one batch; only the failed one was re-asked
+    assert llm.batch_sizes == [3]
+    assert llm.invocations == 1
+
+
+def _extractor(monkeypatch, store_dir) -> DomainExtractor:
+    monkeypatch.setattr(domain_extraction, "TOPICS_STORE_DIR", str(store_dir))
+    return DomainExtractor(logging.getLogger("test"), FakeArangoService(), None)
+
+
+def test_similar_topics_map_to_accepted_ones(monkeypatch, tmp_path):
+    extractor = _extractor(monkeypatch, tmp_path)
+
+    assert set(extractor.process_new_topics(["machine learning", "budget planning"])) == {
+        "machine learning",
+        "budget planning",
+    }
+    assert set(extractor.process_new_topics(["machine learning models"])) == {
+        "machine learning"
+    }
+    assert set(extractor.process_new_topics(["budget planning"])) == {"budget planning"}
+    assert extractor._topics_list == ["machine learning", "budget planning"]
+
+
+def test_topics_in_one_batch_match_each_other(monkeypatch, tmp_path):
+    extractor = _extractor(monkeypatch, tmp_path)
+
+    topics = extractor.process_new_topics(
+        ["machine learning", "machine learning models", "quarterly revenue"]
+    )
+
+    assert set(topics) == {"machine learning", "quarterly revenue"}
+    assert extractor._topic_matrix.shape[0] == 2
+
+
+def test_accepted_topics_survive_a_restart(monkeypatch, tmp_path):
+    _extractor(monkeypatch, tmp_path).process_new_topics(
+        ["machine learning", "budget planning"]
+    )
+
+    restarted = _extractor(monkeypatch, tmp_path)
+
+    assert restarted._topics_list == ["machine learning", "budget planning"]
+    assert set(restarted.process_new_topics(["machine learning models"])) == {
+        "machine learning"
+    }
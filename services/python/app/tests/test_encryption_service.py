@@ -0,0 +1,83 @@
+import logging
+import os
+
+import pytest
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from app.config.encryption.encryption_service import (
+    AUTH_TAG_LENGTH,
+    COMPACT_FORMAT_PREFIX,
+    IV_LENGTH,
+    DecryptionError,
+    EncryptionService,
+)
+
+SECRET_KEY = os.urandom(32).hex()
+
+
+def _service() -> EncryptionService:
+    return EncryptionService("aes-256-gcm", SECRET_KEY, logging.getLogger("test"))
+
+
+def test_default_format_round_trips_as_hex():
+    service = _service()
+    encrypted = service.encrypt('{"password": "s3cret"}')
+
+    iv, ciphertext, auth_tag = encrypted.split(":")
+    assert len(iv) == IV_LENGTH * 2
+    assert len(auth_tag) == AUTH_TAG_LENGTH * 2
+    assert bytes.fromhex(ciphertext)
+    assert service.decrypt(encrypted) == '{"password": "s3cret"}'
+
+
+def test_compact_format_round_trips_and_is_smaller():
+    service = _service()
+    text = "x" * 200
+    compact = service.encrypt(text, compact=True)
+
+    assert compact.startswith(COMPACT_FORMAT_PREFIX)
+    assert len(compact) < len(service.encrypt(text))
+    assert service.decrypt(compact) == text
+
+
+def test_both_formats_are_read_side_by_side():
+    service = _service()
+    values = ["first", "second", "third"]
+    encrypted = [
+        service.encrypt(value, compact=index % 2 == 0)
+        for index, value in enumerate(values)
+    ]
+
+    assert [service.decrypt(value) for value in encrypted] == values
+
+
+def test_reads_values_written_in_the_node_format():
+    # What the Node.js service stores: hex "iv:ciphertext:authTag"
+    iv = os.urandom(IV_LENGTH)
+    encrypted = AESGCM(bytes.fromhex(SECRET_KEY)).encrypt(iv, b"from node", None)
+    stored = ":".join(
+        (
+            iv.hex(),
+            encrypted[:-AUTH_TAG_LENGTH].hex(),
+            encrypted[-AUTH_TAG_LENGTH:].hex(),
+        )
+    )
+
+    assert _service().decrypt(stored) == "from node"
+
+
+def test_tampered_compact_value_is_rejected():
+    service = _service()
+    prefix, _, auth_tag = service.encrypt("value", compact=True).rpartition(".")
+    tampered = f"{prefix}.{'A' * len(auth_tag)}"
+
+    with pytest.raises(DecryptionError):
+        service.decrypt(tampered)
+
+
+@pytest.mark.parametrize(
+    "value", [None, "not-encrypted", "v2:only.two", "00:11:22", f"{COMPACT_FORMAT_PREFIX}"]
+)
+def test_malformed_values_raise_decryption_error(value):
+    with pytest.raises(DecryptionError):
+        _service().decrypt(value)
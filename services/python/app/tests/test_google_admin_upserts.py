@@ -0,0 +1,56 @@
+import asyncio
+
+from app.connectors.sources.google.admin.google_admin_service import (
+    UPSERT_BATCH_SIZE,
+    UPSERT_BATCH_WINDOW_SECONDS,
+    GoogleAdminService,
+)
+from app.utils.batcher import MicroBatcher
+
+
+class FailingArangoService:
+    def __init__(self, failing_collection: str) -> None:
+        self.failing_collection = failing_collection
+        self.calls = []
+
+    async def batch_upsert_nodes(self, nodes, collection):
+        self.calls.append((collection, len(nodes)))
+        if collection == self.failing_collection:
+            raise RuntimeError("upsert failed")
+        return True
+
+
+def _admin_service(arango_service) -> GoogleAdminService:
+    # Only the upsert path is exercised; skip the credential setup
+    service = GoogleAdminService.__new__(GoogleAdminService)
+    service.arango_service = arango_service
+    service._upsert_batcher = MicroBatcher(
+        service._upsert_batch, UPSERT_BATCH_SIZE, UPSERT_BATCH_WINDOW_SECONDS
+    )
+    return service
+
+
+def test_failed_collection_upsert_fails_each_of_its_callers():
+    arango_service = FailingArangoService("groups")
+    service = _admin_service(arango_service)
+
+    async def run():
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                service._upsert_node({"_key": "u1"}, "users"),
+                service._upsert_node({"_key": "g1"}, "groups"),
+                service._upsert_node({"_key": "u2"}, "users"),
+                service._upsert_node({"_key": "g2"}, "groups"),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+        await service._upsert_batcher.close()
+        return results
+
+    user1, group1, user2, group2 = asyncio.run(run())
+
+    assert user1 is True and user2 is True
+    assert isinstance(group1, RuntimeError)
+    assert isinstance(group2, RuntimeError)
+    assert sorted(arango_service.calls) == [("groups", 2), ("users", 2)]
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from urllib.parse import parse_qs, urlparse
+
+from app.config.configuration_service import config_node_constants
+from app.core.signed_url import SignedUrlConfig, SignedUrlHandler
+
+
+class FakeConfigurationService:
+    def __init__(self, endpoint: str) -> None:
+        self.set_endpoint(endpoint)
+
+    def set_endpoint(self, endpoint: str) -> None:
+        # A changed node arrives as a new dict, as from the real config cache
+        self.endpoints = {"connectors": {"endpoint": endpoint}}
+
+    async def get_config(self, key: str):
+        assert key == config_node_constants.ENDPOINTS.value
+        return self.endpoints
+
+
+def _handler(config_service) -> SignedUrlHandler:
+    return SignedUrlHandler(
+        logging.getLogger("test"),
+        SignedUrlConfig(private_key="test-secret"),
+        config_service,
+    )
+
+
+def _token(url: str) -> str:
+    return parse_qs(urlparse(url).query)["token"][0]
+
+
+def test_identical_requests_reuse_the_signed_url():
+    handler = _handler(FakeConfigurationService("http://connector:8088"))
+
+    async def run():
+        first = await handler.create_signed_url("record", "org", "user", connector="drive")
+        second = await handler.create_signed_url("record", "org", "user", connector="drive")
+        other_user = await handler.create_signed_url(
+            "record", "org", "other", connector="drive"
+        )
+        return first, second, other_user
+
+    first, second, other_user = asyncio.run(run())
+
+    assert first == second
+    assert first.startswith("http://connector:8088/api/v1/index/org/drive/record/record?")
+    assert other_user != first
+    payload = handler.validate_token(_token(first))
+    assert (payload.record_id, payload.user_id) == ("record", "user")
+
+
+def test_urls_with_additional_claims_are_not_cached():
+    handler = _handler(FakeConfigurationService("http://connector:8088"))
+
+    url = asyncio.run(
+        handler.create_signed_url(
+            "record", "org", "user", additional_claims={"scope": "download"}
+        )
+    )
+
+    assert len(handler._signed_urls) == 0
+    payload = handler.validate_token(_token(url), required_claims={"scope": "download"})
+    assert payload.additional_claims == {"scope": "download"}
+
+
+def test_endpoint_change_mints_a_new_url():
+    config_service = FakeConfigurationService("http://connector:8088")
+    handler = _handler(config_service)
+
+    async def run():
+        before = await handler.create_signed_url("record", "org", "user")
+        config_service.set_endpoint("https://connector.example.com")
+        after = await handler.create_signed_url("record", "org", "user")
+        return before, after
+
+    before, after = asyncio.run(run())
+
+    assert before.startswith("http://connector:8088/")
+    assert after.startswith("https://connector.example.com/")
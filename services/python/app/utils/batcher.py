@@ -0,0 +1,120 @@
+"""Coalesce concurrent single-item calls into batched calls"""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Collects items submitted by concurrent callers and hands them to
+    process_batch together. A batch goes out once max_batch_size items are
+    pending or the first of them has waited max_wait_seconds.
+
+    process_batch returns one result per item, in order. An exception in that
+    list is raised to that item's caller only; if process_batch itself raises,
+    every caller in the batch gets the exception.
+
+    Batches run one at a time unless overlap_batches is set, in which case
+    collection continues while earlier batches are still in flight.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], Awaitable[Sequence[R | BaseException]]],
+        max_batch_size: int,
+        max_wait_seconds: float,
+        overlap_batches: bool = False,
+    ) -> None:
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._overlap_batches = overlap_batches
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for the result of the batch holding it"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._collector is None
+            or self._collector.done()
+            or self._collector.get_loop() is not loop
+        ):
+            self._queue = asyncio.Queue()
+            self._collector = asyncio.create_task(self._collect(self._queue))
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop collecting; callers still waiting get CancelledError"""
+        tasks = [*self._in_flight]
+        if self._collector is not None:
+            tasks.append(self._collector)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._collector = None
+        self._queue = None
+
+    async def _collect(self, queue: asyncio.Queue) -> None:
+        """Group queued items into batches and run each one"""
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self._max_wait_seconds
+                while len(batch) < self._max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                if self._overlap_batches:
+                    task = asyncio.create_task(self._run(batch))
+                    self._in_flight.add(task)
+                    task.add_done_callback(self._in_flight.discard)
+                else:
+                    await self._run(batch)
+                batch = []
+        finally:
+            # Nothing will process what is still queued once collection stops
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _run(self, batch: List[tuple]) -> None:
+        """Process one batch and resolve the future of every item in it"""
+        try:
+            try:
+                results = await self._process_batch([item for item, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            if len(results) != len(batch):
+                error = RuntimeError(
+                    f"Batch returned {len(results)} results for {len(batch)} items"
+                )
+                results = [error] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Cancelled mid-batch: do not leave callers waiting forever
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
@@ -1,13 +1,18 @@
-import json
-from dataclasses import dataclass
+import re
 from typing import Any, Dict, List
 
+import orjson
 
-@dataclass
-class ChatDocCitation:
-    content: str
-    metadata: Dict[str, Any]
-    chunkindex: int
+from app.utils.logger import create_logger
+
+logger = create_logger("query_service")
+
+# Field names an LLM may use for the chunk indexes it cited
+CHUNK_INDEX_KEYS = ("chunkIndexes", "chunkindex", "chunk_indexes")
+# Inline citation references such as [1] or [1, 2] in an answer
+CITATION_PATTERN = re.compile(r"\[([0-9,\s]+)\]")
+# Integer tokens in a chunk index list that arrived as a string
+INTEGER_PATTERN = re.compile(r"\d+")
 
 
 def fix_json_string(json_str) -> str:
@@ -57,6 +62,115 @@ def fix_json_string(json_str) -> str:
     return result
 
 
+def find_chunk_indexes(data) -> List[int] | None:
+    """
+    Depth-first search of nested dicts and lists for the first chunk index
+    field, walked with an explicit stack instead of recursion.
+    """
+    # Responses almost always carry the field at the top level
+    if isinstance(data, dict):
+        for key in CHUNK_INDEX_KEYS:
+            if key in data:
+                logger.debug("Found %s in data: %s", key, data[key])
+                return data[key]
+
+    stack = [data]
+    visited = set()
+    while stack:
+        node = stack.pop()
+
+        # Avoid circular references
+        node_id = id(node)
+        if node_id in visited:
+            continue
+        visited.add(node_id)
+
+        if isinstance(node, dict):
+            # Check for various possible key names
+            for key in CHUNK_INDEX_KEYS:
+                if key in node:
+                    logger.debug("Found %s in data: %s", key, node[key])
+                    return node[key]
+
+            # Search nested values, first value on top of the stack
+            stack.extend(reversed(node.values()))
+
+        # Handle nested array of objects
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+    return None
+
+
+def _document_index(entry, docs_len: int) -> int | None:
+    """
+    0-based document index cited by a [citation, chunk] pair, or None when
+    the entry is empty, malformed or out of range
+    """
+    if not entry:
+        return None
+    try:
+        _, chunk_index = entry
+        # Strip any quotes or spaces
+        if isinstance(chunk_index, str):
+            chunk_index = chunk_index.strip().strip("\"'")
+
+        # Convert to int and adjust for 0-based indexing
+        index = int(chunk_index) - 1
+    except (ValueError, TypeError):
+        return None
+    return index if 0 <= index < docs_len else None
+
+
+def _cited_document_indexes(response_data, documents: List[Dict[str, Any]]) -> List[int]:
+    """
+    0-based indexes of the documents cited by a parsed LLM response, in the
+    order they were cited (1-based indexing from template)
+    """
+    # Nothing can be cited without documents
+    if not documents:
+        return []
+
+    # Try to find chunk indexes in the response data
+    chunk_indexes = find_chunk_indexes(response_data)
+    logger.debug("Chunk indexes: %s", chunk_indexes)
+
+    # Fallback: If we still haven't found any indexes and have "answer" field,
+    # try parsing the answer text to find numeric references
+    if (
+        chunk_indexes is None
+        and isinstance(response_data, dict)
+        and "answer" in response_data
+    ):
+        answer_text = response_data["answer"]
+        # Look for citation patterns like [1] or [1, 2] in the answer
+        citation_matches = CITATION_PATTERN.findall(answer_text)
+        if citation_matches:
+            # Use the first match as our chunk indexes
+            chunk_indexes = citation_matches[0]
+
+    if chunk_indexes is None:
+        return []
+
+    # Convert to list if it's not already
+    if isinstance(chunk_indexes, str):
+        # Read every integer in one pass, whatever the brackets, quotes
+        # or separators, as consecutive [citation, chunk] pairs
+        numbers = INTEGER_PATTERN.findall(chunk_indexes)
+        chunk_indexes = list(zip(numbers[::2], numbers[1::2]))
+    elif not isinstance(chunk_indexes, list):
+        chunk_indexes = [chunk_indexes]
+
+    logger.debug("Chunk indexes 2: %s", chunk_indexes)
+    # Validate each [citation, chunk] pair in a single pass
+    docs_len = len(documents)
+    return [
+        doc_index
+        for entry in chunk_indexes
+        if (doc_index := _document_index(entry, docs_len)) is not None
+    ]
+
+
 def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Process the LLM response and extract citations from relevant documents.
@@ -68,202 +182,65 @@ def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str
     Returns:
         Dict containing processed response with citations
     """
-    try:
-        # Handle the case where llm_response might be an object with a content field
-        if hasattr(llm_response, "content"):
-            response_content = llm_response.content
-        elif isinstance(llm_response, dict) and "content" in llm_response:
-            response_content = llm_response["content"]
-        else:
-            response_content = llm_response
-
-        # Parse the LLM response if it's a string
-        if isinstance(response_content, str):
-            try:
-                # Clean the JSON string before parsing
-                cleaned_content = response_content.strip()
-                # Handle nested JSON (sometimes response is JSON within JSON)
-                if cleaned_content.startswith('"') and cleaned_content.endswith('"'):
-                    # Remove outer quotes and unescape inner quotes
-                    cleaned_content = cleaned_content[1:-1].replace('\\"', '"')
-
-                # Handle escaped newlines and other special characters
+    # Handle the case where llm_response might be an object with a content field
+    if hasattr(llm_response, "content"):
+        response_content = llm_response.content
+    elif isinstance(llm_response, dict) and "content" in llm_response:
+        response_content = llm_response["content"]
+    else:
+        response_content = llm_response
+
+    # Parse the LLM response if it's a string
+    if isinstance(response_content, str):
+        try:
+            # Clean the JSON string before parsing
+            cleaned_content = response_content.strip()
+            # Handle nested JSON (sometimes response is JSON within JSON)
+            if cleaned_content.startswith('"') and cleaned_content.endswith('"'):
+                # Remove outer quotes and unescape inner quotes
+                cleaned_content = cleaned_content[1:-1].replace('\\"', '"')
+
+                # Handle escaped newlines and other special characters; a
+                # plain JSON response keeps its standard escapes for the parser
                 cleaned_content = cleaned_content.replace("\\n", "\n").replace(
                     "\\t", "\t"
                 )
 
-                # Apply our fix for control characters in JSON string values
-                cleaned_content = fix_json_string(cleaned_content)
-
-                # Try to parse the cleaned content
-                response_data = json.loads(cleaned_content)
-            except json.JSONDecodeError as e:
-                # If regular parsing fails, try a more lenient approach
-                try:
-                    # Sometimes response might be malformed with extra characters
-                    # Find the first { and last } to extract potential JSON
-                    start_idx = cleaned_content.find("{")
-                    end_idx = cleaned_content.rfind("}")
-
-                    if start_idx >= 0 and end_idx > start_idx:
-                        potential_json = cleaned_content[start_idx : end_idx + 1]
-                        # Apply our fix again on the extracted JSON
-                        potential_json = fix_json_string(potential_json)
-                        response_data = json.loads(potential_json)
-                    else:
-                        return {
-                            "error": f"Failed to parse LLM response: {str(e)}",
-                            "raw_response": response_content,
-                        }
-                except Exception as nested_e:
+            # Apply our fix for control characters in JSON string values
+            cleaned_content = fix_json_string(cleaned_content)
+
+            # Try to parse the cleaned content
+            response_data = orjson.loads(cleaned_content)
+        except orjson.JSONDecodeError as e:
+            # If regular parsing fails, try a more lenient approach
+            try:
+                # Sometimes response might be malformed with extra characters
+                # Find the first { and last } to extract potential JSON
+                start_idx = cleaned_content.find("{")
+                end_idx = cleaned_content.rfind("}")
+
+                if start_idx >= 0 and end_idx > start_idx:
+                    potential_json = cleaned_content[start_idx : end_idx + 1]
+                    # Apply our fix again on the extracted JSON
+                    potential_json = fix_json_string(potential_json)
+                    response_data = orjson.loads(potential_json)
+                else:
                     return {
-                        "error": f"Failed to parse LLM response: {str(e)}, Nested error: {str(nested_e)}",
+                        "error": f"Failed to parse LLM response: {str(e)}",
                         "raw_response": response_content,
                     }
-        else:
-            response_data = response_content
-
-        # Extract document indexes (1-based indexing from template)
-        doc_indexes = []
-
-        # Handle different formats of chunkIndexes
-        chunk_indexes = None
-
-        # Function to recursively search for chunk indexes in nested dictionaries
-        def find_chunk_indexes(data, visited=None) -> List[int]:
-            if visited is None:
-                visited = set()
-
-            # Avoid circular references
-            data_id = id(data)
-            if data_id in visited:
-                return None
-            visited.add(data_id)
-
-            if isinstance(data, dict):
-                # Check for various possible key names
-                for key in [
-                    "chunkIndexes",
-                    "chunkindex",
-                    "chunk_indexes",
-                    "chunkIndexes",
-                ]:
-                    if key in data:
-                        print(f"Found {key} in data: {data[key]}")
-                        return data[key]
-
-                # Search nested dictionaries
-                for value in data.values():
-                    result = find_chunk_indexes(value, visited)
-                    if result is not None:
-                        return result
-
-            # Handle nested array of objects
-            elif isinstance(data, list):
-                for item in data:
-                    result = find_chunk_indexes(item, visited)
-                    if result is not None:
-                        return result
-
-            return None
-
-        # Try to find chunk indexes in the response data
-        chunk_indexes = find_chunk_indexes(response_data)
-        print(f"Chunk indexes: {chunk_indexes}")
-
-        # Fallback: If we still haven't found any indexes and have "answer" field,
-        # try parsing the answer text to find numeric references
-        if (
-            chunk_indexes is None
-            and isinstance(response_data, dict)
-            and "answer" in response_data
-        ):
-            answer_text = response_data["answer"]
-            # Look for citation patterns like [1] or [1, 2] in the answer
-            import re
-
-            citation_matches = re.findall(r"\[([0-9,\s]+)\]", answer_text)
-            if citation_matches:
-                # Use the first match as our chunk indexes
-                chunk_indexes = citation_matches[0]
-
-        # If we found chunk indexes, process them
-        if chunk_indexes is not None:
-            # Convert to list if it's not already
-            if not isinstance(chunk_indexes, list):
-                if isinstance(chunk_indexes, str):
-                    # Try to handle comma-separated strings or space-separated
-                    chunk_indexes = (
-                        chunk_indexes.replace("[", "")
-                        .replace("]", "")
-                        .replace('"', "")
-                        .replace("'", "")
-                    )
-                    # Split by comma or space
-                    if "," in chunk_indexes:
-                        chunk_indexes = [r.strip() for r in chunk_indexes.split(",")]
-                    else:
-                        chunk_indexes = [
-                            r.strip() for r in chunk_indexes.split() if r.strip()
-                        ]
-                else:
-                    chunk_indexes = [chunk_indexes]
-
-            # Filter out empty values
-            chunk_indexes = [idx for idx in chunk_indexes if idx]
-            print(f"Chunk indexes 2: {chunk_indexes}")
-            # Process each index
-            for [idx, chunk_index] in chunk_indexes:
-                try:
-                    # Strip any quotes or spaces
-                    if isinstance(chunk_index, str):
-                        chunk_index = chunk_index.strip().strip("\"'")
-
-                    # Convert to int and adjust for 0-based indexing
-                    chunk_index_value = int(chunk_index) - 1
-                    if 0 <= chunk_index_value < len(documents):
-                        doc_indexes.append(chunk_index_value)
-                except (ValueError, TypeError):
-                    continue
-
-        # Get citations from referenced documents
-        citations = []
-        print("doc_indexes", doc_indexes)
-        index = 1
-        for idx in doc_indexes:
-            try:
-                doc = documents[idx]
-                # Safely access content and metadata
-                content = doc.get("content", "")
-                metadata = doc.get("metadata", {})
-
-                citation = ChatDocCitation(
-                    content=content, metadata=metadata, chunkindex=index
-                )
-                citations.append(citation)
-                index += 1
-            except (IndexError, KeyError):
-                continue
-
-        # Create a result object (either use existing or create new)
-        if isinstance(response_data, dict):
-            result = response_data.copy()
-        else:
-            result = {"answer": str(response_data)}
-
-        # Add citations to response
-        result["citations"] = [
-            {
-                "content": cit.content,
-                "chunkIndex": cit.chunkindex,
-                "metadata": cit.metadata,
-                "citationType": "vectordb|document",
-            }
-            for cit in citations
-        ]
-
-        return result
-
+            except Exception as nested_e:
+                return {
+                    "error": f"Failed to parse LLM response: {str(e)}, Nested error: {str(nested_e)}",
+                    "raw_response": response_content,
+                }
+    else:
+        response_data = response_content
+
+    # Only the interpretation of the model's output is guarded; anything else
+    # failing here is a bug and propagates to the caller
+    try:
+        doc_indexes = _cited_document_indexes(response_data, documents)
     except Exception as e:
         import traceback
 
@@ -272,3 +249,44 @@ def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str
             "traceback": traceback.format_exc(),
             "raw_response": llm_response,
         }
+
+    logger.debug("doc_indexes: %s", doc_indexes)
+
+    # Create a result object (either use existing or create new). A dict
+    # parsed above belongs to this call and is extended in place; one
+    # handed in by the caller is copied so it is left untouched
+    if isinstance(response_data, dict):
+        result = (
+            response_data
+            if isinstance(response_content, str)
+            else response_data.copy()
+        )
+    else:
+        result = {"answer": str(response_data)}
+
+    # Add citations from the referenced documents, numbered from 1
+    result["citations"] = [
+        {
+            "content": documents[idx].get("content", ""),
+            "chunkIndex": index,
+            "metadata": documents[idx].get("metadata", {}),
+            "citationType": "vectordb|document",
+        }
+        for index, idx in enumerate(doc_indexes, start=1)
+    ]
+
+    return result
+
+
+def process_citations_bytes(
+    llm_response, documents: List[Dict[str, Any]]
+) -> bytes:
+    """
+    Same as process_citations, but returns the result already serialized as
+    JSON bytes for callers that send it straight over HTTP.
+    """
+    return orjson.dumps(
+        process_citations(llm_response, documents),
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS,
+    )
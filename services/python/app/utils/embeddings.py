@@ -1,3 +1,7 @@
+import os
+
+import torch
+from langchain_community.embeddings import FastEmbedEmbeddings
 from langchain_huggingface import HuggingFaceEmbeddings
 
 from app.config.utils.named_constants.ai_models_named_constants import (
@@ -8,11 +12,16 @@ from app.config.utils.named_constants.ai_models_named_constants import (
 async def get_default_embedding_model():
     try:
         model_name = DEFAULT_EMBEDDING_MODEL
-        encode_kwargs = {'normalize_embeddings': True}
-        return HuggingFaceEmbeddings(
-            model_name=model_name,
-            model_kwargs={"device": "cpu"},
-            encode_kwargs=encode_kwargs,
-        )
+        # Run the default model on the GPU when one is available
+        if torch.cuda.is_available():
+            encode_kwargs = {'normalize_embeddings': True}
+            return HuggingFaceEmbeddings(
+                model_name=model_name,
+                model_kwargs={"device": "cuda"},
+                encode_kwargs=encode_kwargs,
+            )
+        # On CPU, the ONNX Runtime export of the same weights is much faster
+        # than PyTorch eager and returns normalized embeddings as well
+        return FastEmbedEmbeddings(model_name=model_name, threads=os.cpu_count())
     except Exception as e:
         raise e
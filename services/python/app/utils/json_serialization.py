@@ -0,0 +1,16 @@
+import orjson
+
+# Keep accepting non-str dict keys like json.dumps did, plus numpy values
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_dumps(obj) -> str:
+    """Serialize to a compact JSON string with orjson
+
+    python-arango joins serialized documents as text (e.g. for bulk imports),
+    so the bytes orjson produces are decoded back to str.
+    """
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS).decode("utf-8")
+
+
+orjson_loads = orjson.loads
@@ -1,3 +1,6 @@
+import orjson
+from cachetools import LRUCache
+
 from app.config.configuration_service import ConfigurationService, config_node_constants
 from app.config.utils.named_constants.ai_models_named_constants import (
     AzureOpenAILLM,
@@ -14,6 +17,85 @@ from app.core.llm_service import (
     OpenAILLMConfig,
 )
 
+# Built LLM clients keyed by their provider and raw configuration, so repeated
+# lookups reuse one warm client (and its HTTP connection pool) instead of
+# rebuilding it. Rotated credentials change the key and build a new client
+_llm_cache = LRUCache(maxsize=8)
+
+
+def _azure_openai_config(configuration: dict) -> AzureLLMConfig:
+    return AzureLLMConfig(
+        model=configuration["model"],
+        temperature=0.2,
+        api_key=configuration["apiKey"],
+        azure_endpoint=configuration["endpoint"],
+        azure_api_version=AzureOpenAILLM.AZURE_OPENAI_VERSION.value,
+        azure_deployment=configuration["deploymentName"],
+    )
+
+
+def _openai_config(configuration: dict) -> OpenAILLMConfig:
+    return OpenAILLMConfig(
+        model=configuration["model"],
+        temperature=0.2,
+        api_key=configuration["apiKey"],
+    )
+
+
+def _gemini_config(configuration: dict) -> GeminiLLMConfig:
+    return GeminiLLMConfig(
+        model=configuration["model"],
+        temperature=0.2,
+        api_key=configuration["apiKey"],
+    )
+
+
+def _anthropic_config(configuration: dict) -> AnthropicLLMConfig:
+    return AnthropicLLMConfig(
+        model=configuration["model"],
+        temperature=0.2,
+        api_key=configuration["apiKey"],
+    )
+
+
+def _aws_bedrock_config(configuration: dict) -> AwsBedrockLLMConfig:
+    return AwsBedrockLLMConfig(
+        model=configuration["model"],
+        temperature=0.2,
+        region=configuration["region"],
+        access_key=configuration["aws_access_key_id"],
+        access_secret=configuration["aws_access_secret_key"],
+        api_key=configuration["aws_access_secret_key"],
+    )
+
+
+def _ollama_config(configuration: dict) -> OllamaConfig:
+    return OllamaConfig(
+        model=configuration["model"],
+        temperature=0.2,
+        api_key=configuration["apiKey"],
+    )
+
+
+def _openai_compatible_config(configuration: dict) -> OpenAICompatibleLLMConfig:
+    return OpenAICompatibleLLMConfig(
+        model=configuration["model"],
+        temperature=0.2,
+        api_key=configuration["apiKey"],
+        endpoint=configuration["endpoint"],
+    )
+
+
+LLM_CONFIG_BUILDERS = {
+    LLMProvider.AZURE_OPENAI.value: _azure_openai_config,
+    LLMProvider.OPENAI.value: _openai_config,
+    LLMProvider.GEMINI.value: _gemini_config,
+    LLMProvider.ANTHROPIC.value: _anthropic_config,
+    LLMProvider.AWS_BEDROCK.value: _aws_bedrock_config,
+    LLMProvider.OLLAMA.value: _ollama_config,
+    LLMProvider.OPENAI_COMPATIBLE.value: _openai_compatible_config,
+}
+
 
 async def get_llm(logger, config_service: ConfigurationService, llm_configs = None):
     if not llm_configs:
@@ -21,64 +103,20 @@ async def get_llm(logger, config_service: ConfigurationService, llm_configs = No
         llm_configs = ai_models["llm"]
     # For now, we'll use the first available provider that matches our supported types
     # We will add logic to choose a specific provider based on our needs
-    llm_config = None
-
-    for config in llm_configs:
-        provider = config["provider"]
-        if provider == LLMProvider.AZURE_OPENAI.value:
-            llm_config = AzureLLMConfig(
-                model=config["configuration"]["model"],
-                temperature=0.2,
-                api_key=config["configuration"]["apiKey"],
-                azure_endpoint=config["configuration"]["endpoint"],
-                azure_api_version=AzureOpenAILLM.AZURE_OPENAI_VERSION.value,
-                azure_deployment=config["configuration"]["deploymentName"],
-            )
-            break
-        elif provider == LLMProvider.OPENAI.value:
-            llm_config = OpenAILLMConfig(
-                model=config["configuration"]["model"],
-                temperature=0.2,
-                api_key=config["configuration"]["apiKey"],
-            )
-            break
-        elif provider == LLMProvider.GEMINI.value:
-            llm_config = GeminiLLMConfig(
-                model=config["configuration"]["model"],
-                temperature=0.2,
-                api_key=config["configuration"]["apiKey"],
-            )
-        elif provider == LLMProvider.ANTHROPIC.value:
-            llm_config = AnthropicLLMConfig(
-                model=config["configuration"]["model"],
-                temperature=0.2,
-                api_key=config["configuration"]["apiKey"],
-            )
-        elif provider == LLMProvider.AWS_BEDROCK.value:
-            llm_config = AwsBedrockLLMConfig(
-                model=config["configuration"]["model"],
-                temperature=0.2,
-                region=config["configuration"]["region"],
-                access_key=config["configuration"]["aws_access_key_id"],
-                access_secret=config["configuration"]["aws_access_secret_key"],
-                api_key=config["configuration"]["aws_access_secret_key"],
-            )
-        elif provider == LLMProvider.OLLAMA.value:
-            llm_config = OllamaConfig(
-                model=config['configuration']['model'],
-                temperature=0.2,
-                api_key=config['configuration']['apiKey'],
-            )
-        elif provider == LLMProvider.OPENAI_COMPATIBLE.value:
-            llm_config = OpenAICompatibleLLMConfig(
-                model=config['configuration']['model'],
-                temperature=0.2,
-                api_key=config['configuration']['apiKey'],
-                endpoint=config['configuration']['endpoint'],
-            )
-    if not llm_config:
-        raise ValueError("No supported LLM provider found in configuration")
+    selected = next(
+        (config for config in llm_configs if config["provider"] in LLM_CONFIG_BUILDERS),
+        None,
+    )
 
-    llm = LLMFactory.create_llm(logger, llm_config)
+    if not selected:
+        raise ValueError("No supported LLM provider found in configuration")
 
+    # A cache hit needs neither the typed config nor a new client
+    provider, configuration = selected["provider"], selected["configuration"]
+    cache_key = (provider, orjson.dumps(configuration, option=orjson.OPT_SORT_KEYS))
+    llm = _llm_cache.get(cache_key)
+    if llm is None:
+        llm_config = LLM_CONFIG_BUILDERS[provider](configuration)
+        llm = LLMFactory.create_llm(logger, llm_config)
+        _llm_cache[cache_key] = llm
     return llm
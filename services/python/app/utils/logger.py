@@ -1,5 +1,8 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 
 # Ensure log directory exists
@@ -48,7 +51,16 @@ def create_logger(service_name):
             )
         )
 
+        # Write to the file from a background thread so logging calls made on
+        # the event loop only enqueue the record
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
         # Add handlers
-        logger.addHandler(file_handler)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
@@ -1,10 +1,18 @@
+from cachetools import LRUCache
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
 
+# Chain pairs keyed by id(llm); the llm is stored alongside so a recycled id
+# is never mistaken for a cached client
+_transformation_chains = LRUCache(maxsize=8)
+
 
 def setup_query_transformation(llm):
     """Setup query rewriting and expansion with async support"""
+    cached = _transformation_chains.get(id(llm))
+    if cached is not None and cached[0] is llm:
+        return cached[1]
 
     # Query rewriting prompt
     query_rewrite_prompt = ChatPromptTemplate.from_template(
@@ -41,4 +49,5 @@ def setup_query_transformation(llm):
         | StrOutputParser()
     )
 
+    _transformation_chains[id(llm)] = (llm, (rewrite_chain, expansion_chain))
     return rewrite_chain, expansion_chain